@@ -1,3 +1,4 @@
+import asyncio
 import typing
 import uuid
 from contextlib import asynccontextmanager
@@ -12,76 +13,145 @@ from starlette import status
 from starlette.exceptions import HTTPException
 from starlette.responses import JSONResponse
 
-from backend.api.routers import about_router, healthcheck_router, person_router
-from backend.database.postgres.session import DbContext, init_db
+from backend.api import config as api_config
+from backend.api.middleware import (
+    AccessLogMiddleware,
+    AdmissionControlMiddleware,
+    Limiter,
+    LoopLagMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    QueryStatsMiddleware,
+    ReadYourWritesMiddleware,
+    loop_lag,
+)
+from backend.api.middleware.admission import split_connections
+from backend.api.routers import (
+    about_router,
+    healthcheck_router,
+    metrics_router,
+    person_router,
+)
+from backend.api.routers.healthcheck import readiness
+from backend.api.routers.person import config as person_config
+from backend.api.routers.person import group_commit
+from backend.database.postgres import config as postgres_config
+from backend.database.postgres import pool_plan
+from backend.database.postgres.session import (
+    dispose_engine,
+    init_db,
+    init_engine,
+)
 from backend.loguru_logger.logger_setup import log_config, logger_setup
 
 
 @asynccontextmanager
 async def lifespan(func_app: FastAPI) -> typing.AsyncContextManager[None]:
     logger_setup()
-    init_db()
-    db_context = DbContext()
+    if api_config.LOOP_MONITOR:
+        loop_lag.monitor.start()
+    if postgres_config.POSTGRES_BOOTSTRAP_ON_STARTUP:
+        # Off the event loop, DDL runs once per deployment otherwise
+        await asyncio.to_thread(init_db)
+    init_engine()
+    readiness.probe.start()
     yield
-    if db_context.engine is not None:
-        await db_context.close()
+    await readiness.probe.stop()
+    # Rows still queued for a group commit are written before closing
+    await group_commit.writer.close()
+    await dispose_engine()
+    await loop_lag.monitor.stop()
 
 
 app = FastAPI(lifespan=lifespan, root_path="/api")
 
 app.include_router(router=about_router)
 app.include_router(router=healthcheck_router)
+app.include_router(router=metrics_router)
 app.include_router(router=person_router)
 
+# Admission control of the person router, see its config
+pool_reads, pool_writes, pool_streams = split_connections(
+    pool_plan.worker_plan().per_worker,
+    streams=person_config.PERSON_STREAM_CONCURRENCY,
+)
+person_reads = Limiter(
+    "person_reads",
+    limit=(
+        pool_reads
+        if person_config.PERSON_READ_CONCURRENCY is None
+        else person_config.PERSON_READ_CONCURRENCY
+    ),
+    queue_size=person_config.PERSON_READ_QUEUE,
+    queue_timeout=person_config.PERSON_QUEUE_TIMEOUT_MS / 1000,
+)
+person_writes = Limiter(
+    "person_writes",
+    limit=(
+        pool_writes
+        if person_config.PERSON_WRITE_CONCURRENCY is None
+        else person_config.PERSON_WRITE_CONCURRENCY
+    ),
+    queue_size=person_config.PERSON_WRITE_QUEUE,
+    queue_timeout=person_config.PERSON_QUEUE_TIMEOUT_MS / 1000,
+)
+person_streams = Limiter(
+    "person_streams",
+    limit=pool_streams,
+    queue_size=person_config.PERSON_STREAM_QUEUE,
+    queue_timeout=person_config.PERSON_QUEUE_TIMEOUT_MS / 1000,
+)
+person_routes = {
+    ("GET", f"{person_router.prefix}/export"): person_streams,
+    ("POST", f"{person_router.prefix}/import"): person_streams,
+}
+if person_config.PERSON_GROUP_COMMIT:
+    person_routes["POST", f"{person_router.prefix}/"] = None
+logger.info(
+    f"Person admission limits: reads={person_reads.limit}"
+    f" writes={person_writes.limit} streams={person_streams.limit}"
+)
+# Innermost: shed requests still get CORS headers, metrics and access log
+app.add_middleware(
+    AdmissionControlMiddleware,
+    path_prefix=person_router.prefix,
+    reads=person_reads,
+    writes=person_writes,
+    retry_after=person_config.PERSON_RETRY_AFTER_SECONDS,
+    routes=person_routes,
+)
+
 origins = ["*"]
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["X-Requested-With", "X-Request-ID"],
-    expose_headers=["X-Request-ID"],
+    allow_headers=["X-Requested-With", "X-Request-ID", "X-Last-Write"],
+    expose_headers=[
+        "X-Request-ID",
+        "Server-Timing",
+        "X-Last-Write",
+        "Retry-After",
+    ],
 )
 
 
-@app.middleware("http")
-async def log_user_metadata(
-    request: Request, call_next: typing.Any
-) -> typing.Any:
-    client_ip: str = request.client.host
-    client_port: int = request.client.port
-    logger.info(f"{request.method} {request.url.path}")
-    logger.debug(f"IP={client_ip}, Port={client_port}")
-    return await call_next(request)
-
-
-@app.middleware("http")
-async def exception_logger(
-    request: Request, call_next: typing.Any
-) -> typing.Any:
-    response = await call_next(request)
-    log_msg: str = (
-        f"{request.method} {request.url.path} {response.status_code}"
-    )
-    metadata_str = log_msg
-    logger.opt(lazy=True).info(log_msg)
-    if response.status_code < 400:
-        logger.opt(lazy=True).debug(metadata_str)
-    elif response.status_code == 422:
-        logger.opt(lazy=True).log(
-            log_config.request_validation_exception, metadata_str
-        )
-    elif 400 <= response.status_code < 500:
-        logger.opt(lazy=True).log(log_config.http_exception, metadata_str)
-    elif response.status_code == 501:
-        logger.opt(lazy=True).exception(
-            log_config.unexpected_exception, metadata_str
-        )
-    else:
-        logger.opt(lazy=True).exception(
-            log_config.handled_internal_exception, metadata_str
-        )
-    return response
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(AccessLogMiddleware)
+# Inside CorrelationIdMiddleware, blocking reports carry the request id
+app.add_middleware(LoopLagMiddleware, monitor=loop_lag.monitor)
+# Inside CorrelationIdMiddleware, profiles are named by the request id
+app.add_middleware(
+    ProfilingMiddleware,
+    output_dir=api_config.PROFILING_DIR,
+    token=api_config.PROFILING_TOKEN,
+    sample_rate=api_config.PROFILING_SAMPLE_RATE,
+    interval=api_config.PROFILING_INTERVAL_MS / 1000,
+    fmt=api_config.PROFILING_FORMAT,
+)
 
 
 def init_listeners(func_app: FastAPI) -> FastAPI:
@@ -0,0 +1,47 @@
+import os
+
+from loguru import logger
+
+"""
+This module configures application wide settings,
+using environment variables if available,
+or defaults to predefined values for local development.
+"""
+
+# Per request profiling (ProfilingMiddleware), off by default.
+# A request is profiled when it carries "X-Profile: <PROFILING_TOKEN>"
+# or is drawn with probability PROFILING_SAMPLE_RATE. Profiles are
+# written to PROFILING_DIR/<correlation id>.<format>.
+PROFILING_TOKEN: str = os.getenv("PROFILING_TOKEN") or ""
+PROFILING_SAMPLE_RATE: float = float(os.getenv("PROFILING_SAMPLE_RATE") or 0)
+PROFILING_INTERVAL_MS: float = float(os.getenv("PROFILING_INTERVAL_MS") or 1)
+PROFILING_DIR: str = os.getenv("PROFILING_DIR") or "logs/profiles"
+# "speedscope" (https://www.speedscope.app) or "collapsed" (flamegraph.pl)
+PROFILING_FORMAT: str = (os.getenv("PROFILING_FORMAT") or "speedscope").lower()
+
+# The token itself stays out of the logs
+logger.info(f"PROFILING_TOKEN is set: {bool(PROFILING_TOKEN)}")
+logger.info(f"{PROFILING_SAMPLE_RATE=}")
+logger.info(f"{PROFILING_INTERVAL_MS=}")
+logger.info(f"{PROFILING_DIR=}")
+logger.info(f"{PROFILING_FORMAT=}")
+
+# Event loop lag monitor (LoopMonitor), started in the app lifespan.
+# Lag is sampled every LOOP_MONITOR_INTERVAL_MS, a loop blocked for
+# longer than LOOP_MONITOR_THRESHOLD_MS gets the stack of the blocking
+# code logged.
+LOOP_MONITOR: bool = (os.getenv("LOOP_MONITOR") or "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+LOOP_MONITOR_INTERVAL_MS: float = float(
+    os.getenv("LOOP_MONITOR_INTERVAL_MS") or 10
+)
+LOOP_MONITOR_THRESHOLD_MS: float = float(
+    os.getenv("LOOP_MONITOR_THRESHOLD_MS") or 100
+)
+
+logger.info(f"{LOOP_MONITOR=}")
+logger.info(f"{LOOP_MONITOR_INTERVAL_MS=}")
+logger.info(f"{LOOP_MONITOR_THRESHOLD_MS=}")
@@ -0,0 +1,41 @@
+import os
+import shutil
+
+# Set before the first prometheus_client import: the value class
+# (mmap files in multiprocess mode or in-process values) is picked once,
+# at that import, for this master and every worker forked from it
+PROMETHEUS_MULTIPROC_DIR: str = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc"
+)
+
+from prometheus_client import multiprocess  # noqa: E402
+
+# Module level names are read as gunicorn settings, "config" is one
+from backend.database.postgres import config as postgres_config  # noqa: E402
+from backend.database.postgres import pool_plan  # noqa: E402
+
+"""
+Gunicorn settings, loaded by the master before workers are forked:
+    gunicorn app:app --config gunicorn_conf.py
+
+Prometheus multiprocess mode: workers inherit PROMETHEUS_MULTIPROC_DIR
+and keep their metrics in mmap files there, so /metrics served by any
+worker reports the sum over all of them.
+
+Connection plan: the master sizes the workers' pools to fit the
+database (see pool_plan.py) and refuses to start when they do not.
+"""
+
+
+def on_starting(server) -> None:
+    # Values of a previous run must not be summed up with the new ones
+    shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+    # Workers are forked from here and inherit the applied plan
+    capacity = pool_plan.server_capacity(postgres_config.POSTGRES_SYNC_URL)
+    pool_plan.apply(pool_plan.plan_deployment(server.cfg.workers, capacity))
+
+
+def child_exit(server, worker) -> None:
+    # Drops live gauges (in-progress requests) of the dead worker
+    multiprocess.mark_process_dead(worker.pid)
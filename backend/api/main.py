@@ -1,3 +1,5 @@
+import os
+
 import uvicorn
 from loguru import logger
 
@@ -8,6 +10,8 @@ if __name__ == "__main__":
         (including gunicorn) using something like:
     from manage import app then the value is 'app' or 'manage.app'
     """
+    # Single local process, it creates the schema itself
+    os.environ.setdefault("POSTGRES_BOOTSTRAP_ON_STARTUP", "true")
     host: str = "0.0.0.0"
     port: int = 8765
     logger.info("App is loading!")
@@ -0,0 +1,19 @@
+from .access_log import AccessLogMiddleware
+from .admission import AdmissionControlMiddleware, Limiter
+from .loop_lag import LoopLagMiddleware, LoopMonitor
+from .metrics import MetricsMiddleware
+from .profiling import ProfilingMiddleware
+from .query_stats import QueryStatsMiddleware
+from .read_your_writes import ReadYourWritesMiddleware
+
+__all__ = [
+    AccessLogMiddleware,
+    AdmissionControlMiddleware,
+    Limiter,
+    LoopLagMiddleware,
+    LoopMonitor,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    QueryStatsMiddleware,
+    ReadYourWritesMiddleware,
+]
@@ -0,0 +1,82 @@
+import time
+import typing
+
+from asgi_correlation_id import correlation_id
+from loguru import logger
+from starlette import status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.loguru_logger import log_config
+
+"""
+Pure ASGI access log.
+Unlike @app.middleware("http") (BaseHTTPMiddleware) it does not wrap
+request and response in extra tasks and memory streams,
+it only watches the messages sent by the application.
+"""
+
+
+def access_log_level(status_code: int) -> str:
+    """Loguru level of the access record of a response status."""
+    if status_code < 400:
+        return "INFO"
+    if status_code == status.HTTP_422_UNPROCESSABLE_ENTITY:
+        return log_config.request_validation_exception
+    if status_code < 500:
+        return log_config.http_exception
+    if status_code == status.HTTP_501_NOT_IMPLEMENTED:
+        return log_config.unexpected_exception
+    return log_config.handled_internal_exception
+
+
+class AccessLogMiddleware:
+    """
+    Emits one access record per HTTP request:
+    method, path, status, client address, correlation id and duration.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            # Answered by the generic exception handler outside of this
+            # middleware, with 501
+            status_code = status.HTTP_501_NOT_IMPLEMENTED
+            raise
+        finally:
+            self.log(scope, status_code, time.perf_counter() - started)
+
+    @staticmethod
+    def log(scope: Scope, status_code: int, duration: float) -> None:
+        client: typing.Any = scope.get("client")
+        client = f"{client[0]}:{client[1]}" if client else "-"
+        method = scope["method"]
+        path = scope.get("root_path", "") + scope["path"]
+        duration_ms = round(duration * 1000, 3)
+        logger.bind(
+            method=method,
+            path=path,
+            status_code=status_code,
+            client=client,
+            request_id=correlation_id.get(),
+            duration_ms=duration_ms,
+        ).log(
+            access_log_level(status_code),
+            f"{method} {path} {status_code} {client} {duration_ms}ms",
+        )
@@ -0,0 +1,215 @@
+import asyncio
+import collections
+import json
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from backend.api.middleware.metrics import LATENCY_BUCKETS
+
+"""
+Admission control: a concurrency limit per route class with a bounded
+wait queue. When the database slows down, requests wait here for at
+most queue_timeout instead of piling up on pool checkout, and the ones
+that cannot wait are answered 503 with Retry-After at once.
+"""
+
+READ_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+ADMISSION_ACTIVE = Gauge(
+    "admission_active_requests",
+    "Requests holding an admission slot.",
+    ["limiter"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "admission_queue_depth",
+    "Requests waiting for an admission slot.",
+    ["limiter"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_QUEUE_DURATION = Histogram(
+    "admission_queue_seconds",
+    "Time admitted requests waited for a slot.",
+    ["limiter"],
+    buckets=LATENCY_BUCKETS,
+)
+ADMISSION_SHED = Counter(
+    "admission_shed_total",
+    "Requests rejected with 503 by admission control.",
+    ["limiter", "reason"],
+)
+
+
+def split_connections(connections: int, streams: int) -> tuple[int, int, int]:
+    """
+    Read, write and stream limits keeping the requests of a worker
+    within the connections of its pool: a third for writes, up to
+    streams for streaming routes, the rest for reads, at least one each
+    (streams 0 leaves streaming routes unlimited).
+    """
+    writes = max(1, connections // 3)
+    if streams > 0:
+        streams = max(1, min(streams, connections - writes - 1))
+    reads = max(1, connections - writes - streams)
+    return reads, writes, streams
+
+
+class Shed(Exception):
+    """The request was not admitted, reason is "queue_full" or "timeout"."""
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+class Limiter:
+    """
+    At most limit requests at once, at most queue_size waiting in FIFO
+    order, none waiting longer than queue_timeout seconds.
+    Waiters are futures of the running loop and the counters are not
+    locked, so acquire and release belong to that loop's thread.
+    """
+
+    def __init__(
+        self, name: str, limit: int, queue_size: int, queue_timeout: float
+    ) -> None:
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self._waiters: collections.deque[asyncio.Future] = collections.deque()
+        self._active_gauge = ADMISSION_ACTIVE.labels(name)
+        self._depth_gauge = ADMISSION_QUEUE_DEPTH.labels(name)
+        self._queue_duration = ADMISSION_QUEUE_DURATION.labels(name)
+
+    async def acquire(self) -> None:
+        """
+        Take a slot, waiting in the queue when all are taken.
+
+        :raises Shed: When the queue is full or the wait timed out.
+        """
+        if self.active < self.limit and not self._waiters:
+            self._take()
+            return
+        if len(self._waiters) >= self.queue_size:
+            self._shed("queue_full")
+        started = time.perf_counter()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._depth_gauge.inc()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except TimeoutError:
+            self._shed("timeout")
+        except asyncio.CancelledError:
+            # Handed a slot just before the cancellation, pass it on
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                self._remove(waiter)
+        self._queue_duration.observe(time.perf_counter() - started)
+
+    def release(self) -> None:
+        """Give the slot to the oldest waiter, or free it."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            self._depth_gauge.dec()
+            if not waiter.done():
+                # The slot changes hands, active stays the same
+                waiter.set_result(None)
+                return
+        self.active -= 1
+        self._active_gauge.dec()
+
+    def _take(self) -> None:
+        self.active += 1
+        self._active_gauge.inc()
+
+    def _remove(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            return
+        self._depth_gauge.dec()
+
+    def _shed(self, reason: str) -> None:
+        ADMISSION_SHED.labels(self.name, reason).inc()
+        raise Shed(reason)
+
+    def stats(self) -> dict[str, int]:
+        return {"active": self.active, "queued": len(self._waiters)}
+
+
+class AdmissionControlMiddleware:
+    """
+    Admits HTTP requests under path_prefix through the reads or the
+    writes limiter, by method. routes maps (method, path) to the limiter
+    of that route instead, None admitting it without limit.
+    Rejected requests get 503, Retry-After and
+    {"detail": "Service overloaded"} without reaching the app.
+    A limiter with limit 0 admits everything.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefix: str,
+        reads: Limiter,
+        writes: Limiter,
+        retry_after: int,
+        routes: dict[tuple[str, str], Limiter | None] | None = None,
+    ) -> None:
+        self.app = app
+        self.path_prefix = path_prefix
+        self.reads = reads
+        self.writes = writes
+        self.routes = routes or {}
+        self.retry_after = str(retry_after)
+        self.body = json.dumps({"detail": "Service overloaded"}).encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        path = scope["path"].removeprefix(scope.get("root_path", ""))
+        if path != self.path_prefix and not path.startswith(
+            self.path_prefix + "/"
+        ):
+            await self.app(scope, receive, send)
+            return
+        method = scope["method"]
+        if (method, path) in self.routes:
+            limiter = self.routes[method, path]
+        else:
+            limiter = self.reads if method in READ_METHODS else self.writes
+        if limiter is None or limiter.limit <= 0:
+            await self.app(scope, receive, send)
+            return
+        try:
+            await limiter.acquire()
+        except Shed:
+            await self.reject(send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    async def reject(self, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(self.body)).encode()),
+                    (b"retry-after", self.retry_after.encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": self.body})
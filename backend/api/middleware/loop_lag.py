@@ -0,0 +1,173 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+
+from asgi_correlation_id import correlation_id
+from loguru import logger
+from prometheus_client import Counter, Histogram
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from backend.api import config
+from backend.loguru_logger import log_config
+
+"""
+Event loop lag monitor.
+A task on the loop sleeps interval seconds over and over and records
+how late it wakes up in a histogram: the scheduling lag every request
+of the worker pays on top of its own work.
+A watchdog thread notices when that task has not woken up for more
+than threshold seconds, while the loop is still blocked, and logs the
+stack of the code blocking it with the correlation id of its request.
+"""
+
+LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "Delay of event loop callbacks behind their scheduled time.",
+    buckets=(
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    ),
+)
+LOOP_BLOCKED = Counter(
+    "event_loop_blocked_total",
+    "Times the event loop was blocked for longer than the threshold.",
+)
+
+
+class LoopMonitor:
+    """
+    Lag histogram and blocking stack reports of the running event loop.
+    request_ids maps the tasks of requests in progress to their
+    correlation id, filled by LoopLagMiddleware.
+    """
+
+    def __init__(self, interval: float, threshold: float) -> None:
+        self.interval = interval
+        self.threshold = threshold
+        self.lag = 0.0
+        self.request_ids: dict[asyncio.Task, str | None] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        # time.monotonic() of the last wake up, written by the loop only
+        self._beat = 0.0
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        """Watch the running loop: lag task on it, watchdog thread beside."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+        self._task = self._loop.create_task(self._tick())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-lag-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop the lag task and the watchdog thread."""
+        if self._task is None:
+            return
+        self._stopped.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        await asyncio.to_thread(self._watchdog.join)
+        self._task = None
+        self._watchdog = None
+
+    async def _tick(self) -> None:
+        while True:
+            scheduled = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self.lag = max(0.0, now - scheduled)
+            LOOP_LAG.observe(self.lag)
+            self._beat = now
+
+    def _watch(self) -> None:
+        reported = None
+        while not self._stopped.wait(self.interval):
+            beat = self._beat
+            blocked = time.monotonic() - beat - self.interval
+            # One report per blocking episode
+            if blocked >= self.threshold and beat != reported:
+                reported = beat
+                self.report(blocked)
+
+    def report(self, blocked: float) -> None:
+        """Log the stack the loop thread is running now, from the watchdog."""
+        frame = sys._current_frames().get(self._loop_thread)
+        if frame is None:
+            return
+        LOOP_BLOCKED.inc()
+        stack = "".join(traceback.format_stack(frame))
+        task = asyncio.current_task(self._loop)
+        request_id = self.request_ids.get(task)
+        # The log filter reads the correlation id of the logging thread
+        token = correlation_id.set(request_id)
+        try:
+            logger.bind(
+                request_id=request_id, blocked_ms=round(blocked * 1000, 3)
+            ).log(
+                log_config.handled_internal_exception,
+                f"Event loop blocked for {blocked * 1000:.0f}ms"
+                f" (threshold {self.threshold * 1000:.0f}ms),"
+                f" task {task.get_name() if task else None},"
+                f" stack:\n{stack}",
+            )
+        finally:
+            correlation_id.reset(token)
+
+
+class LoopLagMiddleware:
+    """
+    Registers the task of every HTTP request with its correlation id
+    in monitor.request_ids while the request is in progress.
+    Must run inside CorrelationIdMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp, monitor: LoopMonitor) -> None:
+        self.app = app
+        self.monitor = monitor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        task = asyncio.current_task()
+        self.monitor.request_ids[task] = correlation_id.get()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.monitor.request_ids.pop(task, None)
+
+
+# The monitor of this worker, started in the app lifespan (LOOP_MONITOR)
+monitor = LoopMonitor(
+    interval=config.LOOP_MONITOR_INTERVAL_MS / 1000,
+    threshold=config.LOOP_MONITOR_THRESHOLD_MS / 1000,
+)
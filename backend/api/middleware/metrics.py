@@ -0,0 +1,115 @@
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from starlette import status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.database.postgres import instrumentation
+
+"""
+Prometheus request metrics, labelled by route template
+("/person/{person_id}"), never by raw path.
+With PROMETHEUS_MULTIPROC_DIR set (see gunicorn_conf.py) every worker
+writes its values to mmap files there and /metrics sums them up.
+"""
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+UNMATCHED_ROUTE = "unmatched"
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests handled.",
+    ["method", "route", "status"],
+)
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency, until the last body chunk is sent.",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_seconds",
+    "Time spent executing SQL per HTTP request.",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being handled.",
+    multiprocess_mode="livesum",
+)
+
+
+class MetricsMiddleware:
+    """Records count, latency and DB time of every HTTP request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        # Label lookups take a lock, children are cached per label set
+        self.requests: dict[tuple[str, str, str], Counter] = {}
+        self.durations: dict[tuple[str, str], tuple[Histogram, Histogram]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            # Answered by the generic exception handler outside of this
+            # middleware with 501, as logged by AccessLogMiddleware
+            status_code = status.HTTP_501_NOT_IMPLEMENTED
+            raise
+        finally:
+            REQUESTS_IN_PROGRESS.dec()
+            self.record(scope, status_code, time.perf_counter() - started)
+
+    def record(
+        self,
+        scope: Scope,
+        status_code: int,
+        duration: float,
+    ) -> None:
+        method = scope["method"]
+        # Set by the router on the shared scope once a route matched
+        route = scope.get("route")
+        template = getattr(route, "path", UNMATCHED_ROUTE)
+        key = (method, template, str(status_code))
+        counter = self.requests.get(key)
+        if counter is None:
+            counter = self.requests[key] = REQUESTS.labels(*key)
+        counter.inc()
+        histograms = self.durations.get(key[:2])
+        if histograms is None:
+            histograms = self.durations[key[:2]] = (
+                REQUEST_DURATION.labels(method, template),
+                REQUEST_DB_DURATION.labels(method, template),
+            )
+        histograms[0].observe(duration)
+        # Set by QueryStatsMiddleware, outside of this one
+        stats = instrumentation.query_stats.get()
+        if stats is not None:
+            histograms[1].observe(stats.seconds)
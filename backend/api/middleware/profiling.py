@@ -0,0 +1,121 @@
+import asyncio
+import hmac
+import os
+import random
+import typing
+import uuid
+
+from asgi_correlation_id import correlation_id
+from loguru import logger
+from pyinstrument import Profiler
+from pyinstrument.frame import Frame
+from pyinstrument.renderers import SpeedscopeRenderer
+from pyinstrument.session import Session
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+"""
+Opt-in per request profiling with pyinstrument, a statistical profiler.
+In async mode it only samples while the request's own task runs, so
+concurrent requests of the worker do not show up in its profile and
+awaited time is reported as [await] frames.
+Requests that are not profiled cost one attribute check when profiling
+is off, a header scan and a random draw otherwise.
+"""
+
+PROFILE_HEADER = b"x-profile"
+FORMATS = {"speedscope": "speedscope.json", "collapsed": "collapsed.txt"}
+
+
+def collapsed_stacks(frame: Frame | None) -> typing.Iterator[str]:
+    """
+    Lines "outer;inner;leaf microseconds" of the frame tree, the format
+    read by flamegraph.pl and speedscope, one line per frame with self time.
+    """
+    stack = [(frame, "")] if frame is not None else []
+    while stack:
+        frame, prefix = stack.pop()
+        name = f"{frame.function} ({frame.file_path_short}:{frame.line_no})"
+        path = f"{prefix};{name}" if prefix else name
+        self_time = frame.time - sum(child.time for child in frame.children)
+        if self_time * 1e6 >= 1:
+            yield f"{path} {round(self_time * 1e6)}"
+        stack.extend((child, path) for child in reversed(frame.children))
+
+
+def render(session: Session, fmt: str) -> str:
+    if fmt == "collapsed":
+        return "\n".join(collapsed_stacks(session.root_frame())) + "\n"
+    return SpeedscopeRenderer().render(session)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles an HTTP request when it carries the header X-Profile equal
+    to token, or with probability sample_rate, and writes the profile to
+    output_dir, named by the request's correlation id.
+    An empty token disables the header, sample_rate 0 the sampling.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        output_dir: str,
+        token: str = "",
+        sample_rate: float = 0.0,
+        interval: float = 0.001,
+        fmt: str = "speedscope",
+    ) -> None:
+        if fmt not in FORMATS:
+            raise ValueError(
+                f"Unknown profile format {fmt!r},"
+                f" expected one of {list(FORMATS)}"
+            )
+        self.app = app
+        self.output_dir = output_dir
+        self.token = token.encode()
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.fmt = fmt
+        self.enabled = bool(token) or sample_rate > 0
+
+    def wanted(self, scope: Scope) -> bool:
+        if self.token:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return hmac.compare_digest(value, self.token)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            not self.enabled
+            or scope["type"] != "http"
+            or not self.wanted(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = Profiler(interval=self.interval, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            session = profiler.stop()
+            request_id = correlation_id.get() or uuid.uuid4().hex
+            path = os.path.join(
+                self.output_dir, f"{request_id}.{FORMATS[self.fmt]}"
+            )
+            try:
+                # Rendering walks the whole frame tree, keep it off the loop
+                await asyncio.to_thread(self.write, session, path)
+            except OSError as exc_info:
+                logger.error(f"Profile {path} not written: {exc_info}")
+            else:
+                logger.info(
+                    f"Profile of {scope['method']} {scope['path']}"
+                    f" written to {path}"
+                )
+
+    def write(self, session: Session, path: str) -> None:
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(path, "w") as file:
+            file.write(render(session, self.fmt))
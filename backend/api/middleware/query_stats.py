@@ -0,0 +1,55 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.database.postgres import instrumentation
+
+"""
+Per request SQL statistics.
+Counts the request's queries and their time through the engine hooks
+of backend.database.postgres.instrumentation, and reports them with the
+handler time in a Server-Timing header.
+"""
+
+
+def server_timing(stats: instrumentation.QueryStats, elapsed: float) -> str:
+    return (
+        f'db;dur={stats.seconds * 1000:.3f};desc="{stats.count} queries",'
+        f" app;dur={elapsed * 1000:.3f}"
+    )
+
+
+class QueryStatsMiddleware:
+    """
+    Puts a fresh QueryStats in the query_stats contextvar for every HTTP
+    request and adds the Server-Timing header to its response.
+    Timings cover the work done until the response starts, queries of a
+    streamed body are counted in metrics but not in the header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        stats = instrumentation.QueryStats()
+        token = instrumentation.query_stats.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    server_timing(stats, time.perf_counter() - started),
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            instrumentation.query_stats.reset(token)
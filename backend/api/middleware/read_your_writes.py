@@ -0,0 +1,52 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.database.postgres import config, routing
+
+"""
+Marks clients that just wrote, so their next reads go to the primary
+instead of a replica that may lag behind (see routing.py).
+"""
+
+WRITE_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+
+
+class ReadYourWritesMiddleware:
+    """
+    On a successful write response, sets the last_write cookie and the
+    X-Last-Write header to the write time (Unix seconds). Clients not
+    keeping cookies can send the header back with their next reads.
+    Does nothing when no replica is configured.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in WRITE_METHODS
+            or not config.POSTGRES_REPLICA_URLS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < 400
+            ):
+                written_at = f"{time.time():.3f}"
+                window = max(int(config.POSTGRES_READ_YOUR_WRITES_SECONDS), 1)
+                headers = MutableHeaders(scope=message)
+                headers.append(routing.LAST_WRITE_HEADER, written_at)
+                headers.append(
+                    "Set-Cookie",
+                    f"{routing.LAST_WRITE_COOKIE}={written_at};"
+                    f" Max-Age={window}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,5 +1,6 @@
 from .about.endpoints import router as about_router
 from .healthcheck.endpoints import router as healthcheck_router
+from .metrics.endpoints import router as metrics_router
 from .person.endpoints import router as person_router
 
-__all__ = [about_router, healthcheck_router, person_router]
+__all__ = [about_router, healthcheck_router, metrics_router, person_router]
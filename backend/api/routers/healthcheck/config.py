@@ -0,0 +1,28 @@
+import os
+
+from loguru import logger
+
+"""
+This module configures healthcheck router settings,
+using environment variables if available,
+or defaults to predefined values for local development.
+"""
+
+# GET /health/ready serves the result of a background database probe,
+# run every HEALTH_PROBE_INTERVAL_SECONDS per worker on the shared pool.
+HEALTH_PROBE_INTERVAL_SECONDS: float = float(
+    os.getenv("HEALTH_PROBE_INTERVAL_SECONDS") or 5
+)
+HEALTH_PROBE_TIMEOUT_SECONDS: float = float(
+    os.getenv("HEALTH_PROBE_TIMEOUT_SECONDS") or 2
+)
+# A successful probe older than this no longer counts as ready,
+# the probe task itself is stuck then.
+HEALTH_PROBE_MAX_AGE_SECONDS: float = float(
+    os.getenv("HEALTH_PROBE_MAX_AGE_SECONDS")
+    or 3 * HEALTH_PROBE_INTERVAL_SECONDS
+)
+
+logger.info(f"{HEALTH_PROBE_INTERVAL_SECONDS=}")
+logger.info(f"{HEALTH_PROBE_TIMEOUT_SECONDS=}")
+logger.info(f"{HEALTH_PROBE_MAX_AGE_SECONDS=}")
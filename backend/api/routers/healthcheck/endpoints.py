@@ -4,7 +4,7 @@ from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 from loguru import logger
 
-from backend.api.routers.healthcheck import response_examples
+from backend.api.routers.healthcheck import readiness, response_examples
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -22,3 +22,24 @@ async def health() -> JSONResponse:
         content={"data": random.choice(responses)},
         status_code=status.HTTP_200_OK,
     )
+
+
+@router.get("/ready", status_code=200, responses=response_examples.ready)
+async def ready() -> JSONResponse:
+    """
+    Readiness of this worker: the cached result of the background
+    database probe, pool usage and event loop lag.
+    Never touches the database itself.
+
+    :return: 200 when the last probe succeeded recently, 503 otherwise.
+    :rtype: JSONResponse
+    """
+    snapshot = readiness.probe.snapshot()
+    return JSONResponse(
+        content=snapshot,
+        status_code=(
+            status.HTTP_200_OK
+            if snapshot["ready"]
+            else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+    )
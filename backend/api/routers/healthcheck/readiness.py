@@ -0,0 +1,134 @@
+import asyncio
+import time
+import typing
+
+from loguru import logger
+from sqlalchemy import text
+
+from backend.api.middleware import loop_lag
+from backend.api.routers.healthcheck import config
+from backend.database.postgres import session as db_session
+
+"""
+Readiness probe behind GET /health/ready.
+A background task started in the app lifespan runs SELECT 1 on the
+shared pool every interval seconds, so the database sees one probe per
+worker and interval however often the endpoint is polled. The endpoint
+only reads the last result, it never waits for the database.
+Event loop lag is the last sample of the worker's LoopMonitor.
+"""
+
+
+class ReadinessProbe:
+    """
+    Periodic database liveness check with a cached result.
+    """
+
+    def __init__(
+        self, interval: float, timeout: float, max_age: float
+    ) -> None:
+        self.interval = interval
+        self.timeout = timeout
+        self.max_age = max_age
+        self.ok = False
+        self.error: str | None = "not probed yet"
+        # time.monotonic() of the last finished probe, None before
+        self.checked_at: float | None = None
+        self.latency: float | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background probe task unless it is alive."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background task and wait for it."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def check(self) -> None:
+        """Probe the database once and record the result."""
+        started = time.perf_counter()
+        try:
+            if db_session.read_engine is None:
+                raise RuntimeError("database engine is not initialized")
+            await asyncio.wait_for(self._select_one(), self.timeout)
+        except Exception as exc_info:
+            if self.ok:
+                logger.error(f"Readiness probe failed: {exc_info!r}")
+            self.ok = False
+            self.error = repr(exc_info)
+        else:
+            if not self.ok:
+                logger.info("Readiness probe succeeded")
+            self.ok = True
+            self.error = None
+        self.latency = time.perf_counter() - started
+        self.checked_at = time.monotonic()
+
+    async def _select_one(self) -> None:
+        # Autocommit view of the pool: SELECT 1 without BEGIN/ROLLBACK
+        async with db_session.read_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval)
+
+    def ready(self) -> bool:
+        """Last probe succeeded and is recent enough."""
+        return (
+            self.ok
+            and self.checked_at is not None
+            and time.monotonic() - self.checked_at <= self.max_age
+        )
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        """Cached probe result with the current pool counters."""
+        age = None
+        if self.checked_at is not None:
+            age = round(time.monotonic() - self.checked_at, 3)
+        pool = None
+        if db_session.engine is not None:
+            sync_pool = db_session.engine.pool
+            pool = {
+                "size": sync_pool.size(),
+                "checked_out": sync_pool.checkedout(),
+                "idle": sync_pool.checkedin(),
+                "overflow": sync_pool.overflow(),
+            }
+        return {
+            "ready": self.ready(),
+            "database": {
+                "ok": self.ok,
+                "error": self.error,
+                "latency_ms": (
+                    None
+                    if self.latency is None
+                    else round(self.latency * 1000, 3)
+                ),
+                "age_seconds": age,
+            },
+            "pool": pool,
+            # None when the monitor is off (LOOP_MONITOR)
+            "event_loop_lag_ms": (
+                round(loop_lag.monitor.lag * 1000, 3)
+                if loop_lag.monitor.running
+                else None
+            ),
+        }
+
+
+probe = ReadinessProbe(
+    interval=config.HEALTH_PROBE_INTERVAL_SECONDS,
+    timeout=config.HEALTH_PROBE_TIMEOUT_SECONDS,
+    max_age=config.HEALTH_PROBE_MAX_AGE_SECONDS,
+)
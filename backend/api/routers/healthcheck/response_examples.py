@@ -41,3 +41,52 @@ health: Optional[Dict[Union[int, str], Dict[str, Any]]] = {
         },
     },
 }
+
+ready: Optional[Dict[Union[int, str], Dict[str, Any]]] = {
+    "200": {
+        "description": "Database reachable",
+        "content": {
+            "application/json": {
+                "example": {
+                    "ready": True,
+                    "database": {
+                        "ok": True,
+                        "error": None,
+                        "latency_ms": 0.842,
+                        "age_seconds": 1.204,
+                    },
+                    "pool": {
+                        "size": 10,
+                        "checked_out": 2,
+                        "idle": 3,
+                        "overflow": -5,
+                    },
+                    "event_loop_lag_ms": 0.311,
+                }
+            }
+        },
+    },
+    "503": {
+        "description": "Database unreachable or probe outdated",
+        "content": {
+            "application/json": {
+                "example": {
+                    "ready": False,
+                    "database": {
+                        "ok": False,
+                        "error": "TimeoutError()",
+                        "latency_ms": 2001.532,
+                        "age_seconds": 3.87,
+                    },
+                    "pool": {
+                        "size": 10,
+                        "checked_out": 10,
+                        "idle": 0,
+                        "overflow": 0,
+                    },
+                    "event_loop_lag_ms": 0.298,
+                }
+            }
+        },
+    },
+}
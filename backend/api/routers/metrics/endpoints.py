@@ -0,0 +1,31 @@
+import os
+
+from fastapi import APIRouter, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from backend.api.routers.metrics import response_examples
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+def collect_metrics() -> bytes:
+    """
+    Metrics of this process, or of all gunicorn workers
+    when PROMETHEUS_MULTIPROC_DIR is set.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+@router.get("/", status_code=200, responses=response_examples.metrics)
+async def metrics() -> Response:
+    return Response(content=collect_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,17 @@
+from typing import Any, Dict, Optional, Union
+
+metrics: Optional[Dict[Union[int, str], Dict[str, Any]]] = {
+    "200": {
+        "description": "Metrics in Prometheus text exposition format",
+        "content": {
+            "text/plain": {
+                "example": (
+                    "# HELP http_requests_total HTTP requests handled.\n"
+                    "# TYPE http_requests_total counter\n"
+                    'http_requests_total{method="GET",'
+                    'route="/person/{person_id}",status="200"} 42.0\n'
+                )
+            }
+        },
+    },
+}
@@ -0,0 +1,215 @@
+import asyncio
+import time
+import typing
+from collections import OrderedDict
+
+from backend.api.routers.person import config
+from backend.api.routers.person.models import response_models
+
+"""
+In-process read-through cache in front of person lookups by ID.
+Every worker keeps its own copy, so a write done by another worker
+is only seen here once the entry expires (ttl / negative_ttl).
+Concurrent misses of the same ID share one load (singleflight),
+even with the cache disabled.
+"""
+
+Loader = typing.Callable[
+    [], typing.Awaitable[response_models.PersonResponse | None]
+]
+ManyLoader = typing.Callable[
+    [list[int]],
+    typing.Awaitable[dict[int, response_models.PersonResponse]],
+]
+
+_MISS = object()
+
+
+class PersonCache:
+    """
+    Size bounded LRU cache with TTL and negative caching of missing IDs.
+    Not synchronized: use it from the worker's event loop, not from
+    threadpool endpoints.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        negative_ttl: float,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        # person_id -> (expires_at, person or None when it does not exist)
+        self._entries: OrderedDict[
+            int, tuple[float, response_models.PersonResponse | None]
+        ] = OrderedDict()
+        # person_id -> result of the load in flight, awaited by later misses
+        self._inflight: dict[int, asyncio.Future] = {}
+        # Bumped by every invalidation, loads started before are not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.coalesced = 0
+
+    async def get_or_load(
+        self, person_id: int, loader: Loader
+    ) -> response_models.PersonResponse | None:
+        """
+        Return cached person, or load, cache and return it.
+
+        :param person_id: Person ID.
+        :param loader: Coroutine function loading the person from DB,
+            returning None when it does not exist.
+        :return: Person, or None when it does not exist.
+        """
+
+        async def load_one(
+            person_ids: list[int],
+        ) -> dict[int, response_models.PersonResponse]:
+            person = await loader()
+            return {} if person is None else {person_id: person}
+
+        persons = await self.get_many_or_load([person_id], load_one)
+        return persons[person_id]
+
+    async def get_many_or_load(
+        self, person_ids: typing.Iterable[int], loader: ManyLoader
+    ) -> dict[int, response_models.PersonResponse | None]:
+        """
+        Return cached persons, joining loads already in flight
+        and loading the rest with a single loader call.
+
+        :param person_ids: Person IDs, duplicates ignored.
+        :param loader: Coroutine function loading persons by IDs from DB,
+            returning the found ones by ID.
+        :return: Person, or None when it does not exist, by ID,
+            in the order of person_ids.
+        """
+        requested = list(dict.fromkeys(person_ids))
+        found: dict[int, response_models.PersonResponse | None] = {}
+        waiting: dict[int, asyncio.Future] = {}
+        missing: list[int] = []
+        for person_id in requested:
+            person = self._lookup(person_id)
+            if person is not _MISS:
+                found[person_id] = person
+            elif person_id in self._inflight:
+                waiting[person_id] = self._inflight[person_id]
+            else:
+                missing.append(person_id)
+        if missing:
+            found.update(await self._load(missing, loader))
+        for person_id, future in waiting.items():
+            self.coalesced += 1
+            # Unlike awaiting the future, does not raise when the
+            # loading request was cancelled (client went away)
+            await asyncio.wait((future,))
+            if future.cancelled():
+                found.update(await self._load([person_id], loader))
+            else:
+                found[person_id] = future.result()
+        return {person_id: found[person_id] for person_id in requested}
+
+    def _lookup(
+        self, person_id: int
+    ) -> response_models.PersonResponse | None | object:
+        """Cached person (None when missing) or _MISS."""
+        if self.maxsize <= 0:
+            return _MISS
+        entry = self._entries.get(person_id)
+        if entry is not None:
+            expires_at, person = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(person_id)
+                self.hits += 1
+                return person
+            del self._entries[person_id]
+            self.expirations += 1
+        self.misses += 1
+        return _MISS
+
+    async def _load(
+        self, person_ids: list[int], loader: ManyLoader
+    ) -> dict[int, response_models.PersonResponse | None]:
+        loop = asyncio.get_running_loop()
+        futures = {person_id: loop.create_future() for person_id in person_ids}
+        self._inflight.update(futures)
+        generation = self._generation
+        try:
+            persons = await loader(person_ids)
+        except BaseException as exc_info:
+            for person_id, future in futures.items():
+                self._forget(person_id, future)
+                if isinstance(exc_info, Exception):
+                    # Waiters fail like the loading request did
+                    future.set_exception(exc_info)
+                    future.exception()
+                else:
+                    future.cancel()
+            raise
+        loaded = {}
+        for person_id, future in futures.items():
+            person = persons.get(person_id)
+            self._forget(person_id, future)
+            future.set_result(person)
+            if self.maxsize > 0 and generation == self._generation:
+                self._store(person_id, person)
+            loaded[person_id] = person
+        return loaded
+
+    def _forget(self, person_id: int, future: asyncio.Future) -> None:
+        # An invalidation may have let a newer load take the slot
+        if self._inflight.get(person_id) is future:
+            del self._inflight[person_id]
+
+    def _store(
+        self, person_id: int, person: response_models.PersonResponse | None
+    ) -> None:
+        ttl = self.ttl if person is not None else self.negative_ttl
+        if ttl <= 0:
+            return
+        self._entries[person_id] = (self._clock() + ttl, person)
+        self._entries.move_to_end(person_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, *person_ids: int) -> None:
+        """Drop entries of created, updated or deleted persons."""
+        self._generation += 1
+        for person_id in person_ids:
+            # Later lookups must not join a load started before the write
+            self._inflight.pop(person_id, None)
+            if self._entries.pop(person_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._inflight.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "coalesced": self.coalesced,
+        }
+
+
+person_cache = PersonCache(
+    maxsize=config.PERSON_CACHE_SIZE,
+    ttl=config.PERSON_CACHE_TTL,
+    negative_ttl=config.PERSON_CACHE_NEGATIVE_TTL,
+)
@@ -0,0 +1,151 @@
+import os
+
+from loguru import logger
+
+"""
+This module configures person router settings,
+using environment variables if available,
+or defaults to predefined values for local development.
+"""
+
+
+def _optional_int(name: str) -> int | None:
+    value = os.getenv(name)
+    return int(value) if value else None
+
+
+# Rows inserted per multi-row INSERT ... RETURNING statement and commit.
+# asyncpg accepts at most 32767 bind parameters, 7 per person row.
+PERSON_BULK_BATCH_SIZE: int = int(os.getenv("PERSON_BULK_BATCH_SIZE") or 500)
+PERSON_BULK_MAX_BATCH_SIZE: int = 4000
+PERSON_BULK_MAX_ITEMS: int = int(os.getenv("PERSON_BULK_MAX_ITEMS") or 10000)
+# Ids per POST /person/bulk/delete, sent as one array parameter.
+PERSON_BULK_DELETE_MAX_ITEMS: int = int(
+    os.getenv("PERSON_BULK_DELETE_MAX_ITEMS") or 10000
+)
+
+logger.info(f"{PERSON_BULK_BATCH_SIZE=}")
+logger.info(f"{PERSON_BULK_MAX_ITEMS=}")
+logger.info(f"{PERSON_BULK_DELETE_MAX_ITEMS=}")
+
+# Keyset pagination page sizes.
+PERSON_PAGE_DEFAULT_LIMIT: int = int(
+    os.getenv("PERSON_PAGE_DEFAULT_LIMIT") or 50
+)
+PERSON_PAGE_MAX_LIMIT: int = int(os.getenv("PERSON_PAGE_MAX_LIMIT") or 1000)
+
+logger.info(f"{PERSON_PAGE_DEFAULT_LIMIT=}")
+logger.info(f"{PERSON_PAGE_MAX_LIMIT=}")
+
+# In-process read-through cache of GET /person/{person_id}, per worker.
+# PERSON_CACHE_SIZE=0 disables it.
+PERSON_CACHE_SIZE: int = int(os.getenv("PERSON_CACHE_SIZE") or 10000)
+PERSON_CACHE_TTL: float = float(os.getenv("PERSON_CACHE_TTL") or 30)
+PERSON_CACHE_NEGATIVE_TTL: float = float(
+    os.getenv("PERSON_CACHE_NEGATIVE_TTL") or 5
+)
+
+logger.info(f"{PERSON_CACHE_SIZE=}")
+logger.info(f"{PERSON_CACHE_TTL=}")
+logger.info(f"{PERSON_CACHE_NEGATIVE_TTL=}")
+
+# Ids per GET /person/batch, fetched with one query.
+PERSON_BATCH_MAX_IDS: int = int(os.getenv("PERSON_BATCH_MAX_IDS") or 1000)
+
+logger.info(f"{PERSON_BATCH_MAX_IDS=}")
+
+# Rows fetched per server-side cursor round-trip by GET /person/export.
+PERSON_EXPORT_CHUNK_SIZE: int = int(
+    os.getenv("PERSON_EXPORT_CHUNK_SIZE") or 1000
+)
+
+logger.info(f"{PERSON_EXPORT_CHUNK_SIZE=}")
+
+# Streaming NDJSON import (POST /person/import).
+PERSON_IMPORT_BATCH_SIZE: int = int(
+    os.getenv("PERSON_IMPORT_BATCH_SIZE") or 1000
+)
+# Parsed batches waiting for the DB writer before the parser blocks.
+PERSON_IMPORT_QUEUE_SIZE: int = int(os.getenv("PERSON_IMPORT_QUEUE_SIZE") or 4)
+PERSON_IMPORT_MAX_LINE_BYTES: int = int(
+    os.getenv("PERSON_IMPORT_MAX_LINE_BYTES") or 64 * 1024
+)
+PERSON_IMPORT_MAX_REPORTED_LINES: int = int(
+    os.getenv("PERSON_IMPORT_MAX_REPORTED_LINES") or 1000
+)
+
+logger.info(f"{PERSON_IMPORT_BATCH_SIZE=}")
+logger.info(f"{PERSON_IMPORT_QUEUE_SIZE=}")
+logger.info(f"{PERSON_IMPORT_MAX_LINE_BYTES=}")
+logger.info(f"{PERSON_IMPORT_MAX_REPORTED_LINES=}")
+
+# GET /person/{person_id} and POST /person/ render PersonResponse straight
+# to JSON bytes, skipping FastAPI response_model re-validation.
+PERSON_FAST_JSON: bool = (
+    os.getenv("PERSON_FAST_JSON") or "false"
+).lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+logger.info(f"{PERSON_FAST_JSON=}")
+
+# POST /person/ through a per worker group commit: concurrent creates are
+# inserted together with one INSERT ... RETURNING and one commit, once
+# MAX_BATCH rows wait or the oldest waited MAX_DELAY_MS.
+PERSON_GROUP_COMMIT: bool = (
+    os.getenv("PERSON_GROUP_COMMIT") or "false"
+).lower() in (
+    "1",
+    "true",
+    "yes",
+)
+PERSON_GROUP_COMMIT_MAX_BATCH: int = int(
+    os.getenv("PERSON_GROUP_COMMIT_MAX_BATCH") or 100
+)
+PERSON_GROUP_COMMIT_MAX_DELAY_MS: float = float(
+    os.getenv("PERSON_GROUP_COMMIT_MAX_DELAY_MS") or 2
+)
+
+logger.info(f"{PERSON_GROUP_COMMIT=}")
+logger.info(f"{PERSON_GROUP_COMMIT_MAX_BATCH=}")
+logger.info(f"{PERSON_GROUP_COMMIT_MAX_DELAY_MS=}")
+
+# Admission control in front of the person router, per worker: at most
+# CONCURRENCY requests at once, QUEUE more waiting up to QUEUE_TIMEOUT_MS,
+# the rest answered 503 with Retry-After. Reads are GET/HEAD/OPTIONS,
+# writes anything else. CONCURRENCY=0 disables the limit.
+# Unset READ/WRITE_CONCURRENCY are derived from the worker's pool, as
+# sized by the connection plan: a third of its connections for writes,
+# the rest minus STREAM_CONCURRENCY for reads.
+# GET /person/export and POST /person/import hold their connection for
+# the whole transfer, they are limited apart by STREAM_CONCURRENCY
+# (lowered when the pool is smaller).
+# With PERSON_GROUP_COMMIT, POST /person/ is not limited: its rows
+# share the batches of the group commit writer instead of connections.
+PERSON_READ_CONCURRENCY: int | None = _optional_int("PERSON_READ_CONCURRENCY")
+PERSON_READ_QUEUE: int = int(os.getenv("PERSON_READ_QUEUE") or 100)
+PERSON_WRITE_CONCURRENCY: int | None = _optional_int(
+    "PERSON_WRITE_CONCURRENCY"
+)
+PERSON_WRITE_QUEUE: int = int(os.getenv("PERSON_WRITE_QUEUE") or 50)
+PERSON_STREAM_CONCURRENCY: int = int(
+    os.getenv("PERSON_STREAM_CONCURRENCY") or 2
+)
+PERSON_STREAM_QUEUE: int = int(os.getenv("PERSON_STREAM_QUEUE") or 10)
+PERSON_QUEUE_TIMEOUT_MS: float = float(
+    os.getenv("PERSON_QUEUE_TIMEOUT_MS") or 2000
+)
+PERSON_RETRY_AFTER_SECONDS: int = int(
+    os.getenv("PERSON_RETRY_AFTER_SECONDS") or 1
+)
+
+logger.info(f"{PERSON_READ_CONCURRENCY=}")
+logger.info(f"{PERSON_READ_QUEUE=}")
+logger.info(f"{PERSON_WRITE_CONCURRENCY=}")
+logger.info(f"{PERSON_WRITE_QUEUE=}")
+logger.info(f"{PERSON_STREAM_CONCURRENCY=}")
+logger.info(f"{PERSON_STREAM_QUEUE=}")
+logger.info(f"{PERSON_QUEUE_TIMEOUT_MS=}")
+logger.info(f"{PERSON_RETRY_AFTER_SECONDS=}")
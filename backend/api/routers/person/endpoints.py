@@ -1,19 +1,433 @@
 import typing
 
-from fastapi import APIRouter, Body, HTTPException, Path, status
+from fastapi import (
+    APIRouter,
+    Body,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from loguru import logger
+from pydantic import Field
 
-from backend.api.routers.person.models import request_models, response_models
+from backend.api.routers.person import (
+    cache,
+    config,
+    export,
+    group_commit,
+    importer,
+    pagination,
+    responses,
+)
+from backend.api.routers.person.models import (
+    batch_validation,
+    request_models,
+    response_models,
+)
 from backend.api.routers.person.swagger_examples import (
     request_examples,
     response_examples,
 )
 from backend.database import postgres as db_model
-from backend.database.postgres.session import DBSessionDep
+from backend.database.postgres import session as db_session
+from backend.database.postgres.session import (
+    DBSessionDep,
+    ReadSessionDep,
+    WroteRecentlyDep,
+)
 
 router = APIRouter(prefix="/person", tags=["person"])
 
 
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    response_model=response_models.PersonPage,
+    responses={
+        200: {
+            "description": "Persons Page Retrieved",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "items": [
+                            {
+                                "person_id": 1,
+                                "name": "Jane",
+                                "last_name": "Smith",
+                                "age": 30,
+                                "start_date": "1995-05-09T00:00:00",
+                                "end_date": None,
+                                "description": "An inspiring leader.",
+                            }
+                        ],
+                        "next_cursor": "WzFd",
+                    }
+                }
+            },
+        },
+        400: {
+            "description": "Invalid Request",
+            "content": {
+                "application/json": {"example": {"detail": "Invalid cursor"}}
+            },
+        },
+    },
+)
+async def list_persons(
+    session: ReadSessionDep,
+    after: typing.Annotated[
+        str | None,
+        Query(description="Cursor returned as next_cursor by previous page."),
+    ] = None,
+    limit: typing.Annotated[
+        int,
+        Query(
+            ge=1,
+            le=config.PERSON_PAGE_MAX_LIMIT,
+            description="Maximum number of persons on the page.",
+        ),
+    ] = config.PERSON_PAGE_DEFAULT_LIMIT,
+) -> response_models.PersonPage:
+    """
+    List persons ordered by ID, paginated by keyset on person_id.
+
+    :param session: Database session dependency.
+    :type session: ReadSessionDep
+    :param after: Opaque cursor of the page to retrieve, None for first page.
+    :type after: str | None
+    :param limit: Maximum number of persons on the page.
+    :type limit: int
+    :return: Persons page with the cursor of the next one.
+    :rtype: PersonPage
+    :raises HTTPException:
+        - 400: Invalid cursor or database error.
+    """
+    after_id = None
+    if after is not None:
+        (after_id,) = pagination.decode_cursor(after, int)
+    try:
+        # One extra row tells whether a next page exists
+        rows = await db_model.person_queries.list_persons(
+            session, after=after_id, limit=limit + 1
+        )
+    except Exception as exc_info:
+        logger.error(f"Error listing persons: {str(exc_info)}")
+        raise HTTPException(status_code=400, detail="Failed to list persons")
+    rows, next_cursor = pagination.split_page(rows, limit, "person_id")
+    logger.debug(f"Listed {len(rows)} persons after ID: {after_id}")
+    return response_models.PersonPage(
+        items=[
+            response_models.PersonResponse.model_validate(dict(row))
+            for row in rows
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    response_model=response_models.PersonPage,
+    responses={
+        200: {
+            "description": "Matching Persons Page Retrieved",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "items": [
+                            {
+                                "person_id": 1,
+                                "name": "Jane",
+                                "last_name": "Smith",
+                                "age": 30,
+                                "start_date": "1995-05-09T00:00:00",
+                                "end_date": None,
+                                "description": "An inspiring leader.",
+                            }
+                        ],
+                        "next_cursor": None,
+                    }
+                }
+            },
+        },
+        400: {
+            "description": "Invalid Request",
+            "content": {
+                "application/json": {"example": {"detail": "Invalid cursor"}}
+            },
+        },
+    },
+)
+async def search_persons(
+    session: ReadSessionDep,
+    last_name: typing.Annotated[
+        str,
+        Query(
+            pattern=r"^[A-Za-z\s-]+$",
+            min_length=1,
+            max_length=32,
+            description="Last name, or its beginning when match=prefix.",
+        ),
+    ],
+    name: typing.Annotated[
+        str | None,
+        Query(
+            pattern=r"^[A-Za-z\s-]+$",
+            min_length=1,
+            max_length=32,
+            description="Name, or its beginning when match=prefix.",
+        ),
+    ] = None,
+    match: typing.Annotated[
+        typing.Literal["exact", "prefix"],
+        Query(description="Exact or prefix match on both names."),
+    ] = "exact",
+    after: typing.Annotated[
+        str | None,
+        Query(description="Cursor returned as next_cursor by previous page."),
+    ] = None,
+    limit: typing.Annotated[
+        int,
+        Query(
+            ge=1,
+            le=config.PERSON_PAGE_MAX_LIMIT,
+            description="Maximum number of persons on the page.",
+        ),
+    ] = config.PERSON_PAGE_DEFAULT_LIMIT,
+) -> response_models.PersonPage:
+    """
+    Search persons by last name, optionally narrowed by name.
+    Results are ordered by ID and paginated by keyset on person_id.
+
+    :param session: Database session dependency.
+    :type session: ReadSessionDep
+    :param last_name: Last name or its prefix.
+    :type last_name: str
+    :param name: Name or its prefix, None to match any name.
+    :type name: str | None
+    :param match: "exact" or "prefix".
+    :type match: str
+    :param after: Opaque cursor of the page to retrieve, None for first page.
+    :type after: str | None
+    :param limit: Maximum number of persons on the page.
+    :type limit: int
+    :return: Matching persons page with the cursor of the next one.
+    :rtype: PersonPage
+    :raises HTTPException:
+        - 400: Invalid cursor or database error.
+    """
+    after_id = None
+    if after is not None:
+        (after_id,) = pagination.decode_cursor(after, int)
+    try:
+        rows = await db_model.person_queries.search_persons(
+            session,
+            last_name=last_name,
+            name=name,
+            prefix=match == "prefix",
+            after=after_id,
+            limit=limit + 1,
+        )
+    except Exception as exc_info:
+        logger.error(f"Error searching persons: {str(exc_info)}")
+        raise HTTPException(status_code=400, detail="Failed to search persons")
+    rows, next_cursor = pagination.split_page(rows, limit, "person_id")
+    logger.debug(f"Found {len(rows)} persons matching {last_name=}, {name=}")
+    return response_models.PersonPage(
+        items=[
+            response_models.PersonResponse.model_validate(dict(row))
+            for row in rows
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "Persons Exported",
+            "content": {
+                "application/x-ndjson": {
+                    "example": (
+                        '{"person_id":1,"name":"Jane","last_name":"Smith",'
+                        '"age":30,"start_date":"1995-05-09T00:00:00",'
+                        '"end_date":null,"description":"An inspiring leader."}'
+                        "\n"
+                    )
+                },
+                "text/csv": {
+                    "example": (
+                        "person_id,name,last_name,age,start_date,"
+                        "end_date,description\r\n"
+                        "1,Jane,Smith,30,1995-05-09T00:00:00,,"
+                        "An inspiring leader.\r\n"
+                    )
+                },
+            },
+        },
+    },
+)
+async def export_persons(
+    request: Request,
+    export_format: typing.Annotated[
+        typing.Literal["ndjson", "csv"],
+        Query(alias="format", description="Output format."),
+    ] = "ndjson",
+) -> StreamingResponse:
+    """
+    Stream every person, ordered by ID, as NDJSON or CSV.
+    Rows are read through a server-side cursor
+    PERSON_EXPORT_CHUNK_SIZE at a time.
+
+    :param request: Incoming request, selects primary or replica.
+    :type request: Request
+    :param export_format: "ndjson" or "csv".
+    :type export_format: str
+    :return: Streamed dump of the person table.
+    :rtype: StreamingResponse
+    """
+    logger.debug(f"Exporting persons as {export_format}")
+    return StreamingResponse(
+        export.stream_persons(
+            export_format,
+            config.PERSON_EXPORT_CHUNK_SIZE,
+            db_session.get_read_engine(request),
+        ),
+        media_type=export.media_types[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="persons.{export_format}"'
+            )
+        },
+    )
+
+
+@router.get(
+    "/cache/stats",
+    status_code=status.HTTP_200_OK,
+    response_model=response_models.PersonCacheStats,
+)
+async def person_cache_stats() -> response_models.PersonCacheStats:
+    """
+    Counters of this worker's person cache, used to size it.
+
+    :return: Cache size and hit/miss/eviction counters.
+    :rtype: PersonCacheStats
+    """
+    return response_models.PersonCacheStats(**cache.person_cache.stats())
+
+
+@router.get(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    response_model=response_models.PersonBatchResponse,
+    responses={
+        200: {
+            "description": "Persons Retrieved",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "persons": [
+                            {
+                                "person_id": 1,
+                                "name": "Jane",
+                                "last_name": "Smith",
+                                "age": 30,
+                                "start_date": "1995-05-09T00:00:00",
+                                "end_date": None,
+                                "description": "An inspiring leader.",
+                            }
+                        ],
+                        "not_found": [999999],
+                    }
+                }
+            },
+        },
+        400: {
+            "description": "Invalid Request",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Failed to retrieve persons"}
+                }
+            },
+        },
+    },
+)
+async def get_persons_batch(
+    session: ReadSessionDep,
+    wrote_recently: WroteRecentlyDep,
+    ids: typing.Annotated[
+        list[typing.Annotated[int, Field(ge=1)]],
+        Query(
+            min_length=1,
+            max_length=config.PERSON_BATCH_MAX_IDS,
+            description="Person ids, repeated: ?ids=1&ids=2.",
+        ),
+    ],
+) -> response_models.PersonBatchResponse:
+    """
+    Retrieve many persons by ID in one call.
+    Cached persons are answered from the person cache, ids already being
+    loaded by a concurrent request wait for that load, and the rest are
+    fetched with a single WHERE person_id = ANY($1) query.
+    Clients that wrote recently skip the cache and concurrent loads,
+    all ids are fetched from the primary.
+
+    :param session: Database session dependency.
+    :type session: ReadSessionDep
+    :param wrote_recently: Client wrote within the read-your-writes window.
+    :type wrote_recently: bool
+    :param ids: Ids of the persons to retrieve, duplicates ignored.
+    :type ids: list[int]
+    :return: Found persons and ids that matched no person.
+    :rtype: PersonBatchResponse
+    :raises HTTPException:
+        - 400: Database error.
+        - 422: If ids are missing, invalid or exceed the limit.
+    """
+
+    async def load_persons(
+        person_ids: list[int],
+    ) -> dict[int, response_models.PersonResponse]:
+        rows = await db_model.person_queries.get_persons(session, person_ids)
+        return {
+            row["person_id"]: response_models.PersonResponse.model_validate(
+                dict(row)
+            )
+            for row in rows
+        }
+
+    try:
+        if wrote_recently:
+            found = await load_persons(list(dict.fromkeys(ids)))
+            persons = {person_id: found.get(person_id) for person_id in ids}
+        else:
+            persons = await cache.person_cache.get_many_or_load(
+                ids, load_persons
+            )
+    except Exception as exc_info:
+        logger.error(f"Error retrieving persons: {str(exc_info)}")
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to retrieve persons",
+        )
+    logger.debug(f"Retrieved {len(persons)} persons by ID")
+    return response_models.PersonBatchResponse(
+        persons=[person for person in persons.values() if person is not None],
+        not_found=[
+            person_id
+            for person_id, person in persons.items()
+            if person is None
+        ],
+    )
+
+
 @router.get(
     "/{person_id}",
     status_code=status.HTTP_200_OK,
@@ -52,7 +466,8 @@ router = APIRouter(prefix="/person", tags=["person"])
     },
 )
 async def get_person(
-    session: DBSessionDep,
+    session: ReadSessionDep,
+    wrote_recently: WroteRecentlyDep,
     person_id: typing.Annotated[
         int,
         Path(
@@ -64,10 +479,13 @@ async def get_person(
     ],
 ) -> response_models.PersonResponse:
     """
-    Retrieve a person by ID.
+    Retrieve a person by ID, through the person cache unless the
+    client wrote recently: then it is read from the primary.
 
     :param session: Database session dependency.
-    :type session: DBSessionDep
+    :type session: ReadSessionDep
+    :param wrote_recently: Client wrote within the read-your-writes window.
+    :type wrote_recently: bool
     :param person_id: Unique identifier of the person to retrieve.
     :type person_id: int
     :return: Details of the retrieved person.
@@ -76,18 +494,34 @@ async def get_person(
         - 400: Invalid request or database error.
         - 404: Person not found.
     """
-    try:
+
+    async def load_person() -> response_models.PersonResponse | None:
         db_person = await session.get(db_model.person_models.Person, person_id)
+        if not db_person:
+            return None
+        return response_models.PersonResponse.model_validate(
+            db_person, from_attributes=True
+        )
+
+    try:
+        if wrote_recently:
+            person = await load_person()
+        else:
+            person = await cache.person_cache.get_or_load(
+                person_id, load_person
+            )
     except Exception as exc_info:
-        logger.error(f"Error deleting person: {str(exc_info)}")
+        logger.error(f"Error retrieving person: {str(exc_info)}")
         raise HTTPException(
             status_code=400,
             detail="Failed to retrieve person",
         )
-    if not db_person:
+    if person is None:
         raise HTTPException(status_code=404, detail="Person not found")
     logger.debug(f"Retrieved person with ID: {person_id}")
-    return db_person
+    if config.PERSON_FAST_JSON:
+        return responses.PersonJSONResponse(person)
+    return person
 
 
 @router.delete(
@@ -132,18 +566,98 @@ async def delete_person(
         - 400: Invalid request or database error.
         - 404: Person not found.
     """
-    db_person = await session.get(db_model.person_models.Person, person_id)
-    if not db_person:
-        raise HTTPException(status_code=404, detail="Person not found")
-    await session.delete(db_person)
     try:
+        deleted = await db_model.person_queries.delete_persons(
+            session, [person_id]
+        )
         await session.commit()
     except Exception as exc_info:
+        await session.rollback()
         logger.error(f"Error deleting person: {str(exc_info)}")
         raise HTTPException(status_code=400, detail="Failed to delete person")
-    await session.flush()
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Person not found")
+    cache.person_cache.invalidate(person_id)
     logger.debug(f"Deleted person with ID: {person_id}")
-    return response_models.PersonDeleteResponse.model_validate(db_person)
+    return response_models.PersonDeleteResponse(person_id=person_id)
+
+
+@router.post(
+    "/bulk/delete",
+    status_code=status.HTTP_200_OK,
+    response_model=response_models.PersonBulkDeleteResponse,
+    responses={
+        200: {
+            "description": "Persons Deleted",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "deleted": 1,
+                        "person_ids": [1],
+                        "not_found": [999999],
+                    }
+                }
+            },
+        },
+        400: {
+            "description": "Invalid Request",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Failed to delete persons"}
+                }
+            },
+        },
+    },
+)
+async def delete_persons_bulk(
+    session: DBSessionDep,
+    person_ids: typing.Annotated[
+        list[typing.Annotated[int, Field(ge=1)]],
+        Body(
+            ...,
+            min_length=1,
+            max_length=config.PERSON_BULK_DELETE_MAX_ITEMS,
+            openapi_examples=request_examples.person_ids_bulk,
+        ),
+    ],
+) -> response_models.PersonBulkDeleteResponse:
+    """
+    Delete many persons at once.
+    All ids go to a single DELETE ... WHERE person_id = ANY($1) RETURNING
+    statement and one commit, so the call deletes all of them or none.
+
+    :param session: Database session dependency.
+    :type session: DBSessionDep
+    :param person_ids: Ids of the persons to delete, duplicates ignored.
+    :type person_ids: list[int]
+    :return: Deleted ids and ids that matched no person.
+    :rtype: PersonBulkDeleteResponse
+    :raises HTTPException:
+        - 400: Database error, nothing is deleted.
+        - 422: If the body is not a list of ids or exceeds the item limit.
+    """
+    requested = list(dict.fromkeys(person_ids))
+    try:
+        deleted = set(
+            await db_model.person_queries.delete_persons(session, requested)
+        )
+        await session.commit()
+    except Exception as exc_info:
+        await session.rollback()
+        logger.error(f"Error deleting persons: {str(exc_info)}")
+        raise HTTPException(status_code=400, detail="Failed to delete persons")
+    # Missing ids too, they may be cached from a stale read
+    cache.person_cache.invalidate(*requested)
+    logger.debug(f"Bulk deleted {len(deleted)} of {len(requested)} persons")
+    return response_models.PersonBulkDeleteResponse(
+        deleted=len(deleted),
+        person_ids=[
+            person_id for person_id in requested if person_id in deleted
+        ],
+        not_found=[
+            person_id for person_id in requested if person_id not in deleted
+        ],
+    )
 
 
 @router.post(
@@ -196,6 +710,22 @@ async def create_person(
         - 400: If any parameters are invalid.
         - 422: If validation fails.
     """
+    if config.PERSON_GROUP_COMMIT:
+        try:
+            row = await group_commit.writer.submit(person.model_dump())
+        except Exception as exc_info:
+            logger.error(f"Error creating person: {str(exc_info)}")
+            raise HTTPException(
+                status_code=400, detail="Failed to create person"
+            )
+        created = response_models.PersonResponse.model_validate(dict(row))
+        cache.person_cache.invalidate(created.person_id)
+        logger.debug(f"Created person: {created.model_dump()}")
+        if config.PERSON_FAST_JSON:
+            return responses.PersonJSONResponse(
+                created, status_code=status.HTTP_201_CREATED
+            )
+        return created
     db_person = db_model.person_models.Person(
         name=person.name,
         last_name=person.last_name,
@@ -212,6 +742,207 @@ async def create_person(
         logger.error(f"Error creating person: {str(exc_info)}")
         raise HTTPException(status_code=400, detail="Failed to create person")
     await session.refresh(db_person)
+    # Drops a cached "not found" for the new ID
+    cache.person_cache.invalidate(db_person.person_id)
 
     logger.debug(f"Created person: {db_person.model_dump()}")
+    if config.PERSON_FAST_JSON:
+        return responses.PersonJSONResponse(
+            response_models.PersonResponse.model_validate(
+                db_person, from_attributes=True
+            ),
+            status_code=status.HTTP_201_CREATED,
+        )
     return db_person
+
+
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    response_model=response_models.PersonBulkCreateResponse,
+    responses={
+        201: {
+            "description": "Persons Created",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "created": 1,
+                        "failed": 1,
+                        "persons": [
+                            {
+                                "person_id": 1,
+                                "name": "John",
+                                "last_name": "Doe",
+                                "age": 84,
+                                "start_date": "1920-05-18T00:00:00",
+                                "end_date": "2005-04-02T00:00:00",
+                                "description": "A remarkable individual.",
+                            }
+                        ],
+                        "errors": [
+                            {
+                                "index": 1,
+                                "errors": [
+                                    "String should have at least 1 character"
+                                ],
+                            }
+                        ],
+                    }
+                }
+            },
+        },
+    },
+)
+async def create_persons_bulk(
+    session: DBSessionDep,
+    persons: typing.Annotated[
+        list[dict[str, typing.Any]],
+        Body(
+            ...,
+            max_length=config.PERSON_BULK_MAX_ITEMS,
+            openapi_examples=request_examples.persons_bulk,
+        ),
+    ],
+    batch_size: typing.Annotated[
+        int,
+        Query(
+            ge=1,
+            le=config.PERSON_BULK_MAX_BATCH_SIZE,
+            description="Persons inserted per INSERT statement and commit.",
+        ),
+    ] = config.PERSON_BULK_BATCH_SIZE,
+) -> response_models.PersonBulkCreateResponse:
+    """
+    Create many persons at once.
+    Persons are validated column-wise in one pass,
+    with the same rules and messages as create_person.
+    Invalid ones are reported and skipped.
+    Valid ones are inserted with one multi-row INSERT ... RETURNING
+    and one commit per batch.
+
+    :param session: The database session dependency used to interact with db.
+    :type session: DBSessionDep
+    :param persons: The persons data to create.
+    :type persons: list[dict]
+    :param batch_size: Persons inserted per statement and commit.
+    :type batch_size: int
+    :return: Created persons and per-item errors.
+    :rtype: PersonBulkCreateResponse
+    :raises HTTPException:
+        - 422: If the body is not a list or exceeds the item limit.
+    """
+    validation = batch_validation.validate_persons(persons)
+    errors: list[response_models.PersonBulkItemError] = [
+        response_models.PersonBulkItemError(index=index, errors=item_errors)
+        for index, item_errors in enumerate(validation.errors)
+        if item_errors
+    ]
+    valid: list[tuple[int, dict[str, typing.Any]]] = [
+        (index, row)
+        for index, row in enumerate(validation.rows)
+        if row is not None
+    ]
+
+    created: list[response_models.PersonResponse] = []
+    for start in range(0, len(valid), batch_size):
+        end = start + batch_size
+        batch = valid[start:end]
+        try:
+            rows = await db_model.person_queries.insert_persons(
+                session, [row for _, row in batch]
+            )
+            await session.commit()
+        except Exception as exc_info:
+            await session.rollback()
+            logger.error(f"Error creating persons batch: {str(exc_info)}")
+            errors.extend(
+                response_models.PersonBulkItemError(
+                    index=index, errors=["Failed to create person"]
+                )
+                for index, _ in batch
+            )
+            continue
+        cache.person_cache.invalidate(*(row["person_id"] for row in rows))
+        created.extend(
+            response_models.PersonResponse.model_validate(dict(row))
+            for row in rows
+        )
+
+    errors.sort(key=lambda error: error.index)
+    logger.debug(f"Bulk created {len(created)} persons, {len(errors)} failed")
+    return response_models.PersonBulkCreateResponse(
+        created=len(created),
+        failed=len(errors),
+        persons=created,
+        errors=errors,
+    )
+
+
+@router.post(
+    "/import",
+    status_code=status.HTTP_201_CREATED,
+    response_model=response_models.PersonImportResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {
+                    "schema": {"type": "string", "format": "binary"},
+                    "example": (
+                        '{"name":"Jane","last_name":"Smith","age":30,'
+                        '"start_date":"1995-05-09T00:00:00"}\n'
+                    ),
+                }
+            },
+        }
+    },
+    responses={
+        201: {
+            "description": "Persons Imported",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "received": 3,
+                        "created": 2,
+                        "rejected": 1,
+                        "rejected_lines": [2],
+                        "elapsed_seconds": 0.0123,
+                        "rows_per_second": 162.6,
+                    }
+                }
+            },
+        },
+    },
+)
+async def import_persons(
+    request: Request,
+    batch_size: typing.Annotated[
+        int,
+        Query(
+            ge=1,
+            le=config.PERSON_BULK_MAX_BATCH_SIZE,
+            description="Persons inserted per INSERT statement and commit.",
+        ),
+    ] = config.PERSON_IMPORT_BATCH_SIZE,
+) -> response_models.PersonImportResponse:
+    """
+    Import persons from an NDJSON body of any size, one person per line.
+    The body is read and validated incrementally,
+    valid persons are inserted in batches while the rest is parsed.
+
+    :param request: Incoming request, its body is streamed.
+    :type request: Request
+    :param batch_size: Persons inserted per statement and commit.
+    :type batch_size: int
+    :return: Counts, rejected line numbers and throughput.
+    :rtype: PersonImportResponse
+    """
+    summary = await importer.import_persons(
+        request.stream(),
+        batch_size=batch_size,
+        queue_size=config.PERSON_IMPORT_QUEUE_SIZE,
+        max_line_bytes=config.PERSON_IMPORT_MAX_LINE_BYTES,
+        max_reported_lines=config.PERSON_IMPORT_MAX_REPORTED_LINES,
+    )
+    logger.debug(f"Imported persons: {summary}")
+    return response_models.PersonImportResponse(**summary)
@@ -0,0 +1,88 @@
+import csv
+import io
+import json
+import typing
+from datetime import datetime
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from backend.database.postgres import session as db_session
+from backend.database.postgres.person_queries import person_table
+
+"""
+Streaming export of the person table.
+Rows come from a server-side cursor in fixed-size chunks
+and every chunk is serialized on its own, so memory stays flat
+whatever the table size. No ORM object is ever built.
+"""
+
+media_types: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+columns: list[str] = list(person_table.c.keys())
+
+
+def _json_value(value: typing.Any) -> typing.Any:
+    # Same representation as PersonResponse once encoded by FastAPI
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def ndjson_chunk(rows: typing.Sequence[Row]) -> bytes:
+    return "".join(
+        json.dumps(
+            dict(zip(columns, map(_json_value, row))),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        + "\n"
+        for row in rows
+    ).encode()
+
+
+def csv_chunk(rows: typing.Sequence[Row], header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    writer.writerows(
+        [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in row
+        ]
+        for row in rows
+    )
+    return buffer.getvalue().encode()
+
+
+async def stream_persons(
+    export_format: str,
+    chunk_size: int,
+    engine: AsyncEngine | None = None,
+) -> typing.AsyncIterator[bytes]:
+    """
+    Serialize the whole person table, ordered by ID, chunk by chunk.
+    Owns its connection: dependencies are closed before a streamed
+    response body is sent.
+
+    :param export_format: "ndjson" or "csv".
+    :param chunk_size: Rows fetched per cursor round-trip.
+    :param engine: Engine to read from, the primary by default.
+    :return: Async iterator of encoded chunks.
+    """
+    if export_format == "csv":
+        yield csv_chunk([], header=True)
+    stmt = select(person_table).order_by(person_table.c.person_id)
+    async with (engine or db_session.get_engine()).connect() as conn:
+        result = await conn.stream(
+            stmt, execution_options={"yield_per": chunk_size}
+        )
+        async for rows in result.partitions():
+            if export_format == "csv":
+                yield csv_chunk(rows)
+            else:
+                yield ndjson_chunk(rows)
@@ -0,0 +1,108 @@
+import asyncio
+import contextvars
+import typing
+
+from loguru import logger
+from sqlalchemy.exc import DataError, IntegrityError
+
+from backend.api.routers.person import config
+from backend.database.postgres import person_queries
+from backend.database.postgres import session as db_session
+
+"""
+Group commit of single person inserts (PERSON_GROUP_COMMIT).
+Concurrent create_person calls of a worker queue their row here,
+the queue is written with one multi-row INSERT ... RETURNING and one
+commit (one WAL flush) when it holds max_batch rows or its oldest row
+waited max_delay seconds. When a row of the batch is rejected
+(integrity or data error), its rows are retried one by one, so every
+caller gets its own person_id or its own error. Any other failure
+(database down, pool timeout) fails the whole batch at once.
+"""
+
+Row = dict[str, typing.Any]
+
+
+class GroupCommitWriter:
+    """
+    Batches rows submitted concurrently on the event loop.
+    """
+
+    def __init__(self, max_batch: int, max_delay: float) -> None:
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._pending: list[tuple[Row, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._writes: set[asyncio.Task] = set()
+
+    async def submit(self, row: Row) -> typing.Mapping[str, typing.Any]:
+        """
+        Insert a person with the next group commit.
+
+        :param row: Column values of the person.
+        :return: Inserted row, including the generated person_id.
+        :raises Exception: The error inserting this row.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((row, future))
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self.flush)
+        # A cancelled caller does not cancel the write of the batch
+        return await asyncio.shield(future)
+
+    def flush(self) -> None:
+        """Start writing the queued rows now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        # Fresh context: the write is not part of the request that
+        # happened to flush it (query stats, correlation id)
+        task = asyncio.get_running_loop().create_task(
+            self._write(batch), context=contextvars.Context()
+        )
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def close(self) -> None:
+        """Write the queued rows and wait for every write in progress."""
+        self.flush()
+        await asyncio.gather(*self._writes, return_exceptions=True)
+
+    async def _write(self, batch: list[tuple[Row, asyncio.Future]]) -> None:
+        try:
+            async with db_session.get_engine().connect() as conn:
+                rows = await person_queries.insert_persons(
+                    conn, [row for row, _ in batch]
+                )
+                await conn.commit()
+        except Exception as exc_info:
+            if len(batch) == 1 or not isinstance(
+                exc_info, (IntegrityError, DataError)
+            ):
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc_info)
+                return
+            logger.warning(
+                f"Group commit of {len(batch)} persons failed,"
+                f" retrying one by one: {exc_info}"
+            )
+            for item in batch:
+                await self._write([item])
+            return
+        logger.debug(f"Group committed {len(rows)} persons")
+        for (_, future), row in zip(batch, rows):
+            if not future.done():
+                future.set_result(row)
+
+
+writer = GroupCommitWriter(
+    max_batch=config.PERSON_GROUP_COMMIT_MAX_BATCH,
+    max_delay=config.PERSON_GROUP_COMMIT_MAX_DELAY_MS / 1000,
+)
@@ -0,0 +1,161 @@
+import asyncio
+import dataclasses
+import time
+import typing
+
+from loguru import logger
+from pydantic import ValidationError
+
+from backend.api.routers.person import cache
+from backend.api.routers.person.models import request_models
+from backend.database.postgres import person_queries
+from backend.database.postgres import session as db_session
+
+"""
+Streaming NDJSON import of persons.
+The request body is split into lines as it arrives,
+every line is validated against PersonCreate and valid rows
+are handed in batches to a writer task through a bounded queue.
+Parsing the next chunk overlaps with inserting the previous batch,
+and a slow database blocks the parser (and so the upload)
+instead of buffering the file in memory.
+"""
+
+Batch = list[tuple[int, dict[str, typing.Any]]]
+
+
+@dataclasses.dataclass
+class ImportStats:
+    max_reported_lines: int
+    received: int = 0
+    created: int = 0
+    rejected: int = 0
+    rejected_lines: list[int] = dataclasses.field(default_factory=list)
+
+    def reject(self, line_no: int) -> None:
+        self.rejected += 1
+        if len(self.rejected_lines) < self.max_reported_lines:
+            self.rejected_lines.append(line_no)
+
+
+async def read_lines(
+    chunks: typing.AsyncIterable[bytes], max_line_bytes: int
+) -> typing.AsyncIterator[tuple[int, bytes | None]]:
+    """
+    Split a byte stream into numbered lines.
+    Memory is bounded by max_line_bytes plus one chunk:
+    longer lines are dropped and yielded as None.
+
+    :param chunks: Body chunks, in order.
+    :param max_line_bytes: Longest accepted line.
+    :return: Async iterator of (line number, line or None if too long).
+    """
+    pending = b""
+    line_no = 0
+    oversized = False
+    async for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            line_no += 1
+            too_long = oversized or len(line) > max_line_bytes
+            oversized = False
+            yield line_no, None if too_long else line
+        if len(pending) > max_line_bytes:
+            oversized = True
+            pending = b""
+    if pending or oversized:
+        line_no += 1
+        yield line_no, None if oversized else pending
+
+
+async def _write_batches(
+    queue: asyncio.Queue[Batch | None], stats: ImportStats
+) -> None:
+    async with db_session.get_engine().connect() as conn:
+        while (batch := await queue.get()) is not None:
+            try:
+                rows = await person_queries.insert_persons(
+                    conn, [row for _, row in batch]
+                )
+                await conn.commit()
+            except Exception as exc_info:
+                await conn.rollback()
+                logger.error(f"Error importing persons batch: {exc_info}")
+                for line_no, _ in batch:
+                    stats.reject(line_no)
+                continue
+            stats.created += len(rows)
+            cache.person_cache.invalidate(*(row["person_id"] for row in rows))
+
+
+async def _put(
+    queue: asyncio.Queue[Batch | None],
+    item: Batch | None,
+    writer: asyncio.Task,
+) -> None:
+    # Never wait on a full queue for a writer that is gone
+    put = asyncio.ensure_future(queue.put(item))
+    await asyncio.wait((put, writer), return_when=asyncio.FIRST_COMPLETED)
+    if not put.done():
+        put.cancel()
+        writer.result()
+        raise RuntimeError("Person import writer stopped")
+
+
+async def import_persons(
+    chunks: typing.AsyncIterable[bytes],
+    batch_size: int,
+    queue_size: int,
+    max_line_bytes: int,
+    max_reported_lines: int,
+) -> dict[str, typing.Any]:
+    """
+    Validate and insert persons from an NDJSON byte stream.
+
+    :param chunks: NDJSON body chunks, one PersonCreate per line.
+    :param batch_size: Rows per INSERT statement and commit.
+    :param queue_size: Batches buffered between parser and writer.
+    :param max_line_bytes: Longest accepted line, longer ones are rejected.
+    :param max_reported_lines: Cap of rejected line numbers reported.
+    :return: Import summary.
+    """
+    stats = ImportStats(max_reported_lines=max_reported_lines)
+    started = time.perf_counter()
+    queue: asyncio.Queue[Batch | None] = asyncio.Queue(maxsize=queue_size)
+    writer = asyncio.create_task(_write_batches(queue, stats))
+    try:
+        batch: Batch = []
+        async for line_no, line in read_lines(chunks, max_line_bytes):
+            if line is not None and not line.strip():
+                continue
+            stats.received += 1
+            if line is None:
+                stats.reject(line_no)
+                continue
+            try:
+                person = request_models.PersonCreate.model_validate_json(line)
+            except (ValidationError, TypeError):
+                # TypeError: timezone aware dates compared to naive
+                # datetime.now(), rejected like in validate_persons
+                stats.reject(line_no)
+                continue
+            batch.append((line_no, person.model_dump()))
+            if len(batch) >= batch_size:
+                await _put(queue, batch, writer)
+                batch = []
+        if batch:
+            await _put(queue, batch, writer)
+        await _put(queue, None, writer)
+        await writer
+    finally:
+        writer.cancel()
+    elapsed = time.perf_counter() - started
+    return {
+        "received": stats.received,
+        "created": stats.created,
+        "rejected": stats.rejected,
+        "rejected_lines": sorted(stats.rejected_lines),
+        "elapsed_seconds": round(elapsed, 6),
+        "rows_per_second": round(stats.created / elapsed, 2) if elapsed else 0,
+    }
@@ -0,0 +1,245 @@
+import calendar
+import dataclasses
+import re
+import typing
+from datetime import datetime
+
+from pydantic import ValidationError
+
+from backend.api.routers.person.models.request_models import PersonCreate
+
+"""
+Column-wise validation of many PersonCreate payloads at once.
+Checks every field over the whole batch against a single reference
+timestamp and computes ages without relativedelta.
+Values outside the fast path (non ASCII names, lax coercions such as
+"30" for age, timezone aware or unusual dates, missing fields) are
+handed to PersonCreate itself, so every row gets exactly the errors
+PersonCreate.model_validate would raise.
+"""
+
+# Fields without default, a missing one is left to PersonCreate
+_REQUIRED = frozenset(("name", "last_name", "age", "start_date"))
+_NAME_MAX_LENGTH = 32
+_DESCRIPTION_MAX_LENGTH = 100
+_AGE_MIN, _AGE_MAX = 0, 150
+# ASCII equivalent of the PersonCreate pattern, \s as matched by pydantic
+_NAME_RE = re.compile(r"[A-Za-z\t\n\x0b\x0c\r -]+")
+_NAME_PATTERN = r"^[A-Za-z\s-]+$"
+_DATETIME_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?"
+)
+_EMPTY_NAME = (
+    "Value error, Name cannot be empty or consist only of whitespace."
+)
+
+
+class _Fallback:
+    """Marks a value only PersonCreate itself can validate."""
+
+
+class _Invalid(str):
+    """Error message standing for an invalid value in a column."""
+
+
+_FALLBACK = _Fallback()
+
+
+@dataclasses.dataclass
+class PersonBatchValidation:
+    # PersonCreate.model_dump() of valid rows, None for invalid ones
+    rows: list[dict[str, typing.Any] | None]
+    # Error messages per row, empty for valid ones
+    errors: list[list[str]]
+
+
+def full_years(start: datetime, reference: datetime) -> int:
+    """relativedelta(reference, start).years for reference >= start."""
+    day = start.day
+    # relativedelta clips a 29th of February anniversary to the 28th
+    if start.month == 2 and day == 29 and not calendar.isleap(reference.year):
+        day = 28
+    before_anniversary = (
+        reference.month,
+        reference.day,
+        reference.hour,
+        reference.minute,
+        reference.second,
+        reference.microsecond,
+    ) < (
+        start.month,
+        day,
+        start.hour,
+        start.minute,
+        start.second,
+        start.microsecond,
+    )
+    return reference.year - start.year - before_anniversary
+
+
+def _check_name(value: typing.Any) -> typing.Any:
+    if type(value) is not str or not value.isascii():
+        return _FALLBACK
+    if not value:
+        return _Invalid("String should have at least 1 character")
+    if len(value) > _NAME_MAX_LENGTH:
+        return _Invalid(
+            f"String should have at most {_NAME_MAX_LENGTH} characters"
+        )
+    if not _NAME_RE.fullmatch(value):
+        return _Invalid(f"String should match pattern '{_NAME_PATTERN}'")
+    return value
+
+
+def _check_age(value: typing.Any) -> typing.Any:
+    if type(value) is not int:
+        return _FALLBACK
+    if value < _AGE_MIN:
+        return _Invalid(f"Input should be greater than or equal to {_AGE_MIN}")
+    if value > _AGE_MAX:
+        return _Invalid(f"Input should be less than or equal to {_AGE_MAX}")
+    return value
+
+
+def _parse_datetime(value: typing.Any) -> typing.Any:
+    if type(value) is datetime:
+        return value if value.tzinfo is None else _FALLBACK
+    if type(value) is not str or not _DATETIME_RE.fullmatch(value):
+        return _FALLBACK
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return _FALLBACK
+
+
+def _parse_end_date(value: typing.Any) -> typing.Any:
+    return None if value is None else _parse_datetime(value)
+
+
+def _check_description(value: typing.Any) -> typing.Any:
+    if value is None:
+        return None
+    if type(value) is not str:
+        return _FALLBACK
+    if len(value) > _DESCRIPTION_MAX_LENGTH:
+        return _Invalid(
+            f"String should have at most {_DESCRIPTION_MAX_LENGTH} characters"
+        )
+    return value
+
+
+# Field checks, in PersonCreate field order. Each returns the parsed value,
+# an _Invalid error message or _FALLBACK.
+_CHECKS = (
+    ("name", _check_name),
+    ("last_name", _check_name),
+    ("age", _check_age),
+    ("start_date", _parse_datetime),
+    ("end_date", _parse_end_date),
+    ("description", _check_description),
+)
+_COLUMNS = tuple(field for field, _ in _CHECKS)
+
+
+def _model_errors(
+    name: str,
+    last_name: str,
+    age: int,
+    start_date: datetime,
+    end_date: datetime | None,
+    description: str | None,
+    now: datetime,
+) -> str | None:
+    # Same checks, order and messages as PersonCreate.validate_dates_and_age
+    if not name.strip() or not last_name.strip():
+        return _EMPTY_NAME
+    if start_date > now:
+        return "Value error, start_date cannot be in the future"
+    if end_date is not None:
+        if end_date < start_date:
+            return "Value error, end_date cannot be before start_date"
+        if end_date > now:
+            return "Value error, end_date cannot be in the future"
+    precise_years = full_years(
+        start_date, end_date if end_date is not None else now
+    )
+    if precise_years != age:
+        return (
+            f"Value error, Age ({age}) does not match the difference between"
+            f" end_date (or current date) and start_date"
+            f" ({precise_years} years)"
+        )
+    if description is not None and not description.strip():
+        return "Value error, Description cannot be empty or whitespace"
+    return None
+
+
+def _validate_one(raw: typing.Any) -> tuple[dict | None, list[str]]:
+    try:
+        person = PersonCreate.model_validate(raw)
+    except ValidationError as exc_info:
+        return None, [error["msg"] for error in exc_info.errors()]
+    except TypeError as exc_info:
+        # Timezone aware dates cannot be compared to naive datetime.now(),
+        # one such row must not fail the whole batch
+        return None, [str(exc_info)]
+    return person.model_dump(), []
+
+
+def validate_persons(
+    raw_persons: typing.Sequence[typing.Any], now: datetime | None = None
+) -> PersonBatchValidation:
+    """
+    Validate many PersonCreate payloads with one reference timestamp.
+
+    :param raw_persons: Person payloads, as decoded from JSON.
+    :param now: Reference "current date", datetime.now() by default.
+    :return: Valid rows and per-row error messages, in input order.
+    """
+    now = now or datetime.now()
+    size = len(raw_persons)
+    rows: list[dict[str, typing.Any] | None] = [None] * size
+    errors: list[list[str]] = [[] for _ in range(size)]
+    fast = [
+        index
+        for index, raw in enumerate(raw_persons)
+        if type(raw) is dict and raw.keys() >= _REQUIRED
+    ]
+    fallback = set(range(size)).difference(fast)
+
+    columns = []
+    for field, check in _CHECKS:
+        column = [raw_persons[index].get(field) for index in fast]
+        # Payloads repeat names and dates, check each distinct string once
+        checked: dict[str, typing.Any] = {}
+        for position, value in enumerate(column):
+            if type(value) is str:
+                if value not in checked:
+                    checked[value] = check(value)
+                column[position] = checked[value]
+            else:
+                column[position] = check(value)
+        for index, value in zip(fast, column):
+            if value is _FALLBACK:
+                fallback.add(index)
+            elif type(value) is _Invalid:
+                errors[index].append(str(value))
+        columns.append(column)
+
+    for position, index in enumerate(fast):
+        if index in fallback or errors[index]:
+            continue
+        values = [column[position] for column in columns]
+        error = _model_errors(*values, now=now)
+        if error is not None:
+            errors[index].append(error)
+            continue
+        row = dict(zip(_COLUMNS, values))
+        if row["description"] is not None:
+            row["description"] = row["description"].strip()
+        rows[index] = row
+
+    for index in fallback:
+        errors[index].clear()
+        rows[index], errors[index] = _validate_one(raw_persons[index])
+    return PersonBatchValidation(rows=rows, errors=errors)
@@ -49,6 +49,7 @@ class PersonCreate(BaseModel):
         end_date = values.end_date
         age = values.age
         description = values.description
+        now = datetime.now()
 
         if not name:
             raise ValueError(
@@ -60,18 +61,18 @@ class PersonCreate(BaseModel):
             )
 
         # Ensure start_date is not in the future
-        if start_date > datetime.now():
+        if start_date > now:
             raise ValueError("start_date cannot be in the future")
 
         # Validate end_date if provided
         if end_date is not None:
             if end_date < start_date:
                 raise ValueError("end_date cannot be before start_date")
-            if end_date > datetime.now():
+            if end_date > now:
                 raise ValueError("end_date cannot be in the future")
 
         # Calculate age
-        reference_date = end_date if end_date is not None else datetime.now()
+        reference_date = end_date if end_date is not None else now
         precise_years = relativedelta(reference_date, start_date).years
         if precise_years != age:
             raise ValueError(
@@ -34,6 +34,28 @@ class PersonResponse(BaseModel):
     )
 
 
+class PersonPage(BaseModel):
+    items: list[PersonResponse] = Field(
+        ...,
+        description="Persons on this page.",
+    )
+    next_cursor: str | None = Field(
+        None,
+        description="Opaque cursor of the next page, or None on last page.",
+    )
+
+
+class PersonBatchResponse(BaseModel):
+    persons: list[PersonResponse] = Field(
+        ...,
+        description="Found persons, in request order.",
+    )
+    not_found: list[int] = Field(
+        ...,
+        description="Requested ids that matched no person.",
+    )
+
+
 class PersonDeleteResponse(BaseModel):
     person_id: int = Field(
         ...,
@@ -41,3 +63,66 @@ class PersonDeleteResponse(BaseModel):
     )
 
     model_config = {"from_attributes": True}
+
+
+class PersonBulkDeleteResponse(BaseModel):
+    deleted: int = Field(..., description="Number of persons deleted.")
+    person_ids: list[int] = Field(
+        ...,
+        description="Ids of the deleted persons, in request order.",
+    )
+    not_found: list[int] = Field(
+        ...,
+        description="Requested ids that matched no person.",
+    )
+
+
+class PersonBulkItemError(BaseModel):
+    index: int = Field(
+        ...,
+        description="Position of the rejected person in the request body.",
+    )
+    errors: list[str] = Field(
+        ...,
+        description="Validation or database errors for this person.",
+    )
+
+
+class PersonBulkCreateResponse(BaseModel):
+    created: int = Field(..., description="Number of persons created.")
+    failed: int = Field(..., description="Number of persons rejected.")
+    persons: list[PersonResponse] = Field(
+        ...,
+        description="Created persons, in request order.",
+    )
+    errors: list[PersonBulkItemError] = Field(
+        ...,
+        description="Rejected persons with their errors.",
+    )
+
+
+class PersonImportResponse(BaseModel):
+    received: int = Field(..., description="Non blank lines read.")
+    created: int = Field(..., description="Number of persons created.")
+    rejected: int = Field(..., description="Number of lines rejected.")
+    rejected_lines: list[int] = Field(
+        ...,
+        description="Line numbers (1-based) of rejected lines, capped.",
+    )
+    elapsed_seconds: float = Field(..., description="Import duration.")
+    rows_per_second: float = Field(..., description="Created persons/s.")
+
+
+class PersonCacheStats(BaseModel):
+    size: int = Field(..., description="Cached persons, including misses.")
+    maxsize: int = Field(..., description="Cache capacity, 0 if disabled.")
+    hits: int = Field(..., description="Lookups answered from cache.")
+    misses: int = Field(..., description="Lookups that went to DB.")
+    evictions: int = Field(..., description="Entries dropped for capacity.")
+    expirations: int = Field(..., description="Entries dropped by TTL.")
+    invalidations: int = Field(
+        ..., description="Entries dropped by create/update/delete."
+    )
+    coalesced: int = Field(
+        ..., description="Lookups that joined a load already in flight."
+    )
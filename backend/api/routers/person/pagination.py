@@ -0,0 +1,62 @@
+import base64
+import binascii
+import json
+import typing
+
+from fastapi import HTTPException, status
+
+"""
+Opaque keyset pagination cursors.
+A cursor is the url-safe base64 of the JSON encoded sort key
+of the last row on a page, so clients cannot rely on its shape.
+"""
+
+
+def encode_cursor(*values: typing.Any) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, *types: type) -> list[typing.Any]:
+    """
+    Decode a cursor created by encode_cursor.
+
+    :param cursor: Cursor received from the client.
+    :param types: Expected type of every value in the sort key.
+    :return: Sort key values.
+    :raises HTTPException:
+        - 400: Cursor is malformed or does not fit this listing.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        values = None
+    if (
+        not isinstance(values, list)
+        or len(values) != len(types)
+        or any(type(v) is not t for v, t in zip(values, types))
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+    return values
+
+
+def split_page(
+    rows: typing.Sequence[typing.Mapping[str, typing.Any]],
+    limit: int,
+    *keys: str,
+) -> tuple[typing.Sequence[typing.Mapping[str, typing.Any]], str | None]:
+    """
+    Cut rows fetched with limit + 1 down to one page.
+
+    :param rows: Rows fetched with LIMIT limit + 1.
+    :param limit: Page size.
+    :param keys: Columns of the sort key, in order.
+    :return: Page rows and the next cursor, None on the last page.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(*(rows[-1][key] for key in keys))
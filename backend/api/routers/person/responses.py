@@ -0,0 +1,26 @@
+import typing
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from backend.api.routers.person.models import response_models
+
+"""
+Response classes of the person router hot paths.
+"""
+
+person_adapter = TypeAdapter(response_models.PersonResponse)
+
+
+class PersonJSONResponse(JSONResponse):
+    """
+    Renders a PersonResponse with its precompiled pydantic-core serializer.
+    Returned directly from an endpoint it bypasses FastAPI response_model
+    handling (dump, re-validate, jsonable, json.dumps), while producing
+    the same bytes as that path.
+    """
+
+    def render(self, content: typing.Any) -> bytes:
+        if isinstance(content, response_models.PersonResponse):
+            return person_adapter.dump_json(content)
+        return super().render(content)
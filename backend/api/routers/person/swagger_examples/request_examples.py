@@ -46,3 +46,35 @@ person: dict[str, dict[str, str | dict | typing.Any]] = {
         },
     },
 }
+
+persons_bulk: dict[str, dict[str, str | list | typing.Any]] = {
+    "valid_persons": {
+        "summary": "Valid Persons",
+        "description": "Every person passes validation and gets created.",
+        "value": [
+            person["deceased_person"]["value"],
+            person["minimal_request"]["value"],
+        ],
+    },
+    "partially_invalid": {
+        "summary": "Partially Invalid Persons",
+        "description": "Second person is rejected, the first is created.",
+        "value": [
+            person["deceased_person"]["value"],
+            {**person["minimal_request"]["value"], "name": ""},
+        ],
+    },
+}
+
+person_ids_bulk: dict[str, dict[str, str | list | typing.Any]] = {
+    "existing_ids": {
+        "summary": "Existing Person IDs",
+        "description": "Every person exists and gets deleted.",
+        "value": [1, 2, 3],
+    },
+    "partially_missing": {
+        "summary": "Partially Missing Person IDs",
+        "description": "Missing ids are reported in not_found.",
+        "value": [1, 999999],
+    },
+}
@@ -0,0 +1,92 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from loguru import logger
+
+from backend.api.middleware import AccessLogMiddleware
+from backend.api.middleware.access_log import access_log_level
+from backend.loguru_logger import log_config
+
+
+@pytest.fixture
+def records():
+    captured = []
+    handler_id = logger.add(
+        lambda message: captured.append(message.record),
+        level=0,
+        filter=lambda record: "duration_ms" in record["extra"],
+    )
+    yield captured
+    logger.remove(handler_id)
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(AccessLogMiddleware)
+
+    @app.get("/ok")
+    async def ok():
+        return {"ok": True}
+
+    @app.get("/missing")
+    async def missing():
+        raise HTTPException(status_code=404)
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_access_log_single_record(records, client):
+    response = client.get("/ok", headers={"X-Request-ID": "abc"})
+
+    assert response.status_code == 200
+    assert len(records) == 1
+    extra = records[0]["extra"]
+    assert records[0]["level"].name == "INFO"
+    assert extra["method"] == "GET"
+    assert extra["path"] == "/ok"
+    assert extra["status_code"] == 200
+    assert extra["client"] == "testclient:50000"
+    assert extra["duration_ms"] >= 0
+    assert records[0]["message"].startswith("GET /ok 200 testclient:50000 ")
+
+
+def test_access_log_error_levels(records, client):
+    client.get("/missing")
+    client.get("/boom")
+
+    assert [record["extra"]["status_code"] for record in records] == [404, 501]
+    assert [record["level"].name for record in records] == [
+        log_config.http_exception,
+        log_config.unexpected_exception,
+    ]
+
+
+def test_access_log_correlation_id(records, sync_client):
+    request_id = "8b5a6a3e0b8d4e5c9f3b2a1d0c9e8f7a"
+
+    sync_client.get("/health/", headers={"X-Request-ID": request_id})
+
+    assert len(records) == 1
+    assert records[0]["extra"]["request_id"] == request_id
+    assert records[0]["extra"]["path"] == "/api/health/"
+
+
+@pytest.mark.parametrize(
+    "status_code, level",
+    [
+        (200, "INFO"),
+        (307, "INFO"),
+        (404, log_config.http_exception),
+        (422, log_config.request_validation_exception),
+        (500, log_config.handled_internal_exception),
+        (501, log_config.unexpected_exception),
+        (503, log_config.handled_internal_exception),
+    ],
+)
+def test_access_log_level(status_code, level):
+    assert access_log_level(status_code) == level
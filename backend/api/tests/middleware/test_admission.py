@@ -0,0 +1,195 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+
+from backend.api.middleware import AdmissionControlMiddleware, Limiter
+from backend.api.middleware.admission import Shed, split_connections
+
+
+def shed_count(limiter: str, reason: str) -> float:
+    value = REGISTRY.get_sample_value(
+        "admission_shed_total", {"limiter": limiter, "reason": reason}
+    )
+    return value or 0.0
+
+
+@pytest.mark.asyncio
+async def test_limiter_queues_then_sheds():
+    limiter = Limiter("test_queue", limit=1, queue_size=1, queue_timeout=1)
+    shed_before = shed_count("test_queue", "queue_full")
+
+    await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    with pytest.raises(Shed) as shed:
+        await limiter.acquire()
+
+    assert shed.value.reason == "queue_full"
+    assert limiter.stats() == {"active": 1, "queued": 1}
+    limiter.release()
+    await waiting
+    assert limiter.stats() == {"active": 1, "queued": 0}
+    limiter.release()
+    assert limiter.stats() == {"active": 0, "queued": 0}
+    assert shed_count("test_queue", "queue_full") == shed_before + 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_queue_timeout():
+    limiter = Limiter(
+        "test_timeout", limit=1, queue_size=5, queue_timeout=0.01
+    )
+    await limiter.acquire()
+
+    with pytest.raises(Shed) as shed:
+        await limiter.acquire()
+
+    assert shed.value.reason == "timeout"
+    assert limiter.stats() == {"active": 1, "queued": 0}
+
+
+@pytest.mark.asyncio
+async def test_limiter_cancelled_waiter_leaves_queue():
+    limiter = Limiter("test_cancel", limit=1, queue_size=5, queue_timeout=1)
+    await limiter.acquire()
+    cancelled = asyncio.create_task(limiter.acquire())
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+
+    limiter.release()
+    await waiting
+
+    assert cancelled.cancelled()
+    assert limiter.stats() == {"active": 1, "queued": 0}
+
+
+@pytest.mark.parametrize(
+    "connections, streams, limits",
+    [
+        (15, 2, (8, 5, 2)),
+        (15, 0, (10, 5, 0)),
+        (6, 2, (2, 2, 2)),
+        (3, 2, (1, 1, 1)),
+    ],
+)
+def test_split_connections(connections, streams, limits):
+    assert split_connections(connections, streams) == limits
+
+
+def make_client(
+    limit: int = 1, queue_size: int = 0, routes=None
+) -> httpx.AsyncClient:
+    app = FastAPI(root_path="/api")
+    release = asyncio.Event()
+    app.state.release = release
+
+    @app.get("/person/slow")
+    @app.post("/person/slow")
+    @app.get("/person/stream")
+    @app.post("/person/exempt")
+    @app.get("/health/slow")
+    async def slow():
+        await release.wait()
+        return {}
+
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        path_prefix="/person",
+        reads=Limiter("test_reads", limit, queue_size, queue_timeout=1),
+        writes=Limiter("test_writes", limit, queue_size, queue_timeout=1),
+        retry_after=3,
+        routes=routes,
+    )
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+async def saturated(client, *requests):
+    """Responses of requests sent while the slow ones hold every slot."""
+    first = [asyncio.create_task(request) for request in requests]
+    await asyncio.sleep(0.01)
+    client._transport.app.state.release.set()
+    return await asyncio.gather(*first)
+
+
+@pytest.mark.asyncio
+async def test_over_limit_gets_503_with_retry_after():
+    async with make_client() as client:
+        responses = await saturated(
+            client, client.get("/person/slow"), client.get("/person/slow")
+        )
+
+    statuses = sorted(response.status_code for response in responses)
+    assert statuses == [200, 503]
+    rejected = next(r for r in responses if r.status_code == 503)
+    assert rejected.headers["retry-after"] == "3"
+    assert rejected.json() == {"detail": "Service overloaded"}
+
+
+@pytest.mark.asyncio
+async def test_reads_writes_and_other_routes_limited_apart():
+    async with make_client() as client:
+        responses = await saturated(
+            client,
+            client.get("/person/slow"),
+            client.post("/person/slow"),
+            client.get("/health/slow"),
+            client.get("/health/slow"),
+        )
+
+    assert [response.status_code for response in responses] == [200] * 4
+
+
+@pytest.mark.asyncio
+async def test_queued_request_is_admitted_when_slot_frees():
+    async with make_client(limit=1, queue_size=1) as client:
+        responses = await saturated(
+            client, client.get("/person/slow"), client.get("/person/slow")
+        )
+
+    assert [response.status_code for response in responses] == [200, 200]
+
+
+@pytest.mark.asyncio
+async def test_limit_zero_admits_everything():
+    async with make_client(limit=0) as client:
+        responses = await saturated(
+            client, *(client.get("/person/slow") for _ in range(5))
+        )
+
+    assert {response.status_code for response in responses} == {200}
+
+
+@pytest.mark.asyncio
+async def test_routes_limited_apart_or_exempt():
+    streams = Limiter("test_streams", 1, 0, queue_timeout=1)
+    routes = {
+        ("GET", "/person/stream"): streams,
+        ("POST", "/person/exempt"): None,
+    }
+    async with make_client(routes=routes) as client:
+        responses = await saturated(
+            client,
+            client.get("/person/stream"),
+            client.get("/person/slow"),
+            client.get("/person/stream"),
+            client.post("/person/slow"),
+            client.post("/person/exempt"),
+            client.post("/person/exempt"),
+        )
+
+    # The second stream is shed, the reads limiter is not used by streams,
+    # the exempt writes pass while the writes limiter is full
+    assert [response.status_code for response in responses] == [
+        200,
+        200,
+        503,
+        200,
+        200,
+        200,
+    ]
@@ -0,0 +1,114 @@
+import asyncio
+import time
+import uuid
+
+import httpx
+import pytest
+from asgi_correlation_id import CorrelationIdMiddleware
+from fastapi import FastAPI
+from loguru import logger
+from prometheus_client import REGISTRY
+
+from backend.api.middleware import LoopLagMiddleware, LoopMonitor
+from backend.loguru_logger import log_config
+from backend.loguru_logger.logger_setup import add_level
+
+
+def lag_count(le: str | None = None) -> float:
+    if le is None:
+        return REGISTRY.get_sample_value("event_loop_lag_seconds_count") or 0.0
+    value = REGISTRY.get_sample_value(
+        "event_loop_lag_seconds_bucket", {"le": le}
+    )
+    return value or 0.0
+
+
+@pytest.fixture
+def records():
+    add_level(log_config.handled_internal_exception, 41, "<red>")
+    captured = []
+    handler_id = logger.add(
+        lambda message: captured.append(message.record),
+        level=0,
+        filter=lambda record: "blocked_ms" in record["extra"],
+    )
+    yield captured
+    logger.remove(handler_id)
+
+
+@pytest.fixture
+def monitor():
+    return LoopMonitor(interval=0.005, threshold=0.05)
+
+
+@pytest.fixture
+def client(monitor):
+    app = FastAPI()
+
+    @app.get("/blocking")
+    async def blocking():
+        time.sleep(0.2)
+        return {"ok": True}
+
+    @app.get("/awaiting")
+    async def awaiting():
+        await asyncio.sleep(0.1)
+        return {"ok": True}
+
+    app.add_middleware(LoopLagMiddleware, monitor=monitor)
+    app.add_middleware(
+        CorrelationIdMiddleware,
+        header_name="X-Request-ID",
+        generator=lambda: uuid.uuid4().hex,
+    )
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_blocking_request_reported(records, monitor, client):
+    monitor.start()
+    try:
+        async with client:
+            response = await client.get("/blocking")
+    finally:
+        await monitor.stop()
+
+    assert len(records) == 1
+    record = records[0]
+    assert record["level"].name == log_config.handled_internal_exception
+    assert record["extra"]["request_id"] == response.headers["X-Request-ID"]
+    assert record["extra"]["blocked_ms"] >= 50
+    assert "in blocking" in record["message"]
+    assert "time.sleep(0.2)" in record["message"]
+    assert monitor.request_ids == {}
+
+
+@pytest.mark.asyncio
+async def test_awaiting_request_not_reported(records, monitor, client):
+    count = lag_count()
+    monitor.start()
+    try:
+        async with client:
+            await client.get("/awaiting")
+    finally:
+        await monitor.stop()
+
+    assert records == []
+    # About one sample per 5ms over 100ms
+    assert lag_count() - count >= 5
+    assert monitor.lag < 0.05
+
+
+@pytest.mark.asyncio
+async def test_lag_recorded(monitor):
+    count, fast = lag_count(), lag_count(le="0.01")
+    monitor.start()
+    await asyncio.sleep(0.02)
+    time.sleep(0.03)
+    await asyncio.sleep(0.02)
+    await monitor.stop()
+
+    # One tick was 30ms late
+    slow = (lag_count() - count) - (lag_count(le="0.01") - fast)
+    assert slow == 1
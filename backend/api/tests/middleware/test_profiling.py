@@ -0,0 +1,108 @@
+import json
+import time
+import uuid
+
+import httpx
+import pytest
+from asgi_correlation_id import CorrelationIdMiddleware
+from fastapi import FastAPI
+
+from backend.api.middleware import ProfilingMiddleware, profiling
+
+
+def busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def make_app(tmp_path, **kwargs) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/slow")
+    async def slow():
+        busy(0.02)
+        return {"ok": True}
+
+    app.add_middleware(ProfilingMiddleware, output_dir=str(tmp_path), **kwargs)
+    app.add_middleware(
+        CorrelationIdMiddleware,
+        header_name="X-Request-ID",
+        generator=lambda: uuid.uuid4().hex,
+    )
+    return app
+
+
+async def get(app: FastAPI, **headers) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as client:
+        return await client.get("/slow", headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_header_profiles_request(tmp_path):
+    app = make_app(tmp_path, token="secret")
+
+    response = await get(app, **{"X-Profile": "secret"})
+
+    request_id = response.headers["X-Request-ID"]
+    profile = tmp_path / f"{request_id}.speedscope.json"
+    assert response.status_code == 200
+    assert [path.name for path in tmp_path.iterdir()] == [profile.name]
+    speedscope = json.loads(profile.read_text())
+    frames = [frame["name"] for frame in speedscope["shared"]["frames"]]
+    assert "busy" in frames
+
+
+@pytest.mark.asyncio
+async def test_wrong_token_is_not_profiled(tmp_path):
+    app = make_app(tmp_path, token="secret")
+
+    response = await get(app, **{"X-Profile": "guess"})
+
+    assert response.status_code == 200
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_header_ignored_without_token(tmp_path):
+    app = make_app(tmp_path)
+
+    await get(app, **{"X-Profile": ""})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_sampled_request_collapsed_format(tmp_path):
+    app = make_app(tmp_path, sample_rate=1.0, fmt="collapsed")
+
+    response = await get(app)
+
+    profile = tmp_path / f"{response.headers['X-Request-ID']}.collapsed.txt"
+    lines = profile.read_text().splitlines()
+    assert lines
+    for line in lines:
+        stack, _, microseconds = line.rpartition(" ")
+        assert stack and int(microseconds) >= 1
+    assert any(";busy (" in line for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_disabled_does_not_touch_profiler(tmp_path, mocker):
+    profiler = mocker.patch.object(profiling, "Profiler")
+    draw = mocker.patch.object(profiling.random, "random")
+    app = make_app(tmp_path)
+
+    response = await get(app, **{"X-Profile": "secret"})
+
+    assert response.status_code == 200
+    profiler.assert_not_called()
+    draw.assert_not_called()
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        ProfilingMiddleware(FastAPI(), output_dir=".", fmt="pstats")
@@ -0,0 +1,53 @@
+import re
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.middleware import QueryStatsMiddleware
+from backend.database.postgres import instrumentation
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/queries/{count}")
+    async def queries(count: int):
+        # What the engine hooks do for executed statements
+        stats = instrumentation.query_stats.get()
+        stats.count += count
+        stats.seconds += count * 0.002
+        return {}
+
+    return TestClient(app)
+
+
+def test_server_timing_header():
+    response = make_client().get("/queries/3")
+
+    timing = response.headers["server-timing"]
+    match = re.fullmatch(
+        r'db;dur=([\d.]+);desc="3 queries", app;dur=([\d.]+)', timing
+    )
+    assert match
+    assert float(match.group(1)) == 6.0
+    assert float(match.group(2)) >= 0
+
+
+def test_stats_are_per_request():
+    client = make_client()
+    client.get("/queries/3")
+
+    response = client.get("/queries/0")
+
+    assert 'desc="0 queries"' in response.headers["server-timing"]
+    assert instrumentation.query_stats.get() is None
+
+
+def test_server_timing_exposed_by_app(sync_client: TestClient):
+    response = sync_client.get(
+        "/health/", headers={"Origin": "http://example.com"}
+    )
+
+    assert response.headers["server-timing"].startswith("db;dur=0.000;")
+    assert "Server-Timing" in response.headers["access-control-expose-headers"]
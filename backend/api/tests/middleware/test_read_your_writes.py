@@ -0,0 +1,54 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from backend.api.middleware import ReadYourWritesMiddleware
+from backend.database.postgres import config, routing
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    @app.get("/read")
+    async def read():
+        return {}
+
+    @app.post("/write")
+    async def write():
+        return {}
+
+    @app.post("/fail")
+    async def fail():
+        raise HTTPException(status_code=400)
+
+    return TestClient(app)
+
+
+def test_write_marks_client(monkeypatch):
+    monkeypatch.setattr(config, "POSTGRES_REPLICA_URLS", ["replica"])
+    monkeypatch.setattr(config, "POSTGRES_READ_YOUR_WRITES_SECONDS", 5.0)
+    client = make_client()
+
+    response = client.post("/write")
+
+    written_at = response.headers[routing.LAST_WRITE_HEADER]
+    assert float(written_at) > 0
+    assert response.cookies[routing.LAST_WRITE_COOKIE] == written_at
+    assert "Max-Age=5" in response.headers["set-cookie"]
+
+
+def test_reads_and_failed_writes_not_marked(monkeypatch):
+    monkeypatch.setattr(config, "POSTGRES_REPLICA_URLS", ["replica"])
+    client = make_client()
+
+    for response in (client.get("/read"), client.post("/fail")):
+        assert routing.LAST_WRITE_HEADER not in response.headers
+        assert "set-cookie" not in response.headers
+
+
+def test_no_replicas_no_marker(monkeypatch):
+    monkeypatch.setattr(config, "POSTGRES_REPLICA_URLS", [])
+
+    response = make_client().post("/write")
+
+    assert routing.LAST_WRITE_HEADER not in response.headers
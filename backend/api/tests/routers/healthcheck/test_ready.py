@@ -0,0 +1,150 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.routers.healthcheck import readiness
+
+
+@pytest.fixture
+def conn():
+    return AsyncMock()
+
+
+@pytest.fixture
+def engine(mocker, conn):
+    """Shared engine with a pool of 10, 2 connections in use."""
+    engine = MagicMock()
+    engine.connect.return_value.__aenter__.return_value = conn
+    engine.pool.size.return_value = 10
+    engine.pool.checkedout.return_value = 2
+    engine.pool.checkedin.return_value = 3
+    engine.pool.overflow.return_value = -5
+    mocker.patch.object(readiness.db_session, "engine", engine)
+    mocker.patch.object(readiness.db_session, "read_engine", engine)
+    return engine
+
+
+@pytest.fixture
+def probe(mocker):
+    probe = readiness.ReadinessProbe(interval=0.05, timeout=0.05, max_age=1)
+    mocker.patch.object(readiness, "probe", probe)
+    return probe
+
+
+def test_ready_after_successful_probe(
+    engine, conn, probe, sync_client: TestClient
+):
+    asyncio.run(probe.check())
+
+    response = sync_client.get("/health/ready")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["ready"] is True
+    assert body["database"]["ok"] is True
+    assert body["database"]["error"] is None
+    assert body["database"]["latency_ms"] >= 0
+    assert body["pool"] == {
+        "size": 10,
+        "checked_out": 2,
+        "idle": 3,
+        "overflow": -5,
+    }
+    assert body["event_loop_lag_ms"] is None
+    conn.execute.assert_awaited_once()
+
+
+def test_not_ready_before_first_probe(engine, probe, sync_client: TestClient):
+    response = sync_client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["database"]["error"] == "not probed yet"
+
+
+def test_not_ready_when_database_fails(
+    engine, conn, probe, sync_client: TestClient
+):
+    conn.execute.side_effect = ConnectionRefusedError("connection refused")
+    asyncio.run(probe.check())
+
+    response = sync_client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.json()["database"]["ok"] is False
+    assert "ConnectionRefusedError" in response.json()["database"]["error"]
+
+
+def test_probe_times_out(engine, conn, probe):
+    async def hang(statement):
+        await asyncio.sleep(1)
+
+    conn.execute.side_effect = hang
+
+    asyncio.run(probe.check())
+
+    assert not probe.ready()
+    assert "TimeoutError" in probe.error
+    assert probe.latency < 0.5
+
+
+def test_not_ready_without_engine(mocker, probe):
+    mocker.patch.object(readiness.db_session, "engine", None)
+    mocker.patch.object(readiness.db_session, "read_engine", None)
+
+    asyncio.run(probe.check())
+
+    assert not probe.ready()
+    assert "not initialized" in probe.error
+    assert probe.snapshot()["pool"] is None
+
+
+def test_outdated_probe_is_not_ready(engine, probe):
+    asyncio.run(probe.check())
+    assert probe.ready()
+
+    probe.checked_at = time.monotonic() - 2
+
+    assert not probe.ready()
+
+
+def test_endpoint_does_not_query_database(
+    engine, conn, probe, sync_client: TestClient
+):
+    asyncio.run(probe.check())
+
+    for _ in range(20):
+        assert sync_client.get("/health/ready").status_code == 200
+
+    conn.execute.assert_awaited_once()
+
+
+def test_background_probe_runs_once_per_interval(engine, conn, probe):
+    async def main():
+        probe.start()
+        probe.start()
+        await asyncio.sleep(0.12)
+        await probe.stop()
+
+    asyncio.run(main())
+
+    # Immediately, then after 0.05 and 0.1 seconds
+    assert 2 <= conn.execute.await_count <= 3
+    assert probe.ready()
+
+
+def test_reports_loop_monitor_lag(engine, probe, mocker):
+    monitor = readiness.loop_lag.LoopMonitor(interval=0.005, threshold=1)
+    mocker.patch.object(readiness.loop_lag, "monitor", monitor)
+
+    async def main():
+        monitor.start()
+        await asyncio.sleep(0.02)
+        monitor.lag = 0.0123
+        snapshot = probe.snapshot()
+        await monitor.stop()
+        return snapshot
+
+    assert asyncio.run(main())["event_loop_lag_ms"] == 12.3
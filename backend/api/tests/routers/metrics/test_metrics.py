@@ -0,0 +1,181 @@
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from backend.api.middleware import MetricsMiddleware
+from backend.database.postgres import instrumentation
+
+repo_root = Path(__file__).resolve().parents[5]
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def mock_session(mocker):
+    async_mock = AsyncMock()
+    async_mock.__aenter__.return_value = async_mock
+    async_mock.__aexit__.return_value = None
+    mocker.patch(
+        "backend.database.postgres.session.session_factory",
+        return_value=async_mock,
+    )
+    return async_mock
+
+
+def test_metrics_endpoint(sync_client: TestClient):
+    sync_client.get("/health/")
+
+    response = sync_client.get("/metrics/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "http_requests_total" in response.text
+    assert "http_request_duration_seconds_bucket" in response.text
+    assert "http_request_db_seconds_bucket" in response.text
+    assert "http_requests_in_progress" in response.text
+
+
+def test_requests_labelled_by_route_template(
+    mock_session, sync_client: TestClient
+):
+    labels = dict(method="GET", route="/person/{person_id}")
+    found = sample("http_requests_total", status="404", **labels)
+    latency = sample("http_request_duration_seconds_count", **labels)
+    mock_session.get = AsyncMock(return_value=None)
+
+    sync_client.get("/person/123456")
+    sync_client.get("/person/654321")
+
+    assert sample("http_requests_total", status="404", **labels) == found + 2
+    assert (
+        sample("http_request_duration_seconds_count", **labels) == latency + 2
+    )
+    assert sample("http_requests_in_progress") == 0
+
+
+def test_unmatched_paths_share_one_label(sync_client: TestClient):
+    labels = dict(method="GET", route="unmatched", status="404")
+    before = sample("http_requests_total", **labels)
+
+    sync_client.get("/no/such/path/1")
+    sync_client.get("/no/such/path/2")
+
+    assert sample("http_requests_total", **labels) == before + 2
+
+
+def test_unhandled_exception_counted_as_501():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics-test/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    labels = dict(method="GET", route="/metrics-test/boom")
+    before = sample("http_requests_total", status="501", **labels)
+
+    client = TestClient(app, raise_server_exceptions=False)
+    client.get("/metrics-test/boom")
+
+    # What the app's generic exception handler answers and
+    # AccessLogMiddleware logs
+    assert sample("http_requests_total", status="501", **labels) == before + 1
+    assert sample("http_requests_total", status="500", **labels) == 0
+
+
+def test_db_time_recorded(mock_session, sync_client: TestClient):
+    labels = dict(method="GET", route="/person/{person_id}")
+    before = sample("http_request_db_seconds_sum", **labels)
+
+    async def get(*args):
+        # What the engine hooks do for one executed statement
+        stats = instrumentation.query_stats.get()
+        stats.count += 1
+        stats.seconds += 0.25
+        return None
+
+    mock_session.get = AsyncMock(side_effect=get)
+
+    sync_client.get("/person/1")
+
+    assert sample("http_request_db_seconds_sum", **labels) == pytest.approx(
+        before + 0.25
+    )
+
+
+def test_multiprocess_metrics_are_summed(tmp_path):
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    worker = textwrap.dedent(
+        """
+        from backend.api.middleware.metrics import REQUESTS
+        REQUESTS.labels("GET", "/health/", "200").inc(3)
+        """
+    )
+    for _ in range(2):
+        subprocess.run(
+            [sys.executable, "-c", worker], env=env, cwd=repo_root, check=True
+        )
+    collect = textwrap.dedent(
+        """
+        from backend.api.routers.metrics.endpoints import collect_metrics
+        print(collect_metrics().decode())
+        """
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", collect],
+        env=env,
+        cwd=repo_root,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    assert (
+        'http_requests_total{method="GET",route="/health/",status="200"} 6.0'
+        in output
+    )
+
+
+def test_gunicorn_conf_selects_multiprocess_values():
+    # Fresh interpreter without the env var, like a gunicorn master
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if name != "PROMETHEUS_MULTIPROC_DIR"
+    }
+    master = textwrap.dedent(
+        """
+        import os
+        from backend.api import gunicorn_conf
+        from prometheus_client import values
+        print(values.ValueClass.__name__, flush=True)
+        pid = os.fork()
+        if pid == 0:
+            print(values.ValueClass.__name__, flush=True)
+            os._exit(0)
+        os.waitpid(pid, 0)
+        """
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", master],
+        env=env,
+        cwd=repo_root,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    # Master, then the forked worker
+    assert output.split() == ["MmapedValue", "MmapedValue"]
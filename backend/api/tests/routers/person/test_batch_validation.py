@@ -0,0 +1,156 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from dateutil.relativedelta import relativedelta
+from pydantic import ValidationError
+
+from backend.api.routers.person.models import batch_validation
+from backend.api.routers.person.models.request_models import PersonCreate
+
+start_date = datetime(1990, 5, 9)
+age = relativedelta(datetime.now(), start_date).years
+valid_person_data = {
+    "name": "Jane",
+    "last_name": "Smith",
+    "age": age,
+    "start_date": start_date.isoformat(),
+    "end_date": None,
+    "description": "  An inspiring leader.  ",
+}
+
+
+def model_result(raw):
+    try:
+        person = PersonCreate.model_validate(raw)
+    except ValidationError as exc_info:
+        return None, [error["msg"] for error in exc_info.errors()]
+    return person.model_dump(), []
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {},
+        {"name": ""},
+        {"name": "   "},
+        {"name": "J" * 33},
+        {"name": "J4ne"},
+        {"name": "J4ne" * 9, "last_name": ""},
+        {"name": "Zoë"},
+        {"name": 5},
+        {"age": -1},
+        {"age": 151},
+        {"age": age + 1},
+        {"age": str(age)},
+        {"age": True},
+        {"age": 30.0},
+        {"start_date": "1990-05-09"},
+        {"start_date": "1990-13-09"},
+        {"start_date": "not a date"},
+        {"start_date": (datetime.now() + timedelta(days=1)).isoformat()},
+        {"end_date": "1980-01-01T00:00:00"},
+        {"end_date": "2000-05-08T23:59:59", "age": 9},
+        {"end_date": "2000-05-09T00:00:00", "age": 10},
+        {"description": None},
+        {"description": "   "},
+        {"description": "d" * 101},
+        {"description": 5},
+        {"name": "J4ne", "age": 151, "description": "d" * 101},
+    ],
+)
+def test_validate_persons_matches_person_create(changes):
+    raw = {**valid_person_data, **changes}
+
+    validation = batch_validation.validate_persons([raw])
+
+    assert (validation.rows[0], validation.errors[0]) == model_result(raw)
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        None,
+        [],
+        "person",
+        {
+            key: value
+            for key, value in valid_person_data.items()
+            if key != "age"
+        },
+    ],
+)
+def test_validate_persons_malformed_items(raw):
+    validation = batch_validation.validate_persons([raw])
+
+    assert validation.rows == [None]
+    assert validation.errors == [model_result(raw)[1]]
+
+
+def test_validate_persons_timezone_aware_date():
+    # PersonCreate raises TypeError here, the batch reports it per row
+    raw = {**valid_person_data, "start_date": "1990-05-09T00:00:00Z"}
+
+    validation = batch_validation.validate_persons([raw, valid_person_data])
+
+    assert validation.rows[0] is None
+    assert validation.errors[0] == [
+        "can't compare offset-naive and offset-aware datetimes"
+    ]
+    assert validation.rows[1] is not None
+
+
+def test_validate_persons_keeps_input_order():
+    invalid = {**valid_person_data, "age": -1}
+    raw_persons = [valid_person_data, invalid, None, valid_person_data]
+
+    validation = batch_validation.validate_persons(raw_persons)
+
+    assert [row is not None for row in validation.rows] == [
+        True,
+        False,
+        False,
+        True,
+    ]
+    assert validation.rows[0]["description"] == "An inspiring leader."
+    assert validation.errors[1] == [
+        "Input should be greater than or equal to 0"
+    ]
+
+
+def test_validate_persons_single_reference_timestamp():
+    now = datetime(2020, 5, 9)
+    raw_persons = [
+        {**valid_person_data, "age": 30},
+        {**valid_person_data, "age": 29},
+    ]
+
+    validation = batch_validation.validate_persons(raw_persons, now=now)
+
+    assert validation.rows[0] is not None
+    assert validation.errors[1] == [
+        "Value error, Age (29) does not match the difference between"
+        " end_date (or current date) and start_date (30 years)"
+    ]
+
+
+def test_full_years_matches_relativedelta():
+    rng = random.Random(8)
+    pairs = [
+        (datetime(2000, 2, 29), datetime(2001, 2, 28)),
+        (datetime(2000, 2, 29), datetime(2004, 2, 28, 23, 59)),
+        (datetime(2000, 2, 29, 12), datetime(2001, 2, 28, 11)),
+        (datetime(1999, 3, 1), datetime(2000, 2, 29)),
+    ]
+    for _ in range(5000):
+        start = datetime(1900, 1, 1) + timedelta(
+            seconds=rng.randrange(130 * 365 * 86400)
+        )
+        reference = start + timedelta(seconds=rng.randrange(60 * 365 * 86400))
+        pairs.append((start, reference))
+
+    for start, reference in pairs:
+        assert (
+            batch_validation.full_years(start, reference)
+            == relativedelta(reference, start).years
+        )
@@ -30,7 +30,7 @@ def mock_session(mocker):
     async_mock.__aenter__.return_value = async_mock
     async_mock.__aexit__.return_value = None
     mocker.patch(
-        "backend.database.postgres.session.DbContext",
+        "backend.database.postgres.session.session_factory",
         return_value=async_mock,
     )
     return async_mock
@@ -0,0 +1,148 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import fastapi
+import pytest
+from dateutil.relativedelta import relativedelta
+from fastapi.testclient import TestClient
+
+# Test data
+start_date = datetime(1990, 5, 9)
+valid_person_data = {
+    "name": "Jane",
+    "last_name": "Smith",
+    "age": relativedelta(datetime.now(), start_date).years,
+    "start_date": start_date.isoformat(),
+    "end_date": None,
+    "description": "An inspiring leader.",
+}
+
+
+def inserted_rows(params):
+    return [
+        {
+            "person_id": person_id,
+            **row,
+        }
+        for person_id, row in enumerate(params, start=1)
+    ]
+
+
+@pytest.fixture
+def mock_session(mocker):
+    async_mock = AsyncMock()
+    async_mock.__aenter__.return_value = async_mock
+    async_mock.__aexit__.return_value = None
+    mocker.patch(
+        "backend.database.postgres.session.session_factory",
+        return_value=async_mock,
+    )
+
+    async def execute(stmt, params):
+        result = Mock()
+        result.mappings.return_value.all.return_value = inserted_rows(params)
+        return result
+
+    async_mock.execute = AsyncMock(side_effect=execute)
+    async_mock.commit = AsyncMock()
+    async_mock.rollback = AsyncMock()
+    return async_mock
+
+
+@pytest.mark.asyncio
+async def test_create_persons_bulk(mock_session, sync_client: TestClient):
+    response = sync_client.post(
+        url="/person/bulk",
+        json=[valid_person_data] * 3,
+    )
+
+    assert response.status_code == fastapi.status.HTTP_201_CREATED
+    mock_session.execute.assert_called_once()
+    mock_session.commit.assert_called_once()
+    body = response.json()
+    assert body["created"] == 3
+    assert body["failed"] == 0
+    assert body["errors"] == []
+    assert [person["person_id"] for person in body["persons"]] == [1, 2, 3]
+    assert body["persons"][0]["start_date"] == valid_person_data["start_date"]
+
+
+@pytest.mark.asyncio
+async def test_create_persons_bulk_batches(
+    mock_session, sync_client: TestClient
+):
+    response = sync_client.post(
+        url="/person/bulk?batch_size=2",
+        json=[valid_person_data] * 5,
+    )
+
+    assert response.status_code == fastapi.status.HTTP_201_CREATED
+    assert mock_session.execute.call_count == 3
+    assert mock_session.commit.call_count == 3
+    assert response.json()["created"] == 5
+
+
+@pytest.mark.asyncio
+async def test_create_persons_bulk_reports_invalid_items(
+    mock_session, sync_client: TestClient
+):
+    invalid_name = {**valid_person_data, "name": ""}
+    invalid_age = {**valid_person_data, "age": -1}
+    response = sync_client.post(
+        url="/person/bulk",
+        json=[valid_person_data, invalid_name, valid_person_data, invalid_age],
+    )
+
+    assert response.status_code == fastapi.status.HTTP_201_CREATED
+    (_, params), _ = mock_session.execute.call_args
+    assert len(params) == 2
+    body = response.json()
+    assert body["created"] == 2
+    assert body["failed"] == 2
+    assert body["errors"] == [
+        {"index": 1, "errors": ["String should have at least 1 character"]},
+        {"index": 3, "errors": ["Input should be greater than or equal to 0"]},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_persons_bulk_db_error(
+    mock_session, sync_client: TestClient
+):
+    mock_session.execute = AsyncMock(side_effect=Exception("Database error"))
+    response = sync_client.post(
+        url="/person/bulk?batch_size=1",
+        json=[valid_person_data] * 2,
+    )
+
+    assert response.status_code == fastapi.status.HTTP_201_CREATED
+    assert mock_session.rollback.call_count == 2
+    assert response.json() == {
+        "created": 0,
+        "failed": 2,
+        "persons": [],
+        "errors": [
+            {"index": 0, "errors": ["Failed to create person"]},
+            {"index": 1, "errors": ["Failed to create person"]},
+        ],
+    }
+
+
+def test_create_persons_bulk_not_a_list(sync_client: TestClient):
+    response = sync_client.post(url="/person/bulk", json=valid_person_data)
+    assert response.status_code == 422
+    assert response.json() == {
+        "detail": "Request validation failed",
+        "message": "Input should be a valid list",
+    }
+
+
+def test_create_persons_bulk_invalid_batch_size(sync_client: TestClient):
+    response = sync_client.post(
+        url="/person/bulk?batch_size=0", json=[valid_person_data]
+    )
+    assert response.status_code == 422
+    assert (
+        response.json()["message"]
+        == "Input should be greater than or equal to 1"
+    )
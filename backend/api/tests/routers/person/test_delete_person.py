@@ -1,60 +1,67 @@
-from datetime import datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import fastapi
 import pytest
 from fastapi.testclient import TestClient
 
-from backend.database.postgres.person_models import Person
-
 # Test data
 valid_person_id = 1
 non_existent_person_id = 999
 
 
+def deleted_result(person_ids):
+    result = Mock()
+    result.scalars.return_value.all.return_value = list(person_ids)
+    return result
+
+
 @pytest.fixture
 def mock_session(mocker):
     async_mock = AsyncMock()
     async_mock.__aenter__.return_value = async_mock
     async_mock.__aexit__.return_value = None  # Mock the context manager exit
     mocker.patch(
-        "backend.database.postgres.session.DbContext",
+        "backend.database.postgres.session.session_factory",
         return_value=async_mock,
     )
+    async_mock.commit = AsyncMock()
+    async_mock.rollback = AsyncMock()
     return async_mock
 
 
+def existing(*person_ids):
+    """execute side effect deleting the given ids when requested."""
+
+    async def execute(stmt, params):
+        return deleted_result(
+            person_id
+            for person_id in params["person_ids"]
+            if person_id in person_ids
+        )
+
+    return AsyncMock(side_effect=execute)
+
+
 @pytest.mark.asyncio
-async def test_delete_person(mock_session, mocker, sync_client: TestClient):
+async def test_delete_person(mock_session, sync_client: TestClient):
     status_code = fastapi.status.HTTP_200_OK
     person_id = valid_person_id
-
-    # Mock the Person object returned by session.get
-    mock_person = Person(
-        person_id=person_id,
-        name="Jane",
-        lastname="Smith",
-        age=30,
-        start_date=datetime(1995, 5, 9),
-        end_date=None,
-        description="An inspiring leader.",
-    )
-
-    # Mock session methods
-    mock_session.get = AsyncMock(return_value=mock_person)
-    mock_session.delete = AsyncMock()
-    mock_session.commit = AsyncMock()
-    mock_session.flush = AsyncMock()
+    mock_session.execute = existing(person_id)
 
     response = sync_client.delete(
         url=f"/person/{person_id}",
     )
 
     assert response.status_code == status_code
-    mock_session.get.assert_called_once_with(Person, person_id)
-    mock_session.delete.assert_called_once_with(mock_person)
+    # One DELETE ... RETURNING, no load of the row beforehand
+    mock_session.execute.assert_called_once()
+    stmt, params = mock_session.execute.call_args.args
+    assert "DELETE FROM person" in str(stmt)
+    assert "RETURNING person.person_id" in str(stmt)
+    assert params == {"person_ids": [person_id]}
+    mock_session.get.assert_not_called()
+    mock_session.flush.assert_not_called()
     mock_session.commit.assert_called_once()
-    mock_session.flush.assert_called_once()
 
     # Verify response matches PersonDeleteResponse
     assert response.json() == {"person_id": person_id}
@@ -63,9 +70,7 @@ async def test_delete_person(mock_session, mocker, sync_client: TestClient):
 @pytest.mark.asyncio
 async def test_delete_person_not_found(mock_session, sync_client: TestClient):
     person_id = non_existent_person_id
-
-    # Mock session.get to return None (person not found)
-    mock_session.get = AsyncMock(return_value=None)
+    mock_session.execute = existing()
 
     response = sync_client.delete(
         url=f"/person/{person_id}",
@@ -73,38 +78,21 @@ async def test_delete_person_not_found(mock_session, sync_client: TestClient):
 
     assert response.status_code == 404
     assert response.json() == {"detail": "Person not found"}
-    mock_session.get.assert_called_once_with(Person, person_id)
-    # Ensure no delete, commit, or flush calls were made
-    assert (
-        not hasattr(mock_session, "delete") or not mock_session.delete.called
-    )
-    assert (
-        not hasattr(mock_session, "commit") or not mock_session.commit.called
-    )
-    assert not hasattr(mock_session, "flush") or not mock_session.flush.called
+    mock_session.execute.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_delete_person_db_error(mock_session, sync_client: TestClient):
     person_id = valid_person_id
-    mock_person = Person(
-        person_id=person_id,
-        name="Jane",
-        lastname="Smith",
-        age=30,
-        start_date=datetime.now(),
-    )
-    mock_session.get = AsyncMock(return_value=mock_person)
-    mock_session.delete = AsyncMock()
+    mock_session.execute = existing(person_id)
     mock_session.commit = AsyncMock(
         side_effect=Exception("Foreign key constraint")
     )
     response = sync_client.delete(url=f"/person/{person_id}")
     assert response.status_code == 400
     assert response.json() == {"detail": "Failed to delete person"}
-    mock_session.get.assert_called_once_with(Person, person_id)
-    mock_session.delete.assert_called_once_with(mock_person)
     mock_session.commit.assert_called_once()
+    mock_session.rollback.assert_called_once()
 
 
 def test_delete_person_invalid_id(sync_client: TestClient):
@@ -115,3 +103,46 @@ def test_delete_person_invalid_id(sync_client: TestClient):
         response.json()["message"]
         == "Input should be greater than or equal to 1"
     )
+
+
+def test_delete_persons_bulk(mock_session, sync_client: TestClient):
+    mock_session.execute = existing(1, 3, 5)
+
+    response = sync_client.post("/person/bulk/delete", json=[5, 2, 3, 5, 4, 1])
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "deleted": 3,
+        "person_ids": [5, 3, 1],
+        "not_found": [2, 4],
+    }
+    # Duplicates dropped, a single statement for every id
+    mock_session.execute.assert_called_once()
+    _, params = mock_session.execute.call_args.args
+    assert params == {"person_ids": [5, 2, 3, 4, 1]}
+    mock_session.commit.assert_called_once()
+
+
+def test_delete_persons_bulk_db_error(mock_session, sync_client: TestClient):
+    mock_session.execute = AsyncMock(side_effect=Exception("Lock timeout"))
+
+    response = sync_client.post("/person/bulk/delete", json=[1, 2])
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Failed to delete persons"}
+    mock_session.rollback.assert_called_once()
+    mock_session.commit.assert_not_called()
+
+
+@pytest.mark.parametrize("body", [[], [0], ["x"], {"person_ids": [1]}])
+def test_delete_persons_bulk_invalid_body(body, sync_client: TestClient):
+    response = sync_client.post("/person/bulk/delete", json=body)
+    assert response.status_code == 422
+
+
+def test_delete_persons_bulk_too_many(sync_client: TestClient):
+    response = sync_client.post(
+        "/person/bulk/delete",
+        json=list(range(1, 10002)),
+    )
+    assert response.status_code == 422
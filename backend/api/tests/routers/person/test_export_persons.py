@@ -0,0 +1,84 @@
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+rows = [
+    (
+        1,
+        "Jane",
+        "Smith",
+        30,
+        datetime(1995, 5, 9),
+        None,
+        "An inspiring leader.",
+    ),
+    (2, "John", "Doe", 84, datetime(1920, 5, 18), datetime(2005, 4, 2), None),
+    (3, "Zoë", "O-Neil", 1, datetime(2024, 1, 1, 12, 30), None, 'Says "hi"'),
+]
+
+
+@pytest.fixture
+def mock_engine(mocker):
+    conn = MagicMock()
+
+    async def partitions():
+        yield rows[:2]
+        yield rows[2:]
+
+    conn.stream = AsyncMock(
+        return_value=MagicMock(partitions=MagicMock(side_effect=partitions))
+    )
+
+    @asynccontextmanager
+    async def connect():
+        yield conn
+
+    engine = MagicMock(connect=connect)
+    mocker.patch("backend.database.postgres.session.engine", engine)
+    return conn
+
+
+def test_export_persons_ndjson(mock_engine, sync_client: TestClient):
+    response = sync_client.get(url="/person/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.text.splitlines() == [
+        '{"person_id":1,"name":"Jane","last_name":"Smith","age":30,'
+        '"start_date":"1995-05-09T00:00:00","end_date":null,'
+        '"description":"An inspiring leader."}',
+        '{"person_id":2,"name":"John","last_name":"Doe","age":84,'
+        '"start_date":"1920-05-18T00:00:00",'
+        '"end_date":"2005-04-02T00:00:00","description":null}',
+        '{"person_id":3,"name":"Zoë","last_name":"O-Neil","age":1,'
+        '"start_date":"2024-01-01T12:30:00","end_date":null,'
+        '"description":"Says \\"hi\\""}',
+    ]
+    _, kwargs = mock_engine.stream.call_args
+    assert kwargs["execution_options"]["yield_per"] > 0
+
+
+def test_export_persons_csv(mock_engine, sync_client: TestClient):
+    response = sync_client.get(url="/person/export?format=csv")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == (
+        'attachment; filename="persons.csv"'
+    )
+    assert response.text.split("\r\n") == [
+        "person_id,name,last_name,age,start_date,end_date,description",
+        "1,Jane,Smith,30,1995-05-09T00:00:00,,An inspiring leader.",
+        "2,John,Doe,84,1920-05-18T00:00:00,2005-04-02T00:00:00,",
+        '3,Zoë,O-Neil,1,2024-01-01T12:30:00,,"Says ""hi"""',
+        "",
+    ]
+
+
+def test_export_persons_invalid_format(sync_client: TestClient):
+    response = sync_client.get(url="/person/export?format=xml")
+    assert response.status_code == 422
+    assert response.json()["message"] == "Input should be 'ndjson' or 'csv'"
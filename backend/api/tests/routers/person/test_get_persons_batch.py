@@ -0,0 +1,216 @@
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api import app as app_module
+from backend.api.app import app
+from backend.api.routers.person import cache
+from backend.database.postgres import config, routing
+from backend.database.postgres.person_models import Person
+
+
+def person_row(person_id):
+    return {
+        "person_id": person_id,
+        "name": "Jane",
+        "last_name": "Smith",
+        "age": 30,
+        "start_date": datetime(1995, 5, 9),
+        "end_date": None,
+        "description": None,
+    }
+
+
+@pytest.fixture
+def mock_session(mocker):
+    async_mock = AsyncMock()
+    async_mock.__aenter__.return_value = async_mock
+    async_mock.__aexit__.return_value = None
+    mocker.patch(
+        "backend.database.postgres.session.session_factory",
+        return_value=async_mock,
+    )
+    return async_mock
+
+
+def existing(*person_ids, delay=0.0):
+    """execute side effect selecting the given ids when requested."""
+
+    async def execute(stmt, params):
+        await asyncio.sleep(delay)
+        result = Mock()
+        result.mappings.return_value.all.return_value = [
+            person_row(person_id)
+            for person_id in params["person_ids"]
+            if person_id in person_ids
+        ]
+        return result
+
+    return AsyncMock(side_effect=execute)
+
+
+def test_get_persons_batch(mock_session, sync_client: TestClient):
+    mock_session.execute = existing(1, 3)
+
+    response = sync_client.get("/person/batch?ids=3&ids=2&ids=1&ids=3")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [person["person_id"] for person in body["persons"]] == [3, 1]
+    assert body["not_found"] == [2]
+    # One WHERE person_id = ANY($1) query for every id
+    mock_session.execute.assert_called_once()
+    stmt, params = mock_session.execute.call_args.args
+    assert "person.person_id = ANY" in str(stmt)
+    assert params == {"person_ids": [3, 2, 1]}
+
+
+def test_get_persons_batch_uses_cache(mock_session, sync_client: TestClient):
+    mock_session.get = AsyncMock(return_value=Person(**person_row(1)))
+    mock_session.execute = existing(1, 2)
+    sync_client.get("/person/1")
+
+    response = sync_client.get("/person/batch?ids=1&ids=2")
+
+    assert [p["person_id"] for p in response.json()["persons"]] == [1, 2]
+    _, params = mock_session.execute.call_args.args
+    assert params == {"person_ids": [2]}
+
+
+def test_get_persons_batch_db_error(mock_session, sync_client: TestClient):
+    mock_session.execute = AsyncMock(side_effect=Exception("Connection lost"))
+
+    response = sync_client.get("/person/batch?ids=1")
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Failed to retrieve persons"}
+
+
+@pytest.mark.parametrize(
+    "query", ["", "?ids=0", "?ids=x", "?" + "&".join(["ids=1"] * 1001)]
+)
+def test_get_persons_batch_invalid_ids(query, sync_client: TestClient):
+    response = sync_client.get(f"/person/batch{query}")
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("url", ["/person/7", "/person/batch?ids=7"])
+async def test_concurrent_identical_requests_share_one_query(
+    url, mock_session, mocker
+):
+    # Cache off, so only coalescing of in-flight loads can save queries
+    mocker.patch.object(cache.person_cache, "maxsize", 0)
+    # and every request in flight at once
+    mocker.patch.object(app_module.person_reads, "limit", 0)
+
+    async def get(model, person_id):
+        await asyncio.sleep(0.05)
+        return Person(**person_row(person_id))
+
+    mock_session.get = AsyncMock(side_effect=get)
+    mock_session.execute = existing(7, delay=0.05)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as client:
+        responses = await asyncio.gather(*(client.get(url) for _ in range(20)))
+
+    assert {response.status_code for response in responses} == {200}
+    assert len({response.content for response in responses}) == 1
+    assert mock_session.get.await_count + mock_session.execute.await_count == 1
+    assert cache.person_cache.stats()["coalesced"] >= 19
+
+
+@pytest.fixture
+def replicas_configured(mocker):
+    # Writes are only marked with replicas, reads still go to the mock
+    mocker.patch.object(config, "POSTGRES_REPLICA_URLS", ["replica"])
+
+
+def last_write(seconds_ago: float) -> dict[str, str]:
+    return {routing.LAST_WRITE_HEADER: f"{time.time() - seconds_ago:.3f}"}
+
+
+def db_reads(mock_session) -> int:
+    return mock_session.get.await_count + mock_session.execute.await_count
+
+
+@pytest.mark.parametrize("url", ["/person/1", "/person/batch?ids=1&ids=1"])
+def test_recent_writer_skips_cache(
+    url, replicas_configured, mock_session, sync_client: TestClient
+):
+    mock_session.get = AsyncMock(return_value=Person(**person_row(1)))
+    mock_session.execute = existing(1)
+    sync_client.get(url)
+    assert db_reads(mock_session) == 1
+
+    # Outside the read-your-writes window the cache answers
+    assert sync_client.get(url, headers=last_write(60)).status_code == 200
+    assert db_reads(mock_session) == 1
+    # Inside it the person is read again
+    response = sync_client.get(url, headers=last_write(0))
+    assert response.status_code == 200
+    assert db_reads(mock_session) == 2
+
+
+def test_recent_writer_batch_not_found(
+    replicas_configured, mock_session, sync_client: TestClient
+):
+    mock_session.execute = existing(1)
+
+    response = sync_client.get(
+        "/person/batch?ids=2&ids=1&ids=2", headers=last_write(0)
+    )
+
+    assert [p["person_id"] for p in response.json()["persons"]] == [1]
+    assert response.json()["not_found"] == [2]
+    _, params = mock_session.execute.call_args.args
+    assert params == {"person_ids": [2, 1]}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("url", ["/person/7", "/person/batch?ids=7"])
+async def test_recent_writer_does_not_join_inflight_load(
+    url, replicas_configured, mock_session, mocker
+):
+    mocker.patch.object(app_module.person_reads, "limit", 0)
+
+    async def get(model, person_id):
+        await asyncio.sleep(0.05)
+        return Person(**person_row(person_id))
+
+    mock_session.get = AsyncMock(side_effect=get)
+    mock_session.execute = existing(7, delay=0.05)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as client:
+        responses = await asyncio.gather(
+            client.get(url),
+            client.get(url),
+            client.get(url, headers=last_write(0)),
+        )
+
+    assert {response.status_code for response in responses} == {200}
+    # One shared load and the writer's own
+    assert db_reads(mock_session) == 2
+
+
+def test_marker_without_replicas_uses_cache(
+    mock_session, sync_client: TestClient
+):
+    mock_session.get = AsyncMock(return_value=Person(**person_row(1)))
+    sync_client.get("/person/1")
+
+    response = sync_client.get("/person/1", headers=last_write(0))
+
+    assert response.status_code == 200
+    assert mock_session.get.await_count == 1
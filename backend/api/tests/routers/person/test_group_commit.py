@@ -0,0 +1,186 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from asgi_correlation_id import correlation_id
+from dateutil.relativedelta import relativedelta
+from sqlalchemy.exc import DataError, OperationalError
+
+from backend.api.app import app
+from backend.api.routers.person import config, group_commit
+from backend.database.postgres import instrumentation
+
+start_date = datetime(1990, 5, 9)
+
+
+def person_data(name="Jane"):
+    return {
+        "name": name,
+        "last_name": "Smith",
+        "age": relativedelta(datetime.now(), start_date).years,
+        "start_date": start_date,
+        "end_date": None,
+        "description": None,
+    }
+
+
+@pytest.fixture
+def inserts(mocker):
+    """Inserted batches, person_ids are numbered across them."""
+    batches = []
+
+    async def insert_persons(conn, rows):
+        await asyncio.sleep(0)
+        if any(row["name"] == "Bad" for row in rows):
+            raise DataError("INSERT", {}, Exception("value too long"))
+        batches.append(rows)
+        first = sum(len(batch) for batch in batches) - len(rows) + 1
+        return [
+            {"person_id": person_id, **row}
+            for person_id, row in enumerate(rows, start=first)
+        ]
+
+    mocker.patch.object(
+        group_commit.person_queries,
+        "insert_persons",
+        AsyncMock(side_effect=insert_persons),
+    )
+    engine = MagicMock()
+    engine.connect.return_value.__aenter__.return_value = AsyncMock()
+    mocker.patch.object(
+        group_commit.db_session, "get_engine", return_value=engine
+    )
+    return batches
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rows_share_batches(inserts):
+    writer = group_commit.GroupCommitWriter(max_batch=4, max_delay=0.01)
+
+    rows = await asyncio.gather(
+        *(writer.submit(person_data()) for _ in range(10))
+    )
+
+    # Two full batches, the last two rows after max_delay
+    assert [len(batch) for batch in inserts] == [4, 4, 2]
+    assert sorted(row["person_id"] for row in rows) == list(range(1, 11))
+
+
+@pytest.mark.asyncio
+async def test_max_delay_flushes_partial_batch(inserts):
+    writer = group_commit.GroupCommitWriter(max_batch=100, max_delay=0.01)
+
+    rows = await asyncio.gather(
+        writer.submit(person_data("Jane")), writer.submit(person_data("John"))
+    )
+
+    assert len(inserts) == 1
+    assert [(row["person_id"], row["name"]) for row in rows] == [
+        (1, "Jane"),
+        (2, "John"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_gives_every_caller_its_own_result(inserts):
+    writer = group_commit.GroupCommitWriter(max_batch=3, max_delay=10)
+
+    results = await asyncio.gather(
+        writer.submit(person_data("Jane")),
+        writer.submit(person_data("Bad")),
+        writer.submit(person_data("John")),
+        return_exceptions=True,
+    )
+
+    assert results[0]["name"] == "Jane"
+    assert isinstance(results[1], DataError)
+    assert results[2]["name"] == "John"
+    assert results[0]["person_id"] != results[2]["person_id"]
+
+
+@pytest.mark.asyncio
+async def test_unreachable_database_fails_batch_at_once(inserts):
+    group_commit.person_queries.insert_persons.side_effect = OperationalError(
+        "INSERT", {}, Exception("connection refused")
+    )
+    writer = group_commit.GroupCommitWriter(max_batch=3, max_delay=10)
+
+    results = await asyncio.gather(
+        *(writer.submit(person_data()) for _ in range(3)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, OperationalError) for result in results)
+    assert group_commit.person_queries.insert_persons.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_write_does_not_inherit_submitter_context(inserts):
+    seen = []
+
+    async def insert_persons(conn, rows):
+        seen.append((correlation_id.get(), instrumentation.query_stats.get()))
+        return [{"person_id": 1, **row} for row in rows]
+
+    group_commit.person_queries.insert_persons.side_effect = insert_persons
+    writer = group_commit.GroupCommitWriter(max_batch=1, max_delay=10)
+    correlation_id.set("request-1")
+    instrumentation.query_stats.set(instrumentation.QueryStats())
+
+    await writer.submit(person_data())
+
+    assert seen == [(None, None)]
+
+
+@pytest.mark.asyncio
+async def test_close_writes_queued_rows(inserts):
+    writer = group_commit.GroupCommitWriter(max_batch=100, max_delay=60)
+    pending = asyncio.create_task(writer.submit(person_data()))
+    await asyncio.sleep(0)
+
+    await writer.close()
+
+    assert (await pending)["person_id"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_batch(inserts):
+    writer = group_commit.GroupCommitWriter(max_batch=2, max_delay=60)
+    cancelled = asyncio.create_task(writer.submit(person_data("Jane")))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    row = await writer.submit(person_data("John"))
+
+    assert row["person_id"] == 2
+    assert [row["name"] for row in inserts[0]] == ["Jane", "John"]
+
+
+@pytest.mark.asyncio
+async def test_create_person_group_commit(inserts, mocker):
+    mocker.patch.object(config, "PERSON_GROUP_COMMIT", True)
+    mocker.patch.object(
+        group_commit,
+        "writer",
+        group_commit.GroupCommitWriter(max_batch=100, max_delay=0.01),
+    )
+    payload = {**person_data(), "start_date": start_date.isoformat()}
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as client:
+        responses = await asyncio.gather(
+            *(client.post("/person/", json=payload) for _ in range(20)),
+            client.post("/person/", json={**payload, "name": "Bad"}),
+        )
+
+    assert [response.status_code for response in responses] == [201] * 20 + [
+        400
+    ]
+    assert responses[-1].json() == {"detail": "Failed to create person"}
+    person_ids = {response.json()["person_id"] for response in responses[:20]}
+    assert person_ids == set(range(1, 21))
+    assert responses[0].json()["start_date"] == payload["start_date"]
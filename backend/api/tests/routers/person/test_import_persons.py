@@ -0,0 +1,180 @@
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from dateutil.relativedelta import relativedelta
+from fastapi.testclient import TestClient
+
+from backend.api.routers.person import importer
+
+# Test data
+start_date = datetime(1990, 5, 9)
+valid_person_data = {
+    "name": "Jane",
+    "last_name": "Smith",
+    "age": relativedelta(datetime.now(), start_date).years,
+    "start_date": start_date.isoformat(),
+}
+valid_line = json.dumps(valid_person_data)
+
+
+async def chunked(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(lines):
+    return [line async for line in lines]
+
+
+@pytest.mark.asyncio
+async def test_read_lines_across_chunks():
+    lines = importer.read_lines(
+        chunked(b'{"a"', b":1}\n\n{", b'"b":2}\n{"c":3}'), max_line_bytes=64
+    )
+    assert await collect(lines) == [
+        (1, b'{"a":1}'),
+        (2, b""),
+        (3, b'{"b":2}'),
+        (4, b'{"c":3}'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_lines_drops_oversized_lines():
+    lines = importer.read_lines(
+        chunked(b"ok\n" + b"x" * 10, b"x" * 10, b"x\nok\n", b"y" * 11),
+        max_line_bytes=8,
+    )
+    assert await collect(lines) == [
+        (1, b"ok"),
+        (2, None),
+        (3, b"ok"),
+        (4, None),
+    ]
+
+
+@pytest.fixture
+def mock_conn(mocker):
+    conn = MagicMock()
+    conn.inserted = []
+
+    async def execute(stmt, params):
+        first_id = len(conn.inserted) + 1
+        conn.inserted.extend(params)
+        result = Mock()
+        result.mappings.return_value.all.return_value = [
+            {"person_id": person_id, **row}
+            for person_id, row in enumerate(params, start=first_id)
+        ]
+        return result
+
+    conn.execute = AsyncMock(side_effect=execute)
+    conn.commit = AsyncMock()
+    conn.rollback = AsyncMock()
+
+    @asynccontextmanager
+    async def connect():
+        yield conn
+
+    mocker.patch(
+        "backend.database.postgres.session.engine", MagicMock(connect=connect)
+    )
+    return conn
+
+
+def test_import_persons(mock_conn, sync_client: TestClient):
+    body = "\n".join(
+        [
+            valid_line,
+            "{not json",
+            valid_line,
+            "",
+            json.dumps({**valid_person_data, "age": -1}),
+            valid_line,
+        ]
+    )
+    response = sync_client.post(
+        url="/person/import?batch_size=2",
+        content=body.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 201
+    summary = response.json()
+    assert summary["received"] == 5
+    assert summary["created"] == 3
+    assert summary["rejected"] == 2
+    assert summary["rejected_lines"] == [2, 5]
+    assert summary["rows_per_second"] > 0
+    # Two batches: two rows then the last one
+    assert mock_conn.execute.call_count == 2
+    assert mock_conn.commit.call_count == 2
+    assert mock_conn.inserted[0]["name"] == "Jane"
+
+
+def test_import_persons_rejects_timezone_aware_dates(
+    mock_conn, sync_client: TestClient
+):
+    aware_line = json.dumps(
+        {**valid_person_data, "start_date": "1995-05-09T00:00:00Z"}
+    )
+    response = sync_client.post(
+        url="/person/import",
+        content=f"{valid_line}\n{aware_line}\n{valid_line}\n".encode(),
+    )
+
+    assert response.status_code == 201
+    summary = response.json()
+    assert summary["created"] == 2
+    assert summary["rejected"] == 1
+    assert summary["rejected_lines"] == [2]
+
+
+def test_import_persons_db_error(mock_conn, sync_client: TestClient):
+    mock_conn.execute = AsyncMock(side_effect=Exception("Database error"))
+    response = sync_client.post(
+        url="/person/import?batch_size=1",
+        content=f"{valid_line}\n{valid_line}\n".encode(),
+    )
+
+    assert response.status_code == 201
+    assert response.json()["created"] == 0
+    assert response.json()["rejected_lines"] == [1, 2]
+    assert mock_conn.rollback.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_import_persons_queue_is_bounded(mock_conn):
+    batch_sizes = []
+
+    async def slow_execute(stmt, params):
+        batch_sizes.append(len(params))
+        result = Mock()
+        result.mappings.return_value.all.return_value = []
+        return result
+
+    mock_conn.execute = AsyncMock(side_effect=slow_execute)
+    put = importer.asyncio.Queue.put
+    max_pending = 0
+
+    async def tracking_put(self, item):
+        nonlocal max_pending
+        await put(self, item)
+        max_pending = max(max_pending, self.qsize())
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(importer.asyncio.Queue, "put", tracking_put)
+        summary = await importer.import_persons(
+            chunked(*[f"{valid_line}\n".encode()] * 50),
+            batch_size=5,
+            queue_size=2,
+            max_line_bytes=1024,
+            max_reported_lines=10,
+        )
+
+    assert summary["received"] == 50
+    assert batch_sizes == [5] * 10
+    assert max_pending <= 2
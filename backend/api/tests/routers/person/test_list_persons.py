@@ -0,0 +1,111 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import fastapi
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.routers.person import pagination
+
+
+def person_row(person_id):
+    return {
+        "person_id": person_id,
+        "name": "Jane",
+        "last_name": "Smith",
+        "age": 30,
+        "start_date": datetime(1995, 5, 9),
+        "end_date": None,
+        "description": "An inspiring leader.",
+    }
+
+
+@pytest.fixture
+def mock_session(mocker):
+    async_mock = AsyncMock()
+    async_mock.__aenter__.return_value = async_mock
+    async_mock.__aexit__.return_value = None
+    mocker.patch(
+        "backend.database.postgres.session.session_factory",
+        return_value=async_mock,
+    )
+    return async_mock
+
+
+def returning(mock_session, rows):
+    result = Mock()
+    result.mappings.return_value.all.return_value = rows
+    mock_session.execute = AsyncMock(return_value=result)
+
+
+def compiled_stmt(mock_session):
+    (stmt,), _ = mock_session.execute.call_args
+    return stmt.compile(compile_kwargs={"literal_binds": True})
+
+
+@pytest.mark.asyncio
+async def test_list_persons_first_page(mock_session, sync_client: TestClient):
+    returning(mock_session, [person_row(i) for i in (1, 2, 3)])
+
+    response = sync_client.get(url="/person/?limit=2")
+
+    assert response.status_code == fastapi.status.HTTP_200_OK
+    body = response.json()
+    assert [person["person_id"] for person in body["items"]] == [1, 2]
+    assert body["items"][0]["start_date"] == "1995-05-09T00:00:00"
+    assert pagination.decode_cursor(body["next_cursor"], int) == [2]
+    sql = str(compiled_stmt(mock_session))
+    assert "ORDER BY person.person_id" in sql
+    assert "LIMIT 3" in sql
+    assert "OFFSET" not in sql
+    assert "WHERE" not in sql
+
+
+@pytest.mark.asyncio
+async def test_list_persons_after_cursor(
+    mock_session, sync_client: TestClient
+):
+    returning(mock_session, [person_row(43)])
+
+    response = sync_client.get(
+        url="/person/",
+        params={"after": pagination.encode_cursor(42), "limit": 2},
+    )
+
+    assert response.status_code == fastapi.status.HTTP_200_OK
+    assert response.json()["next_cursor"] is None
+    assert "person.person_id > 42" in str(compiled_stmt(mock_session))
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-base64!",
+        pagination.encode_cursor("42"),
+        pagination.encode_cursor(),
+    ],
+)
+def test_list_persons_invalid_cursor(
+    mock_session, sync_client: TestClient, cursor
+):
+    response = sync_client.get(url="/person/", params={"after": cursor})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
+    mock_session.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_persons_db_error(mock_session, sync_client: TestClient):
+    mock_session.execute = AsyncMock(side_effect=Exception("Database error"))
+    response = sync_client.get(url="/person/")
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Failed to list persons"}
+
+
+def test_list_persons_invalid_limit(sync_client: TestClient):
+    response = sync_client.get(url="/person/?limit=0")
+    assert response.status_code == 422
+    assert (
+        response.json()["message"]
+        == "Input should be greater than or equal to 1"
+    )
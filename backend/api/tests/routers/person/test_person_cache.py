@@ -0,0 +1,272 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.routers.person.cache import PersonCache, person_cache
+from backend.api.routers.person.models.response_models import PersonResponse
+from backend.database.postgres.person_models import Person
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_person(person_id):
+    return PersonResponse(
+        person_id=person_id,
+        name="Jane",
+        last_name="Smith",
+        age=30,
+        start_date=datetime(1995, 5, 9),
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def person_lru(clock):
+    return PersonCache(maxsize=2, ttl=10, negative_ttl=1, clock=clock)
+
+
+@pytest.mark.asyncio
+async def test_read_through(person_lru):
+    loader = AsyncMock(return_value=make_person(1))
+    assert await person_lru.get_or_load(1, loader) == make_person(1)
+    assert await person_lru.get_or_load(1, loader) == make_person(1)
+    loader.assert_called_once()
+    assert person_lru.stats()["hits"] == 1
+    assert person_lru.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(person_lru):
+    for person_id in (1, 2):
+        await person_lru.get_or_load(person_id, AsyncMock(return_value=None))
+    # Touching 1 makes 2 the least recently used entry
+    await person_lru.get_or_load(1, AsyncMock())
+    await person_lru.get_or_load(3, AsyncMock(return_value=None))
+
+    loader = AsyncMock(return_value=None)
+    await person_lru.get_or_load(1, loader)
+    loader.assert_not_called()
+    await person_lru.get_or_load(2, loader)
+    loader.assert_called_once()
+    assert person_lru.stats()["evictions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_ttl_and_negative_ttl(person_lru, clock):
+    await person_lru.get_or_load(1, AsyncMock(return_value=make_person(1)))
+    await person_lru.get_or_load(2, AsyncMock(return_value=None))
+    clock.now = 5
+
+    loader = AsyncMock(return_value=None)
+    assert await person_lru.get_or_load(1, loader) == make_person(1)
+    assert await person_lru.get_or_load(2, loader) is None
+    loader.assert_called_once_with()
+    assert person_lru.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_during_load_is_not_stored(person_lru):
+    async def stale_loader():
+        person_lru.invalidate(1)
+        return make_person(1)
+
+    await person_lru.get_or_load(1, stale_loader)
+    loader = AsyncMock(return_value=None)
+    assert await person_lru.get_or_load(1, loader) is None
+    loader.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_always_loads(clock):
+    disabled = PersonCache(maxsize=0, ttl=10, negative_ttl=1, clock=clock)
+    loader = AsyncMock(return_value=make_person(1))
+    await disabled.get_or_load(1, loader)
+    await disabled.get_or_load(1, loader)
+    assert loader.call_count == 2
+    assert disabled.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_are_coalesced(clock):
+    disabled = PersonCache(maxsize=0, ttl=10, negative_ttl=1, clock=clock)
+    release = asyncio.Event()
+
+    async def loader():
+        await release.wait()
+        return make_person(1)
+
+    loader = AsyncMock(side_effect=loader)
+    waiters = [
+        asyncio.create_task(disabled.get_or_load(1, loader)) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [make_person(1)] * 5
+    loader.assert_called_once()
+    assert disabled.stats()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_get_many_joins_inflight_and_loads_rest(person_lru):
+    release = asyncio.Event()
+
+    async def load_one():
+        await release.wait()
+        return make_person(1)
+
+    async def load_many(person_ids):
+        return {2: make_person(2)}
+
+    load_many = AsyncMock(side_effect=load_many)
+    single = asyncio.create_task(person_lru.get_or_load(1, load_one))
+    await asyncio.sleep(0)
+    many = asyncio.create_task(
+        person_lru.get_many_or_load([3, 1, 2, 3], load_many)
+    )
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await many == {3: None, 1: make_person(1), 2: make_person(2)}
+    assert await single == make_person(1)
+    load_many.assert_called_once_with([3, 2])
+
+
+@pytest.mark.asyncio
+async def test_waiters_share_load_error(person_lru):
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise RuntimeError("connection lost")
+
+    waiters = [
+        asyncio.create_task(person_lru.get_or_load(1, failing))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    # Nothing cached, the next lookup loads again
+    loader = AsyncMock(return_value=None)
+    await person_lru.get_or_load(1, loader)
+    loader.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_waiter_loads_itself_when_leader_is_cancelled(person_lru):
+    leader = asyncio.create_task(
+        person_lru.get_or_load(1, AsyncMock(side_effect=asyncio.Event().wait))
+    )
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(
+        person_lru.get_or_load(1, AsyncMock(return_value=make_person(1)))
+    )
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await waiter == make_person(1)
+
+
+@pytest.mark.asyncio
+async def test_lookup_after_invalidate_does_not_join_stale_load(person_lru):
+    release = asyncio.Event()
+
+    async def stale_loader():
+        await release.wait()
+        return make_person(1)
+
+    stale = asyncio.create_task(person_lru.get_or_load(1, stale_loader))
+    await asyncio.sleep(0)
+    person_lru.invalidate(1)
+    fresh = AsyncMock(return_value=None)
+
+    assert await person_lru.get_or_load(1, fresh) is None
+    release.set()
+    assert await stale == make_person(1)
+    fresh.assert_called_once()
+
+
+@pytest.fixture
+def mock_session(mocker):
+    async_mock = AsyncMock()
+    async_mock.__aenter__.return_value = async_mock
+    async_mock.__aexit__.return_value = None
+    mocker.patch(
+        "backend.database.postgres.session.session_factory",
+        return_value=async_mock,
+    )
+    return async_mock
+
+
+@pytest.mark.asyncio
+async def test_get_person_is_cached(mock_session, sync_client: TestClient):
+    mock_session.get = AsyncMock(
+        return_value=Person(**make_person(1).model_dump())
+    )
+
+    first = sync_client.get(url="/person/1")
+    second = sync_client.get(url="/person/1")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    mock_session.get.assert_called_once_with(Person, 1)
+
+
+@pytest.mark.asyncio
+async def test_get_person_not_found_is_cached(
+    mock_session, sync_client: TestClient
+):
+    mock_session.get = AsyncMock(return_value=None)
+
+    assert sync_client.get(url="/person/999").status_code == 404
+    assert sync_client.get(url="/person/999").status_code == 404
+    mock_session.get.assert_called_once_with(Person, 999)
+
+
+@pytest.mark.asyncio
+async def test_delete_person_invalidates(
+    mock_session, sync_client: TestClient
+):
+    mock_session.get = AsyncMock(
+        return_value=Person(**make_person(1).model_dump())
+    )
+    sync_client.get(url="/person/1")
+    deleted = Mock()
+    deleted.scalars.return_value.all.return_value = [1]
+    mock_session.execute = AsyncMock(return_value=deleted)
+    assert sync_client.delete(url="/person/1").status_code == 200
+
+    mock_session.get = AsyncMock(return_value=None)
+    assert sync_client.get(url="/person/1").status_code == 404
+    assert person_cache.stats()["invalidations"] >= 1
+
+
+def test_person_cache_stats(sync_client: TestClient):
+    response = sync_client.get(url="/person/cache/stats")
+    assert response.status_code == 200
+    assert set(response.json()) == {
+        "size",
+        "maxsize",
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "invalidations",
+        "coalesced",
+    }
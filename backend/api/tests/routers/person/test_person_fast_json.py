@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from dateutil.relativedelta import relativedelta
+from fastapi.testclient import TestClient
+
+from backend.api.routers.person import cache, config
+from backend.database.postgres.person_models import Person
+
+persons = [
+    Person(
+        person_id=1,
+        name="Jane",
+        last_name="Smith",
+        age=30,
+        start_date=datetime(1995, 5, 9),
+        end_date=None,
+        description="An inspiring leader.",
+    ),
+    Person(
+        person_id=2,
+        name="Zoë",
+        last_name='O\'Brien   \x1f "quoted" \\',
+        age=84,
+        start_date=datetime(1920, 5, 18, 13, 7, 1, 250),
+        end_date=datetime(2005, 4, 2, tzinfo=timezone(timedelta(hours=-5))),
+        description="Zażółć 😀 \n\t",
+    ),
+]
+
+
+@pytest.fixture
+def mock_session(mocker):
+    async_mock = AsyncMock()
+    async_mock.__aenter__.return_value = async_mock
+    async_mock.__aexit__.return_value = None
+    mocker.patch(
+        "backend.database.postgres.session.session_factory",
+        return_value=async_mock,
+    )
+    return async_mock
+
+
+def get_both_ways(client: TestClient, url: str, mocker):
+    bodies = []
+    for fast_json in (False, True):
+        mocker.patch.object(config, "PERSON_FAST_JSON", fast_json)
+        cache.person_cache.clear()
+        response = client.get(url)
+        bodies.append(
+            (response.status_code, response.headers, response.content)
+        )
+    return bodies
+
+
+@pytest.mark.parametrize("person", persons)
+def test_get_person_fast_json_same_bytes(
+    person, mock_session, mocker, sync_client: TestClient
+):
+    mock_session.get = AsyncMock(return_value=person)
+
+    default, fast = get_both_ways(
+        sync_client, f"/person/{person.person_id}", mocker
+    )
+
+    assert fast[0] == default[0] == 200
+    assert fast[1]["content-type"] == default[1]["content-type"]
+    assert fast[1]["content-length"] == default[1]["content-length"]
+    assert fast[2] == default[2]
+
+
+def test_get_person_fast_json_from_cache(
+    mock_session, mocker, sync_client: TestClient
+):
+    mocker.patch.object(config, "PERSON_FAST_JSON", True)
+    mock_session.get = AsyncMock(return_value=persons[0])
+
+    first = sync_client.get("/person/1")
+    second = sync_client.get("/person/1")
+
+    assert first.content == second.content
+    mock_session.get.assert_called_once()
+
+
+def test_get_person_fast_json_not_found(
+    mock_session, mocker, sync_client: TestClient
+):
+    mocker.patch.object(config, "PERSON_FAST_JSON", True)
+    mock_session.get = AsyncMock(return_value=None)
+
+    response = sync_client.get("/person/999")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Person not found"}
+
+
+def test_create_person_fast_json_same_bytes(
+    mock_session, mocker, sync_client: TestClient
+):
+    start_date = datetime(1995, 5, 9, 8, 30)
+    payload = {
+        "name": "Anna-Maria",
+        "last_name": "Smith",
+        "age": relativedelta(datetime.now(), start_date).years,
+        "start_date": start_date.isoformat(),
+        "end_date": None,
+        "description": "  An inspiring leader.  ",
+    }
+    mock_session.add = Mock()
+    mock_session.commit = AsyncMock()
+    mock_session.refresh = AsyncMock(
+        side_effect=lambda obj: setattr(obj, "person_id", 7)
+    )
+
+    bodies = []
+    for fast_json in (False, True):
+        mocker.patch.object(config, "PERSON_FAST_JSON", fast_json)
+        response = sync_client.post("/person/", json=payload)
+        assert response.status_code == 201
+        bodies.append(response.content)
+
+    assert bodies[0] == bodies[1]
+    assert b'"person_id":7' in bodies[1]
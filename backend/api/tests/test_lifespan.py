@@ -0,0 +1,35 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api import app as app_module
+
+
+@pytest.fixture
+def lifespan_mocks(mocker):
+    mocker.patch.object(app_module, "logger_setup")
+    mocker.patch.object(app_module, "init_engine")
+    mocker.patch.object(app_module, "dispose_engine")
+    return mocker.patch.object(app_module, "init_db")
+
+
+def test_lifespan_skips_ddl_by_default(lifespan_mocks, mocker):
+    mocker.patch.object(
+        app_module.postgres_config, "POSTGRES_BOOTSTRAP_ON_STARTUP", False
+    )
+
+    with TestClient(app_module.app) as client:
+        assert client.get("/health/").status_code == 200
+
+    lifespan_mocks.assert_not_called()
+    app_module.init_engine.assert_called_once()
+
+
+def test_lifespan_bootstrap_on_startup(lifespan_mocks, mocker):
+    mocker.patch.object(
+        app_module.postgres_config, "POSTGRES_BOOTSTRAP_ON_STARTUP", True
+    )
+
+    with TestClient(app_module.app):
+        pass
+
+    lifespan_mocks.assert_called_once()
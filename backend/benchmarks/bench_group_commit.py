@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from loguru import logger
+
+from backend.api import app as app_module
+from backend.api.routers.person import config, group_commit
+from backend.benchmarks.load import scenarios
+from backend.database.postgres import person_queries
+from backend.database.postgres import session as db_session
+
+"""
+Benchmark: POST /person/ under concurrent bursts, one transaction per
+person (default) against PERSON_GROUP_COMMIT. Requests go in process
+through httpx.ASGITransport, so only the app and Postgres are measured.
+Created persons are deleted afterwards.
+
+Run from the repository root, with Postgres reachable (POSTGRES_* env,
+preferably a scratch database such as POSTGRES_DB=RecruitmentTaskBench):
+    python -m backend.benchmarks.bench_group_commit --concurrency 64
+"""
+
+
+async def drive(
+    client: httpx.AsyncClient, requests: int, concurrency: int
+) -> tuple[float, list[float], list[int]]:
+    latencies: list[float] = []
+    person_ids: list[int] = []
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            started = time.perf_counter()
+            response = await client.post(
+                "/person/", json=scenarios.person_payload(0)
+            )
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+            person_ids.append(response.json()["person_id"])
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(worker(requests // concurrency) for _ in range(concurrency))
+    )
+    return time.perf_counter() - started, latencies, person_ids
+
+
+async def run(args: argparse.Namespace) -> dict[str, tuple]:
+    results = {}
+    created: list[int] = []
+    # Admission control would shed most of the burst, the benchmark
+    # measures the writes themselves
+    app_module.person_writes.limit = 0
+    transport = httpx.ASGITransport(app=app_module.app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for label, enabled in (("per request", False), ("group", True)):
+            config.PERSON_GROUP_COMMIT = enabled
+            group_commit.writer = group_commit.GroupCommitWriter(
+                max_batch=args.max_batch, max_delay=args.max_delay_ms / 1000
+            )
+            # Warm up the pool and prepared statements
+            *_, warmup_ids = await drive(
+                client, args.concurrency * 2, args.concurrency
+            )
+            elapsed, latencies, person_ids = await drive(
+                client, args.requests, args.concurrency
+            )
+            created += warmup_ids + person_ids
+            results[label] = (len(latencies) / elapsed, latencies)
+    async with db_session.get_engine().begin() as conn:
+        await person_queries.delete_persons(conn, created)
+    await db_session.dispose_engine()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument(
+        "--max-batch", type=int, default=config.PERSON_GROUP_COMMIT_MAX_BATCH
+    )
+    parser.add_argument(
+        "--max-delay-ms",
+        type=float,
+        default=config.PERSON_GROUP_COMMIT_MAX_DELAY_MS,
+    )
+    args = parser.parse_args()
+
+    logger.remove()
+    db_session.init_db()
+    results = asyncio.run(run(args))
+
+    for label, (rate, latencies) in results.items():
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(
+            f"{label:>11}: {rate:7.0f} req/s"
+            f"  p50 {quantiles[49] * 1000:6.1f} ms"
+            f"  p99 {quantiles[98] * 1000:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
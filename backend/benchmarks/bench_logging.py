@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+import httpx
+from loguru import logger
+
+from backend.api.app import app
+from backend.loguru_logger.logger_setup import logger_setup
+
+"""
+Benchmark: requests/s of the app with logging off, with the previous
+hardcoded setup (DEBUG everywhere, line buffered file) and with a
+tuned setup (INFO on stderr, sampled DEBUG in a block buffered file).
+Requests go in process through httpx.ASGITransport to GET /health/,
+which does not touch the database. stderr is redirected to /dev/null.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_logging --requests 3000
+"""
+
+
+def setups(log_dir: str, sample_rate: float) -> dict:
+    file_path = os.path.join(log_dir, "loguru.log")
+    slow_query_path = os.path.join(log_dir, "slow_queries.log")
+    return {
+        "off": None,
+        "previous": dict(
+            stderr_level="DEBUG",
+            file_level="DEBUG",
+            file_path=file_path,
+            slow_query_path=slow_query_path,
+            file_buffer_bytes=1,
+            sample_rates={},
+        ),
+        "tuned": dict(
+            stderr_level="INFO",
+            stderr_diagnose=False,
+            file_level="DEBUG",
+            file_diagnose=False,
+            file_path=file_path,
+            slow_query_path=slow_query_path,
+            file_buffer_bytes=64 * 1024,
+            sample_rates={"DEBUG": sample_rate},
+        ),
+    }
+
+
+async def drive(requests: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                response = await client.get(
+                    "/health/", headers={"X-Request-ID": uuid.uuid4().hex}
+                )
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(worker(requests // concurrency) for _ in range(concurrency))
+        )
+        # Enqueued records are part of the cost
+        await logger.complete()
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--sample-rate", type=float, default=0.1)
+    args = parser.parse_args()
+
+    stderr = sys.stderr
+    sys.stderr = open(os.devnull, "w")
+    results = {}
+    try:
+        with tempfile.TemporaryDirectory() as log_dir:
+            for label, kwargs in setups(log_dir, args.sample_rate).items():
+                if kwargs is None:
+                    logger.remove()
+                else:
+                    logger_setup(**kwargs)
+                # Warm up
+                asyncio.run(drive(args.concurrency * 10, args.concurrency))
+                elapsed = asyncio.run(drive(args.requests, args.concurrency))
+                results[label] = args.requests / elapsed
+            logger.remove()
+    finally:
+        sys.stderr.close()
+        sys.stderr = stderr
+
+    for label, rate in results.items():
+        print(f"{label:>9}: {rate:9.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
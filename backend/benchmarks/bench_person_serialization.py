@@ -0,0 +1,107 @@
+import argparse
+import asyncio
+import time
+from datetime import datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from backend.api.routers.person.endpoints import router
+from backend.api.routers.person.models.response_models import PersonResponse
+from backend.api.routers.person.responses import PersonJSONResponse
+from backend.database.postgres.person_models import Person
+
+"""
+Micro-benchmark: FastAPI response_model serialization
+against PersonJSONResponse (PERSON_FAST_JSON=true),
+for the GET /person/{person_id} and POST /person/ hot paths.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_person_serialization
+"""
+
+
+def route_field(path: str, method: str):
+    for route in router.routes:
+        if (
+            isinstance(route, APIRoute)
+            and route.path == path
+            and method in route.methods
+        ):
+            return route.response_field
+    raise LookupError(f"{method} {path}")
+
+
+def make_person() -> Person:
+    return Person(
+        person_id=1,
+        name="Jane",
+        last_name="Smith",
+        age=30,
+        start_date=datetime(1995, 5, 9),
+        end_date=None,
+        description="An inspiring leader.",
+    )
+
+
+async def default_path(field, content) -> bytes:
+    # What FastAPI does with an endpoint return value and a response_model
+    serialized = await serialize_response(
+        field=field, response_content=content
+    )
+    return JSONResponse(serialized).body
+
+
+async def best_of(func, repeat: int, number: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            await func()
+        timings.append(time.perf_counter() - started)
+    return min(timings) / number
+
+
+async def run(number: int, repeat: int) -> None:
+    db_person = make_person()
+    cached_person = PersonResponse.model_validate(
+        db_person, from_attributes=True
+    )
+    get_field = route_field("/person/{person_id}", "GET")
+    post_field = route_field("/person/", "POST")
+
+    async def fast_get() -> bytes:
+        # get_person returns the cached PersonResponse
+        return PersonJSONResponse(cached_person).body
+
+    async def fast_post() -> bytes:
+        # create_person validates the refreshed ORM row once
+        return PersonJSONResponse(
+            PersonResponse.model_validate(db_person, from_attributes=True)
+        ).body
+
+    cases = {
+        "GET": (lambda: default_path(get_field, cached_person), fast_get),
+        "POST": (lambda: default_path(post_field, db_person), fast_post),
+    }
+    for label, (default, fast) in cases.items():
+        assert await default() == await fast(), label
+        default_time = await best_of(default, repeat, number)
+        fast_time = await best_of(fast, repeat, number)
+        print(
+            f"{label:>5}: default {default_time * 1e6:8.2f} us"
+            f"  fast {fast_time * 1e6:8.2f} us"
+            f"  speedup {default_time / fast_time:5.2f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.number, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
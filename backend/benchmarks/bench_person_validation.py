@@ -0,0 +1,94 @@
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from dateutil.relativedelta import relativedelta
+
+from backend.api.routers.person.models.batch_validation import validate_persons
+from backend.api.routers.person.models.request_models import PersonCreate
+
+"""
+Micro-benchmark: per-model PersonCreate validation
+against the column-wise batch validation engine.
+
+Run from the repository root:
+    python -m backend.benchmarks.bench_person_validation --rows 10000
+"""
+
+
+def make_rows(count: int, invalid_ratio: float, seed: int) -> list[dict]:
+    rnd = random.Random(seed)
+    now = datetime.now()
+    rows = []
+    for _ in range(count):
+        start_date = now - timedelta(days=rnd.randrange(1, 365 * 100))
+        end_date = None
+        if rnd.random() < 0.3:
+            end_date = start_date + (now - start_date) * rnd.random()
+        reference = end_date or now
+        row = {
+            "name": rnd.choice(["Jane", "John", "Anna-Maria", "Li"]),
+            "last_name": rnd.choice(["Smith", "Doe", "van Dyke"]),
+            "age": relativedelta(reference, start_date).years,
+            "start_date": start_date.isoformat(),
+            "end_date": end_date and end_date.isoformat(),
+            "description": rnd.choice([None, "An inspiring leader."]),
+        }
+        if rnd.random() < invalid_ratio:
+            field, value = rnd.choice(
+                [("name", ""), ("age", -1), ("last_name", "x" * 40)]
+            )
+            row[field] = value
+        rows.append(row)
+    return rows
+
+
+def per_model(rows: list[dict]) -> int:
+    valid = 0
+    for row in rows:
+        try:
+            PersonCreate.model_validate(row)
+        except ValueError:
+            continue
+        valid += 1
+    return valid
+
+
+def batch(rows: list[dict]) -> int:
+    return sum(row is not None for row in validate_persons(rows).rows)
+
+
+def best_of(func, rows: list[dict], repeat: int) -> tuple[float, int]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(rows)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--invalid-ratio", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows, args.invalid_ratio, args.seed)
+    model_time, model_valid = best_of(per_model, rows, args.repeat)
+    batch_time, batch_valid = best_of(batch, rows, args.repeat)
+    assert model_valid == batch_valid, (model_valid, batch_valid)
+
+    print(f"rows: {args.rows}, valid: {batch_valid}")
+    for label, elapsed in (("per-model", model_time), ("batch", batch_time)):
+        print(
+            f"{label:>10}: {elapsed * 1000:9.2f} ms"
+            f" {args.rows / elapsed:12.0f} rows/s"
+        )
+    print(f"   speedup: {model_time / batch_time:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
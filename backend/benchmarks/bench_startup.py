@@ -0,0 +1,101 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from backend.benchmarks.load import server
+
+"""
+Benchmark: time to first request of a freshly started app.
+
+Workers started with POSTGRES_BOOTSTRAP_ON_STARTUP set run init_db
+each. Without it they start without DDL, after
+python -m backend.database.postgres.bootstrap ran once (timed
+separately), as backend_entrypoint.sh does. Timings include process
+start and imports.
+
+The per-worker DDL mode only approximates the old startup, it is not
+a measurement of it: the old workers ran a synchronous init_db on the
+event loop with a psycopg2 pool of 50 connections, the current
+init_db runs in a thread, under an advisory lock, on one NullPool
+connection. For the real baseline, run the app of the commit before
+the one-shot bootstrap was introduced.
+
+Run from the repository root, with Postgres reachable (POSTGRES_* env):
+    python -m backend.benchmarks.bench_startup --workers 5
+"""
+
+
+def time_to_first_request(env: dict[str, str], workers: int) -> float:
+    started = time.perf_counter()
+    port = server.free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "backend.api.app:app",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+        ],
+        env={**os.environ, **env},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        server.wait_ready(f"http://127.0.0.1:{port}", process, timeout=120)
+        return time.perf_counter() - started
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def bootstrap(env: dict[str, str]) -> float:
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "backend.database.postgres.bootstrap"],
+        env={**os.environ, **env},
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    env = {"LOG_LEVEL": "WARNING"}
+    modes = {
+        # Workers (re)started by gunicorn pay this on every start
+        "per-worker DDL (~before)": lambda: time_to_first_request(
+            {**env, "POSTGRES_BOOTSTRAP_ON_STARTUP": "true"}, args.workers
+        ),
+        "workers, no DDL": lambda: time_to_first_request(
+            {**env, "POSTGRES_BOOTSTRAP_ON_STARTUP": "false"}, args.workers
+        ),
+        # Paid once per deployment, before the workers start
+        "one-shot bootstrap": lambda: bootstrap(env),
+    }
+    print(f"{args.workers} workers, {args.repeat} runs")
+    print(
+        "~before only approximates the old startup (sync init_db,"
+        " pool of 50 per worker), it is not a baseline measurement"
+    )
+    for label, measure in modes.items():
+        timings = [measure() for _ in range(args.repeat)]
+        print(
+            f"{label:>24}: median {statistics.median(timings):6.3f}s"
+            f"  min {min(timings):6.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
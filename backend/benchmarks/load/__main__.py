@@ -0,0 +1,166 @@
+import argparse
+import asyncio
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+from backend.benchmarks.load import report, scenarios, server
+
+"""
+Load benchmark of every endpoint against a real Postgres.
+
+Boots the app with uvicorn on the Postgres configured by the POSTGRES_*
+environment variables (e.g. `make up-db`), in a dedicated database that
+is created if needed and emptied before seeding. Seeds persons, drives
+each scenario with the given concurrency and reports throughput and
+p50/p95/p99 latency, saved as JSON.
+
+Run from the repository root:
+    python -m backend.benchmarks.load run --output before.json
+    python -m backend.benchmarks.load run --baseline before.json
+    python -m backend.benchmarks.load compare before.json after.json
+
+With --baseline (or compare) it exits with 1 when a tracked metric
+is worse than the baseline by more than --threshold.
+"""
+
+
+def reset_database(database: str) -> None:
+    """Bootstrap the schema, as deployments do, and drop all persons."""
+    # Imported late, config reads POSTGRES_DB from the environment
+    from sqlalchemy import create_engine, text
+
+    from backend.database.postgres import config
+    from backend.database.postgres.session import init_db
+
+    assert config.POSTGRES_DB == database, config.POSTGRES_DB
+    init_db()
+    engine = create_engine(config.POSTGRES_SYNC_URL)
+    with engine.begin() as conn:
+        conn.execute(text("TRUNCATE person RESTART IDENTITY"))
+    engine.dispose()
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run_scenarios(
+    base_url: str, args: argparse.Namespace
+) -> dict[str, report.ScenarioResult]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=30
+    ) as client:
+        person_ids = await scenarios.seed(client, args.persons)
+        deletable_ids = await scenarios.seed(
+            client, args.requests + args.warmup
+        )
+        selected = scenarios.build_scenarios(person_ids, deletable_ids)
+        results = {}
+        for name in args.scenarios:
+            scenario = selected[name]
+            await scenarios.drive(
+                client, scenario, args.warmup, args.concurrency
+            )
+            results[name] = await scenarios.drive(
+                client, scenario, args.requests, args.concurrency
+            )
+            result = results[name]
+            print(
+                f"{name:>14}: {result.throughput_rps:8.1f} req/s"
+                f"  p50 {result.p50_ms:8.2f} ms  p95 {result.p95_ms:8.2f} ms"
+                f"  p99 {result.p99_ms:8.2f} ms  errors {result.errors}",
+                flush=True,
+            )
+        return results
+
+
+def run(args: argparse.Namespace) -> int:
+    os.environ["POSTGRES_DB"] = args.database
+    env = {"POSTGRES_DB": args.database, "LOG_LEVEL": args.log_level}
+    reset_database(args.database)
+    with server.running_app(env, workers=args.workers) as base_url:
+        results = asyncio.run(run_scenarios(base_url, args))
+
+    meta = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "persons": args.persons,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "workers": args.workers,
+    }
+    output = args.output or Path(f"load-{datetime.now():%Y%m%d-%H%M%S}.json")
+    report.save(output, meta, results)
+    print(f"Saved {output}")
+    if args.baseline is None:
+        return 0
+    current = {name: vars(result) for name, result in results.items()}
+    return check(current, report.load(args.baseline), args.threshold)
+
+
+def check(current: dict, baseline: dict, threshold: float) -> int:
+    regressions = report.compare(current, baseline, threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print(f"No regression above {threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the load benchmark.")
+    run_parser.add_argument("--persons", type=int, default=1000)
+    run_parser.add_argument("--requests", type=int, default=2000)
+    run_parser.add_argument("--warmup", type=int, default=100)
+    run_parser.add_argument("--concurrency", type=int, default=16)
+    run_parser.add_argument("--workers", type=int, default=1)
+    run_parser.add_argument(
+        "--scenarios",
+        type=lambda value: value.split(","),
+        default=list(scenarios.build_scenarios([1], [])),
+        help="Comma separated, default: all.",
+    )
+    run_parser.add_argument("--database", default="RecruitmentTaskBench")
+    run_parser.add_argument("--log-level", default="WARNING")
+    run_parser.add_argument("--output", type=Path)
+    run_parser.add_argument("--baseline", type=Path)
+    run_parser.add_argument("--threshold", type=float, default=0.1)
+
+    compare_parser = commands.add_parser(
+        "compare", help="Compare two saved runs."
+    )
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args()
+    if args.command == "run":
+        return run(args)
+    return check(
+        report.load(args.current), report.load(args.baseline), args.threshold
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
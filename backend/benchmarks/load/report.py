@@ -0,0 +1,107 @@
+import dataclasses
+import json
+import math
+import typing
+from pathlib import Path
+
+"""
+Load benchmark results: per scenario summaries, JSON files
+and the comparison used by the regression mode.
+"""
+
+# Tracked metrics and whether a higher value is better
+TRACKED_METRICS: dict[str, bool] = {
+    "throughput_rps": True,
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+}
+
+
+@dataclasses.dataclass
+class ScenarioResult:
+    requests: int
+    errors: int
+    duration_s: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+def percentile(sorted_values: typing.Sequence[float], rank: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    index = max(math.ceil(rank / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+def summarize(
+    latencies: typing.Sequence[float], errors: int, duration: float
+) -> ScenarioResult:
+    """
+    :param latencies: Seconds per successful request.
+    :param errors: Failed requests (transport errors, unexpected status).
+    :param duration: Wall clock seconds of the whole scenario.
+    """
+    ordered = sorted(latencies)
+    return ScenarioResult(
+        requests=len(ordered) + errors,
+        errors=errors,
+        duration_s=round(duration, 3),
+        throughput_rps=round(len(ordered) / duration, 1) if duration else 0,
+        p50_ms=round(percentile(ordered, 50) * 1000, 3),
+        p95_ms=round(percentile(ordered, 95) * 1000, 3),
+        p99_ms=round(percentile(ordered, 99) * 1000, 3),
+    )
+
+
+def save(path: Path, meta: dict, results: dict[str, ScenarioResult]) -> None:
+    document = {
+        "meta": meta,
+        "scenarios": {
+            name: dataclasses.asdict(result)
+            for name, result in results.items()
+        },
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def load(path: Path) -> dict[str, dict[str, float]]:
+    return json.loads(path.read_text())["scenarios"]
+
+
+def compare(
+    current: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """
+    Tracked metrics of current that are worse than baseline
+    by more than threshold (0.1 = 10%).
+
+    :return: Human readable regressions, empty when there are none.
+    """
+    regressions = []
+    for scenario, previous in baseline.items():
+        if scenario not in current:
+            regressions.append(f"{scenario}: missing from current run")
+            continue
+        for metric, higher_is_better in TRACKED_METRICS.items():
+            old, new = previous[metric], current[scenario][metric]
+            if not old:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            if worse > threshold:
+                regressions.append(
+                    f"{scenario}.{metric}: {old} -> {new}"
+                    f" ({change:+.1%}, limit {threshold:.0%})"
+                )
+        if current[scenario]["errors"] > previous["errors"]:
+            regressions.append(
+                f"{scenario}.errors: {previous['errors']}"
+                f" -> {current[scenario]['errors']}"
+            )
+    return regressions
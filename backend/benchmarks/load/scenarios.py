@@ -0,0 +1,127 @@
+import asyncio
+import collections
+import dataclasses
+import random
+import time
+import typing
+from datetime import datetime
+
+import httpx
+from dateutil.relativedelta import relativedelta
+
+from backend.benchmarks.load import report
+
+"""
+Seeding and request scenarios of the load benchmark.
+"""
+
+SEED_CHUNK = 1000
+# Ids per GET /person/batch, like a page fanning out single GETs
+BATCH_IDS = 20
+START_DATE = datetime(1990, 5, 9)
+
+
+def person_payload(index: int) -> dict:
+    return {
+        "name": random.choice(["Jane", "John", "Anna-Maria", "Li"]),
+        "last_name": f"Bench{'abcdefghij'[index % 10]}",
+        "age": relativedelta(datetime.now(), START_DATE).years,
+        "start_date": START_DATE.isoformat(),
+        "end_date": None,
+        "description": "Load benchmark person.",
+    }
+
+
+async def seed(client: httpx.AsyncClient, count: int) -> list[int]:
+    """Create count persons through POST /person/bulk, return their IDs."""
+    ids = []
+    for start in range(0, count, SEED_CHUNK):
+        size = min(SEED_CHUNK, count - start)
+        response = await client.post(
+            "/person/bulk",
+            json=[person_payload(start + index) for index in range(size)],
+        )
+        response.raise_for_status()
+        ids.extend(
+            person["person_id"] for person in response.json()["persons"]
+        )
+    return ids
+
+
+@dataclasses.dataclass
+class Scenario:
+    method: str
+    # Builds the URL of the next request, None when out of work
+    url: typing.Callable[[], str | None]
+    expected_status: int
+    body: typing.Callable[[], dict] | None = None
+
+
+def build_scenarios(
+    person_ids: list[int], deletable_ids: list[int]
+) -> dict[str, Scenario]:
+    rnd = random.Random(14)
+    to_delete = collections.deque(deletable_ids)
+    return {
+        "health": Scenario("GET", lambda: "/health/", 200),
+        "info": Scenario("GET", lambda: "/info/", 200),
+        "get_person": Scenario(
+            "GET", lambda: f"/person/{rnd.choice(person_ids)}", 200
+        ),
+        "get_persons_batch": Scenario(
+            "GET",
+            lambda: "/person/batch?"
+            + "&".join(
+                f"ids={person_id}"
+                for person_id in rnd.sample(
+                    person_ids, min(BATCH_IDS, len(person_ids))
+                )
+            ),
+            200,
+        ),
+        "create_person": Scenario(
+            "POST", lambda: "/person/", 201, body=lambda: person_payload(0)
+        ),
+        "delete_person": Scenario(
+            "DELETE",
+            lambda: f"/person/{to_delete.popleft()}" if to_delete else None,
+            200,
+        ),
+    }
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+) -> report.ScenarioResult:
+    """Send requests of one scenario from concurrency workers."""
+    latencies: list[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal errors, remaining
+        while remaining > 0:
+            remaining -= 1
+            url = scenario.url()
+            if url is None:
+                return
+            body = scenario.body() if scenario.body else None
+            started = time.perf_counter()
+            try:
+                response = await client.request(
+                    scenario.method, url, json=body
+                )
+            except httpx.TransportError:
+                errors += 1
+                continue
+            if response.status_code != scenario.expected_status:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return report.summarize(latencies, errors, time.perf_counter() - started)
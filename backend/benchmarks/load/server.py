@@ -0,0 +1,75 @@
+import contextlib
+import os
+import socket
+import subprocess
+import sys
+import time
+import typing
+
+import httpx
+
+"""
+Runs the app under uvicorn in a subprocess, as deployed, so the
+lifespan (init_db, engine pool) and middlewares are part of the run.
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(base_url: str, process: subprocess.Popen, timeout: float):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            if httpx.get(f"{base_url}/health/").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise TimeoutError(f"Server not ready after {timeout}s")
+
+
+@contextlib.contextmanager
+def running_app(
+    env: dict[str, str], workers: int = 1, timeout: float = 60
+) -> typing.Iterator[str]:
+    """
+    :param env: Environment of the server, e.g. POSTGRES_* settings.
+    :param workers: Uvicorn worker processes.
+    :return: Base URL of the running app.
+    """
+    port = free_port()
+    command = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "backend.api.app:app",
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--no-access-log",
+    ]
+    process = subprocess.Popen(
+        command,
+        env={**os.environ, **env},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_ready(base_url, process, timeout)
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
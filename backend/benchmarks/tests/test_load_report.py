@@ -0,0 +1,75 @@
+import pytest
+
+from backend.benchmarks.load import report
+
+baseline = {
+    "get_person": {
+        "requests": 1000,
+        "errors": 0,
+        "duration_s": 2.0,
+        "throughput_rps": 500.0,
+        "p50_ms": 10.0,
+        "p95_ms": 20.0,
+        "p99_ms": 30.0,
+    }
+}
+
+
+def with_changes(**changes) -> dict:
+    return {"get_person": {**baseline["get_person"], **changes}}
+
+
+def test_percentile_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+
+    assert report.percentile(values, 50) == 50
+    assert report.percentile(values, 95) == 95
+    assert report.percentile(values, 99) == 99
+    assert report.percentile([7.0], 99) == 7
+    assert report.percentile([], 50) == 0
+
+
+def test_summarize():
+    result = report.summarize([0.001 * ms for ms in range(1, 101)], 2, 4.0)
+
+    assert result.requests == 102
+    assert result.errors == 2
+    assert result.throughput_rps == 25.0
+    assert result.p50_ms == 50
+    assert result.p99_ms == 99
+
+
+def test_compare_within_threshold():
+    current = with_changes(throughput_rps=460.0, p99_ms=32.9)
+
+    assert report.compare(current, baseline, 0.1) == []
+
+
+@pytest.mark.parametrize(
+    "changes, metric",
+    [
+        ({"throughput_rps": 440.0}, "get_person.throughput_rps"),
+        ({"p95_ms": 23.0}, "get_person.p95_ms"),
+        ({"errors": 1}, "get_person.errors"),
+    ],
+)
+def test_compare_reports_regressions(changes, metric):
+    regressions = report.compare(with_changes(**changes), baseline, 0.1)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith(metric)
+
+
+def test_compare_missing_scenario():
+    assert report.compare({}, baseline, 0.1) == [
+        "get_person: missing from current run"
+    ]
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / "run.json"
+    result = report.summarize([0.01, 0.02], 0, 1.0)
+
+    report.save(path, {"commit": "abc"}, {"health": result})
+
+    assert report.load(path) == {"health": vars(result)}
@@ -25,6 +25,14 @@ def pytest_configure(config):
 #         yield client
 
 
+@pytest.fixture(autouse=True)
+def clear_person_cache():
+    """Cached persons must not leak between tests mocking the session."""
+    from backend.api.routers.person.cache import person_cache
+
+    person_cache.clear()
+
+
 @pytest.fixture(scope="session")
 def sync_client():
     # with TestClient(app=app) as client:
@@ -34,3 +42,25 @@ def sync_client():
     from backend.api.app import app
 
     return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def postgres_engine():
+    """
+    Real Postgres configured by backend.database.postgres.config
+    (e.g. started by `make up-db`) with the schema created.
+    Tests using it are skipped when the database is unreachable.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.exc import OperationalError
+
+    from backend.database.postgres import config
+    from backend.database.postgres.session import init_db
+
+    try:
+        init_db()
+    except OperationalError as exc_info:
+        pytest.skip(f"Postgres is not available: {exc_info}")
+    engine = create_engine(config.POSTGRES_SYNC_URL)
+    yield engine
+    engine.dispose()
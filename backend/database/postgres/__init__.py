@@ -1,3 +1,3 @@
-from . import person_models
+from . import person_models, person_queries
 
-__all__ = [person_models]
+__all__ = [person_models, person_queries]
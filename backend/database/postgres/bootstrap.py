@@ -0,0 +1,22 @@
+import time
+
+from loguru import logger
+
+from backend.database.postgres.session import init_db
+
+"""
+One-shot schema bootstrap, run before the app workers start:
+    python -m backend.database.postgres.bootstrap
+Workers then start without touching DDL
+(unless POSTGRES_BOOTSTRAP_ON_STARTUP is set).
+"""
+
+
+def main() -> None:
+    started = time.perf_counter()
+    init_db()
+    logger.info(f"Schema ready in {time.perf_counter() - started:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
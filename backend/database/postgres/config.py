@@ -16,11 +16,72 @@ POSTGRES_DB: str = os.getenv("POSTGRES_DB") or "RecruitmentTask"
 POSTGRES_SYNC: str = "postgresql+psycopg2"
 POSTGRES_ASYNC: str = "postgresql+asyncpg"
 
+# Async engine pool, one engine (and pool) per worker process.
+POSTGRES_POOL_SIZE: int = int(os.getenv("POSTGRES_POOL_SIZE") or 5)
+POSTGRES_MAX_OVERFLOW: int = int(os.getenv("POSTGRES_MAX_OVERFLOW") or 10)
+POSTGRES_POOL_RECYCLE: int = int(os.getenv("POSTGRES_POOL_RECYCLE") or 1800)
+POSTGRES_POOL_TIMEOUT: float = float(os.getenv("POSTGRES_POOL_TIMEOUT") or 30)
+POSTGRES_POOL_PRE_PING: bool = (
+    os.getenv("POSTGRES_POOL_PRE_PING") or "true"
+).lower() in ("1", "true", "yes")
+# Connections all workers may hold on the primary together, 0: no limit
+# (under gunicorn: what the server allows). Pools are scaled down to fit,
+# see pool_plan.py.
+POSTGRES_CONNECTION_BUDGET: int = int(
+    os.getenv("POSTGRES_CONNECTION_BUDGET") or 0
+)
+# Worker processes sharing the budget, set by gunicorn_conf.py.
+POSTGRES_POOL_WORKERS: int = int(
+    os.getenv("POSTGRES_POOL_WORKERS") or os.getenv("WEB_CONCURRENCY") or 1
+)
+# Left out of the budget for psql, migrations and monitoring.
+POSTGRES_RESERVED_CONNECTIONS: int = int(
+    os.getenv("POSTGRES_RESERVED_CONNECTIONS") or 5
+)
+# Statements running at least this long go to the slow query log, 0 disables.
+POSTGRES_SLOW_QUERY_MS: float = float(
+    os.getenv("POSTGRES_SLOW_QUERY_MS") or 500
+)
+# Create the schema in every worker's lifespan, for local development.
+# Deployments run `python -m backend.database.postgres.bootstrap` once.
+POSTGRES_BOOTSTRAP_ON_STARTUP: bool = (
+    os.getenv("POSTGRES_BOOTSTRAP_ON_STARTUP") or "false"
+).lower() in ("1", "true", "yes")
+# Read replicas, comma separated SQLAlchemy asyncpg URLs. Empty: none,
+# every read goes to the primary.
+POSTGRES_REPLICA_URLS: list[str] = [
+    url.strip()
+    for url in (os.getenv("POSTGRES_REPLICA_URLS") or "").split(",")
+    if url.strip()
+]
+# "round_robin" or "least_connections".
+POSTGRES_REPLICA_STRATEGY: str = (
+    os.getenv("POSTGRES_REPLICA_STRATEGY") or "round_robin"
+)
+# Clients read from the primary this long after their own POST/DELETE.
+POSTGRES_READ_YOUR_WRITES_SECONDS: float = float(
+    os.getenv("POSTGRES_READ_YOUR_WRITES_SECONDS") or 5
+)
+
 logger.info(f"{POSTGRES_USER=}")
 logger.info(f"{POSTGRES_PASSWORD=}")
 logger.info(f"{POSTGRES_HOSTNAME=}")
 logger.info(f"{POSTGRES_PORT=}")
 logger.info(f"{POSTGRES_DB=}")
+logger.info(f"{POSTGRES_POOL_SIZE=}")
+logger.info(f"{POSTGRES_MAX_OVERFLOW=}")
+logger.info(f"{POSTGRES_POOL_RECYCLE=}")
+logger.info(f"{POSTGRES_POOL_TIMEOUT=}")
+logger.info(f"{POSTGRES_POOL_PRE_PING=}")
+logger.info(f"{POSTGRES_CONNECTION_BUDGET=}")
+logger.info(f"{POSTGRES_POOL_WORKERS=}")
+logger.info(f"{POSTGRES_RESERVED_CONNECTIONS=}")
+logger.info(f"{POSTGRES_SLOW_QUERY_MS=}")
+logger.info(f"{POSTGRES_BOOTSTRAP_ON_STARTUP=}")
+# Replica URLs carry passwords
+logger.info(f"POSTGRES_REPLICAS={len(POSTGRES_REPLICA_URLS)}")
+logger.info(f"{POSTGRES_REPLICA_STRATEGY=}")
+logger.info(f"{POSTGRES_READ_YOUR_WRITES_SECONDS=}")
 POSTGRES_SYNC_URL: str = (
     f"{POSTGRES_SYNC}://{POSTGRES_USER}:{POSTGRES_PASSWORD}@"
     f"{POSTGRES_HOSTNAME}:{POSTGRES_PORT}/{POSTGRES_DB}"
@@ -0,0 +1,103 @@
+import contextvars
+import dataclasses
+import time
+import typing
+
+from asgi_correlation_id import correlation_id
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from backend.database.postgres import config
+
+"""
+Engine event hooks measuring queries per request.
+A request (see the query stats middleware) puts a QueryStats in the
+query_stats contextvar, the hooks add every cursor execution to it.
+The contextvar reaches SQLAlchemy's greenlet and the tasks a request
+spawns, so streaming and background queries are counted too.
+Statements slower than POSTGRES_SLOW_QUERY_MS are logged with the
+correlation id and redacted parameters.
+"""
+
+
+@dataclasses.dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+
+
+query_stats: contextvars.ContextVar[QueryStats | None] = (
+    contextvars.ContextVar("query_stats", default=None)
+)
+
+
+def before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def redact(parameters: typing.Any) -> typing.Any:
+    """Parameters with every value replaced by its type name."""
+    if isinstance(parameters, dict):
+        return {key: redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, tuple):
+        return tuple(redact(value) for value in parameters)
+    if isinstance(parameters, list):
+        return [redact(value) for value in parameters]
+    return type(parameters).__name__
+
+
+def log_slow_query(
+    statement: str, parameters: typing.Any, executemany: bool, elapsed: float
+) -> None:
+    if executemany and parameters:
+        # One redacted parameter set stands for all of them
+        parameters = {
+            "sets": len(parameters),
+            "first": redact(parameters[0]),
+        }
+    else:
+        parameters = redact(parameters)
+    duration_ms = round(elapsed * 1000, 3)
+    logger.bind(
+        slow_query=True,
+        request_id=correlation_id.get(),
+        duration_ms=duration_ms,
+    ).warning(
+        "Slow query {duration_ms}ms: {statement} parameters={parameters}",
+        duration_ms=duration_ms,
+        statement=" ".join(statement.split()),
+        parameters=parameters,
+    )
+
+
+def after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+) -> None:
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    stats = query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+    slow_query_ms = config.POSTGRES_SLOW_QUERY_MS
+    if slow_query_ms and elapsed * 1000 >= slow_query_ms:
+        log_slow_query(statement, parameters, executemany, elapsed)
+
+
+def handle_error(exception_context: typing.Any) -> None:
+    # after_cursor_execute does not run for failed statements
+    connection = exception_context.connection
+    started = connection.info.get("query_started") if connection else None
+    if started:
+        started.pop()
+
+
+def instrument(engine: Engine) -> None:
+    """Attach the query hooks to a (sync) engine, once."""
+    if event.contains(engine, "before_cursor_execute", before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "handle_error", handle_error)
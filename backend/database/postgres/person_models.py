@@ -13,4 +13,16 @@ class Person(SQLModel, table=True):
     end_date: datetime = Field(nullable=True)
     description: Optional[str] = Field(nullable=True, default=None)
 
-    __table_args__ = (Index("ix_person_name_lastname", "name", "last_name"),)
+    __table_args__ = (
+        Index("ix_person_name_lastname", "name", "last_name"),
+        # Serves LIKE 'prefix%' whatever the database collation is
+        Index(
+            "ix_person_lastname_name_pattern",
+            "last_name",
+            "name",
+            postgresql_ops={
+                "last_name": "text_pattern_ops",
+                "name": "text_pattern_ops",
+            },
+        ),
+    )
@@ -0,0 +1,157 @@
+import typing
+
+from sqlalchemy import Select, any_, bindparam, delete, insert, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from backend.database.postgres.person_models import Person
+
+"""
+Core (non ORM) statements for the person table.
+Used by the hot paths that would otherwise pay
+for identity map bookkeeping and refresh round-trips.
+"""
+
+person_table = Person.__table__
+
+
+async def insert_persons(
+    session: AsyncSession | AsyncConnection,
+    rows: typing.Sequence[dict[str, typing.Any]],
+) -> list[typing.Mapping[str, typing.Any]]:
+    """
+    Insert many persons with a multi-row INSERT ... RETURNING.
+    Caller owns the transaction (commit/rollback).
+
+    :param session: Database session or connection.
+    :param rows: Column values of the persons to insert.
+    :return: Inserted rows, including generated person_id, in input order.
+    """
+    if not rows:
+        return []
+    stmt = insert(person_table).returning(
+        *person_table.c, sort_by_parameter_order=True
+    )
+    result = await session.execute(stmt, list(rows))
+    return list(result.mappings().all())
+
+
+def _person_ids_param() -> typing.Any:
+    """person_id = ANY($1): any number of ids in one array parameter."""
+    c = person_table.c
+    return c.person_id == any_(
+        bindparam("person_ids", type_=ARRAY(c.person_id.type))
+    )
+
+
+async def get_persons(
+    session: AsyncSession | AsyncConnection,
+    person_ids: typing.Sequence[int],
+) -> list[typing.Mapping[str, typing.Any]]:
+    """
+    Fetch persons with one SELECT ... WHERE person_id = ANY($1).
+
+    :param session: Database session or connection.
+    :param person_ids: Ids of the persons to fetch.
+    :return: Found rows, in no particular order.
+    """
+    if not person_ids:
+        return []
+    stmt = select(person_table).where(_person_ids_param())
+    result = await session.execute(stmt, {"person_ids": list(person_ids)})
+    return list(result.mappings().all())
+
+
+async def delete_persons(
+    session: AsyncSession | AsyncConnection,
+    person_ids: typing.Sequence[int],
+) -> list[int]:
+    """
+    Delete persons with one DELETE ... WHERE person_id = ANY($1) RETURNING.
+    The ids travel as a single array parameter, so any number of them
+    fits one statement (and one cached prepared statement).
+    Caller owns the transaction (commit/rollback).
+
+    :param session: Database session or connection.
+    :param person_ids: Ids of the persons to delete.
+    :return: Ids actually deleted, in no particular order.
+    """
+    if not person_ids:
+        return []
+    stmt = (
+        delete(person_table)
+        .where(_person_ids_param())
+        .returning(person_table.c.person_id)
+    )
+    result = await session.execute(stmt, {"person_ids": list(person_ids)})
+    return list(result.scalars().all())
+
+
+def list_persons_stmt(after: int | None, limit: int) -> Select:
+    """
+    Keyset page over the person_id primary key index.
+    Cost depends on limit only, not on how deep the page is.
+    """
+    stmt = select(person_table).order_by(person_table.c.person_id).limit(limit)
+    if after is not None:
+        stmt = stmt.where(person_table.c.person_id > after)
+    return stmt
+
+
+async def list_persons(
+    session: AsyncSession, after: int | None, limit: int
+) -> list[typing.Mapping[str, typing.Any]]:
+    result = await session.execute(list_persons_stmt(after, limit))
+    return list(result.mappings().all())
+
+
+def _like_prefix(value: str) -> str:
+    escaped = (
+        value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    )
+    return f"{escaped}%"
+
+
+def search_persons_stmt(
+    last_name: str,
+    name: str | None,
+    prefix: bool,
+    after: int | None,
+    limit: int,
+) -> Select:
+    """
+    Keyset page of persons matching last_name (and name).
+    Exact match is answered by ix_person_last_name / ix_person_name_lastname,
+    prefix match by the text_pattern_ops ix_person_lastname_name_pattern.
+    """
+    c = person_table.c
+    if prefix:
+        conditions = [c.last_name.like(_like_prefix(last_name))]
+        if name is not None:
+            conditions.append(c.name.like(_like_prefix(name)))
+    else:
+        conditions = [c.last_name == last_name]
+        if name is not None:
+            conditions.append(c.name == name)
+    if after is not None:
+        conditions.append(c.person_id > after)
+    return (
+        select(person_table)
+        .where(*conditions)
+        .order_by(c.person_id)
+        .limit(limit)
+    )
+
+
+async def search_persons(
+    session: AsyncSession,
+    last_name: str,
+    name: str | None,
+    prefix: bool,
+    after: int | None,
+    limit: int,
+) -> list[typing.Mapping[str, typing.Any]]:
+    result = await session.execute(
+        search_persons_stmt(last_name, name, prefix, after, limit)
+    )
+    return list(result.mappings().all())
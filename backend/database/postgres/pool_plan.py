@@ -0,0 +1,133 @@
+import dataclasses
+
+from loguru import logger
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+from backend.database.postgres import config
+
+"""
+Connection budget planning.
+Every worker process has its own pool, so the database sees
+workers * (pool_size + max_overflow) connections at peak.
+POSTGRES_CONNECTION_BUDGET caps that total: it is divided across the
+POSTGRES_POOL_WORKERS workers and each pool is scaled down to its share,
+keeping the configured pool_size / max_overflow ratio.
+Under gunicorn the master plans once before forking (gunicorn_conf.py):
+without a budget it takes what the server allows (max_connections minus
+superuser and POSTGRES_RESERVED_CONNECTIONS) and it refuses to start
+when the plan does not fit the server.
+"""
+
+
+class PoolBudgetError(RuntimeError):
+    """The connection plan does not fit the budget or the server."""
+
+
+@dataclasses.dataclass(frozen=True)
+class PoolPlan:
+    workers: int
+    pool_size: int
+    max_overflow: int
+    # 0 when no budget applies
+    budget: int = 0
+
+    @property
+    def per_worker(self) -> int:
+        return self.pool_size + self.max_overflow
+
+    @property
+    def total(self) -> int:
+        return self.workers * self.per_worker
+
+    def __str__(self) -> str:
+        budget = self.budget or "unlimited"
+        return (
+            f"{self.workers} workers x (pool_size={self.pool_size}"
+            f" + max_overflow={self.max_overflow}) = {self.total}"
+            f" connections, budget {budget}"
+        )
+
+
+def plan_pools(
+    workers: int, budget: int, pool_size: int, max_overflow: int
+) -> PoolPlan:
+    """
+    Pool sizes of each worker fitting workers into budget.
+    Pools already within their share are kept as configured.
+
+    :param budget: Connections of all workers together, 0 for no limit.
+    :raises PoolBudgetError: When the budget leaves a worker nothing.
+    """
+    if budget <= 0:
+        return PoolPlan(workers, pool_size, max_overflow)
+    share = budget // workers
+    if share < 1:
+        raise PoolBudgetError(
+            f"Connection budget {budget} is less than one connection"
+            f" for each of {workers} workers"
+        )
+    wanted = pool_size + max_overflow
+    if wanted > share:
+        pool_size = max(1, share * pool_size // wanted)
+        max_overflow = share - pool_size
+    return PoolPlan(workers, pool_size, max_overflow, budget)
+
+
+def server_capacity(url: str) -> int:
+    """Connections the server accepts from non superusers."""
+    engine = create_engine(url, poolclass=NullPool)
+    try:
+        with engine.connect() as conn:
+            return conn.execute(
+                text(
+                    "SELECT current_setting('max_connections')::int"
+                    " - current_setting('superuser_reserved_connections')::int"
+                )
+            ).scalar_one()
+    finally:
+        engine.dispose()
+
+
+def plan_deployment(workers: int, capacity: int) -> PoolPlan:
+    """
+    Plan of workers against a server accepting capacity connections.
+
+    :raises PoolBudgetError: When the plan overcommits the server.
+    """
+    available = capacity - config.POSTGRES_RESERVED_CONNECTIONS
+    budget = config.POSTGRES_CONNECTION_BUDGET or available
+    if budget > available:
+        raise PoolBudgetError(
+            f"Connection budget {budget} exceeds the {available} connections"
+            f" the server has left (max_connections minus superuser and"
+            f" {config.POSTGRES_RESERVED_CONNECTIONS} reserved)"
+        )
+    return plan_pools(
+        workers,
+        budget,
+        config.POSTGRES_POOL_SIZE,
+        config.POSTGRES_MAX_OVERFLOW,
+    )
+
+
+def apply(plan: PoolPlan) -> None:
+    """
+    Make plan the pool settings of this process and of the processes
+    it forks afterwards (gunicorn workers).
+    """
+    config.POSTGRES_POOL_WORKERS = plan.workers
+    config.POSTGRES_CONNECTION_BUDGET = plan.budget
+    config.POSTGRES_POOL_SIZE = plan.pool_size
+    config.POSTGRES_MAX_OVERFLOW = plan.max_overflow
+    logger.info(f"Connection plan: {plan}")
+
+
+def worker_plan() -> PoolPlan:
+    """Pool sizes of this worker, from the config module."""
+    return plan_pools(
+        config.POSTGRES_POOL_WORKERS,
+        config.POSTGRES_CONNECTION_BUDGET,
+        config.POSTGRES_POOL_SIZE,
+        config.POSTGRES_MAX_OVERFLOW,
+    )
@@ -0,0 +1,91 @@
+import itertools
+import time
+import typing
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+"""
+Read replica routing.
+Read-only endpoints go to one of the replicas, chosen round-robin or by
+least checked-out connections. A client that wrote recently (marked by
+the last_write cookie or X-Last-Write header, see the read-your-writes
+middleware) keeps reading from the primary for a short window, so it
+never reads a replica that has not replayed its own write yet.
+"""
+
+ROUND_ROBIN = "round_robin"
+LEAST_CONNECTIONS = "least_connections"
+STRATEGIES = (ROUND_ROBIN, LEAST_CONNECTIONS)
+
+LAST_WRITE_COOKIE = "last_write"
+LAST_WRITE_HEADER = "X-Last-Write"
+# Markers are set by any worker's clock, a marker later than this
+# ahead of ours is not one we set
+MAX_CLOCK_SKEW_SECONDS = 1.0
+
+
+class ReplicaSet:
+    """Engines and session factories of the configured replicas."""
+
+    def __init__(
+        self,
+        urls: typing.Sequence[str],
+        strategy: str,
+        session_kwargs: dict[str, typing.Any],
+        bind: typing.Callable[[AsyncEngine], AsyncEngine] = lambda e: e,
+        **engine_kwargs: typing.Any,
+    ) -> None:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown replica strategy: {strategy}")
+        self.strategy = strategy
+        self.engines: list[AsyncEngine] = [
+            create_async_engine(url=url, **engine_kwargs) for url in urls
+        ]
+        self.session_factories = [
+            async_sessionmaker(bind=bind(engine), **session_kwargs)
+            for engine in self.engines
+        ]
+        self._next = itertools.cycle(range(len(self.engines)))
+
+    def pick(self) -> int:
+        """Index of the replica serving the next read."""
+        start = next(self._next)
+        if self.strategy == ROUND_ROBIN:
+            return start
+        # Ties go round-robin too, idle replicas share the load
+        order = [
+            (start + offset) % len(self.engines)
+            for offset in range(len(self.engines))
+        ]
+        return min(order, key=lambda i: self.engines[i].pool.checkedout())
+
+    async def dispose(self) -> None:
+        for engine in self.engines:
+            await engine.dispose()
+
+
+def last_write_age(
+    cookies: typing.Mapping[str, str],
+    headers: typing.Mapping[str, str],
+    now: float | None = None,
+) -> float | None:
+    """
+    Seconds since the client's last write, None if unknown.
+    The marker comes from the client: one in the future is ignored,
+    it would keep the client on the primary forever.
+    """
+    marker = headers.get(LAST_WRITE_HEADER) or cookies.get(LAST_WRITE_COOKIE)
+    if not marker:
+        return None
+    try:
+        written_at = float(marker)
+    except ValueError:
+        return None
+    age = (time.time() if now is None else now) - written_at
+    if age < -MAX_CLOCK_SKEW_SECONDS:
+        return None
+    return max(age, 0.0)
@@ -1,32 +1,73 @@
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.exceptions import HTTPException
 from loguru import logger
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
+    async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 from sqlalchemy_utils import create_database, database_exists
 from sqlmodel import SQLModel
 
-from backend.database.postgres import config
+from backend.database.postgres import (
+    config,
+    instrumentation,
+    pool_plan,
+    routing,
+)
 
 Base = declarative_base()
 
+# Postgres advisory lock key serializing schema bootstraps.
+SCHEMA_LOCK_ID = 7_015_001
+
+# Shared per worker process, created by init_engine() in the app lifespan.
+engine: AsyncEngine | None = None
+session_factory: async_sessionmaker | None = None
+# Autocommit view of engine for read-only sessions, see read_only_bind.
+read_engine: AsyncEngine | None = None
+# Read replicas, None when POSTGRES_REPLICA_URLS is empty.
+replicas: routing.ReplicaSet | None = None
+
 
 def init_db():
-    engine = create_engine(
-        config.POSTGRES_SYNC_URL,
-        pool_size=50,
-        max_overflow=20,
-    )
-    if not database_exists(engine.url):
-        create_database(engine.url)
-    SQLModel.metadata.create_all(engine)
+    """
+    Create the database, tables and missing indexes, once per deployment
+    (see bootstrap.py), not per worker.
+    Safe to run concurrently: DDL runs under a Postgres advisory lock.
+    Uses one unpooled connection, closed before returning.
+    """
+    engine = create_engine(config.POSTGRES_SYNC_URL, poolclass=NullPool)
+    try:
+        if not database_exists(engine.url):
+            try:
+                create_database(engine.url)
+            except ProgrammingError:
+                # Created meanwhile by a concurrent bootstrap
+                if not database_exists(engine.url):
+                    raise
+        with engine.connect() as conn:
+            conn.execute(select(func.pg_advisory_lock(SCHEMA_LOCK_ID)))
+            try:
+                SQLModel.metadata.create_all(conn)
+                # create_all skips tables that already exist,
+                # add their new indexes
+                for table in SQLModel.metadata.sorted_tables:
+                    for index in table.indexes:
+                        index.create(conn, checkfirst=True)
+                conn.commit()
+            finally:
+                conn.execute(select(func.pg_advisory_unlock(SCHEMA_LOCK_ID)))
+                conn.commit()
+    finally:
+        engine.dispose()
 
 
 class DbContext(AsyncSession):
@@ -39,19 +80,17 @@ class DbContext(AsyncSession):
         about committing changes to DB and exception handling.
     """
 
-    def __init__(self, *args, suppress_exc: bool = False, **kwargs) -> None:
-        self.engine: AsyncEngine = create_async_engine(
-            url=config.POSTGRES_ASYNC_URL
-        )
+    def __init__(
+        self,
+        *args,
+        suppress_exc: bool = False,
+        read_only: bool = False,
+        **kwargs,
+    ) -> None:
         self.suppress_exc = suppress_exc
-        super(DbContext, self).__init__(
-            *args,
-            autocommit=False,
-            bind=self.engine,
-            autoflush=False,
-            # expire_on_commit=False,
-            **kwargs,
-        )
+        # Nothing to commit, the session only reads
+        self.read_only = read_only
+        super(DbContext, self).__init__(*args, **kwargs)
 
     async def __aenter__(self) -> AsyncSession:
         """Async context manager.
@@ -63,6 +102,8 @@ class DbContext(AsyncSession):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if any((exc_type, exc_val, exc_tb)):
             if exc_type == HTTPException:
+                # Give the pooled connection back before suppressing
+                await self.session.close()
                 raise exc_val  # Suppressing rest of session due to HTTP exc
             logger.opt(lazy=True).exception(exc_val)
             logger.debug("Rolling back session")
@@ -82,19 +123,167 @@ class DbContext(AsyncSession):
                 return self.suppress_exc  # gracefully suppressing if True
             raise Exception(self.json)
             # raise CustomDatabaseException
+        if self.read_only:
+            await self.session.close()
+            return
         try:
             await self.session.commit()
         except Exception:
             raise Exception
-        await self.session.close()
+        finally:
+            await self.session.close()
+
+
+# No commit ever expires what a read session loaded
+READ_SESSION_KWARGS = dict(read_only=True, expire_on_commit=False)
+
+
+def read_only_bind(bind: AsyncEngine) -> AsyncEngine:
+    """
+    Same pool, in autocommit: statements run without BEGIN/COMMIT,
+    so a read costs one round-trip and holds no transaction open
+    between its statements. Only for sessions that never write.
+    """
+    return bind.execution_options(isolation_level="AUTOCOMMIT")
+
+
+def init_engine() -> AsyncEngine:
+    """
+    Create the worker wide async engine and session factory.
+    Pool settings come from the config module.
+    Calling it again while the engine is alive is a no-op.
+    :return: Shared async engine.
+    """
+    global engine, session_factory, read_engine, replicas
+    if engine is not None:
+        return engine
+    plan = pool_plan.worker_plan()
+    engine_kwargs = dict(
+        pool_size=plan.pool_size,
+        max_overflow=plan.max_overflow,
+        pool_recycle=config.POSTGRES_POOL_RECYCLE,
+        pool_timeout=config.POSTGRES_POOL_TIMEOUT,
+        pool_pre_ping=config.POSTGRES_POOL_PRE_PING,
+    )
+    session_kwargs = dict(
+        class_=DbContext,
+        autoflush=False,
+        # expire_on_commit=False,
+    )
+    engine = create_async_engine(
+        url=config.POSTGRES_ASYNC_URL, **engine_kwargs
+    )
+    instrumentation.instrument(engine.sync_engine)
+    session_factory = async_sessionmaker(bind=engine, **session_kwargs)
+    read_engine = read_only_bind(engine)
+    if config.POSTGRES_REPLICA_URLS:
+        replicas = routing.ReplicaSet(
+            config.POSTGRES_REPLICA_URLS,
+            config.POSTGRES_REPLICA_STRATEGY,
+            dict(session_kwargs, **READ_SESSION_KWARGS),
+            bind=read_only_bind,
+            **engine_kwargs,
+        )
+        for replica in replicas.engines:
+            instrumentation.instrument(replica.sync_engine)
+    logger.info(
+        f"Async engine created, pool_size={plan.pool_size}"
+        f" max_overflow={plan.max_overflow}"
+    )
+    return engine
+
+
+async def dispose_engine() -> None:
+    """Close every pooled connection and drop the shared engine."""
+    global engine, session_factory, read_engine, replicas
+    if engine is None:
+        return
+    await engine.dispose()
+    if replicas is not None:
+        await replicas.dispose()
+    engine = None
+    session_factory = None
+    read_engine = None
+    replicas = None
+    logger.info("Async engine disposed")
+
+
+def get_engine() -> AsyncEngine:
+    """Shared engine, lazily created like in get_session_factory."""
+    if engine is None:
+        return init_engine()
+    return engine
 
-    async def close(self):
-        await self.engine.dispose()
+
+def get_session_factory() -> async_sessionmaker:
+    """
+    Shared session factory, lazily creating the engine
+    when used outside the app lifespan (scripts, tests).
+    Engine creation does not open any connection.
+    """
+    if session_factory is None:
+        init_engine()
+    return session_factory
 
 
 async def get_session():
-    async with DbContext() as db:
+    async with get_session_factory()() as db:
+        yield db
+
+
+def wrote_recently(request: Request) -> bool:
+    """
+    The client wrote within POSTGRES_READ_YOUR_WRITES_SECONDS
+    (routing.last_write_age): its reads must come from the primary,
+    neither from a replica nor from a per-worker cache.
+    Always False without replicas, writes are not marked then
+    (ReadYourWritesMiddleware) and a client sent marker must not
+    switch the cache off.
+    """
+    if not config.POSTGRES_REPLICA_URLS:
+        return False
+    age = routing.last_write_age(request.cookies, request.headers)
+    return age is not None and age < config.POSTGRES_READ_YOUR_WRITES_SECONDS
+
+
+def reads_from_replica(request: Request) -> int | None:
+    """
+    Replica serving the reads of this request, None for the primary:
+    no replica configured or the client wrote within
+    POSTGRES_READ_YOUR_WRITES_SECONDS.
+    """
+    # Same lazy creation as get_session, replicas come with the engine
+    get_session_factory()
+    if replicas is None:
+        return None
+    if wrote_recently(request):
+        return None
+    return replicas.pick()
+
+
+def get_read_engine(request: Request) -> AsyncEngine:
+    """Engine for the reads of a request, see reads_from_replica."""
+    replica = reads_from_replica(request)
+    if replica is None:
+        return get_engine()
+    return replicas.engines[replica]
+
+
+async def get_read_session(request: Request):
+    """Session for read-only endpoints, possibly on a replica."""
+    replica = reads_from_replica(request)
+    if replica is None:
+        session = get_session_factory()(
+            bind=read_engine, **READ_SESSION_KWARGS
+        )
+    else:
+        session = replicas.session_factories[replica]()
+    async with session as db:
         yield db
 
 
 DBSessionDep = Annotated[AsyncSession, Depends(get_session)]
+# Read-only endpoints: never write through it, it may be a replica and
+# it runs in autocommit without a final commit (read_only_bind).
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_session)]
+WroteRecentlyDep = Annotated[bool, Depends(wrote_recently)]
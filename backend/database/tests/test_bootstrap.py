@@ -0,0 +1,38 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, inspect, select
+
+from backend.database.postgres import session as db_session
+
+
+def test_init_db_concurrent_runs(postgres_engine):
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        for future in [pool.submit(db_session.init_db) for _ in range(3)]:
+            future.result(timeout=60)
+
+    inspector = inspect(postgres_engine)
+    assert "person" in inspector.get_table_names()
+    assert "ix_person_lastname_name_pattern" in {
+        index["name"] for index in inspector.get_indexes("person")
+    }
+
+
+def test_init_db_waits_for_advisory_lock(postgres_engine):
+    finished = threading.Event()
+
+    def bootstrap() -> None:
+        db_session.init_db()
+        finished.set()
+
+    with postgres_engine.connect() as conn:
+        conn.execute(select(func.pg_advisory_lock(db_session.SCHEMA_LOCK_ID)))
+        thread = threading.Thread(target=bootstrap)
+        thread.start()
+        # Another bootstrap holds the lock, DDL must wait for it
+        assert not finished.wait(timeout=1)
+        conn.execute(
+            select(func.pg_advisory_unlock(db_session.SCHEMA_LOCK_ID))
+        )
+    thread.join(timeout=30)
+    assert finished.is_set()
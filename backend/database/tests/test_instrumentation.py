@@ -0,0 +1,104 @@
+import pytest
+from asgi_correlation_id import correlation_id
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+from backend.database.postgres import instrumentation
+
+
+@pytest.fixture
+def instrumented_engine(postgres_engine):
+    instrumentation.instrument(postgres_engine)
+    # Attaching twice must not count queries twice
+    instrumentation.instrument(postgres_engine)
+    return postgres_engine
+
+
+def test_queries_counted_in_context(instrumented_engine):
+    stats = instrumentation.QueryStats()
+    token = instrumentation.query_stats.set(stats)
+    try:
+        with instrumented_engine.connect() as conn:
+            conn.execute(text("SELECT pg_sleep(0.01)"))
+            conn.execute(text("SELECT 1"))
+    finally:
+        instrumentation.query_stats.reset(token)
+
+    assert stats.count == 2
+    assert stats.seconds >= 0.01
+
+
+def test_failed_query_does_not_leak_start_time(instrumented_engine):
+    with instrumented_engine.connect() as conn:
+        with pytest.raises(ProgrammingError):
+            conn.execute(text("SELECT * FROM no_such_table"))
+        assert not conn.info["query_started"]
+
+
+@pytest.fixture
+def slow_queries(mocker):
+    mocker.patch.object(instrumentation.config, "POSTGRES_SLOW_QUERY_MS", 5)
+    captured = []
+    handler_id = logger.add(
+        lambda message: captured.append(message.record),
+        filter=lambda record: "slow_query" in record["extra"],
+    )
+    yield captured
+    logger.remove(handler_id)
+
+
+def test_redact():
+    assert instrumentation.redact(None) == "NoneType"
+    assert instrumentation.redact(("Jane", 30, None)) == (
+        "str",
+        "int",
+        "NoneType",
+    )
+    assert instrumentation.redact({"name": "Jane", "ids": [1, 2]}) == {
+        "name": "str",
+        "ids": ["int", "int"],
+    }
+
+
+def test_slow_query_logged_redacted(instrumented_engine, slow_queries):
+    token = correlation_id.set("slow-request")
+    try:
+        with instrumented_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(
+                text("SELECT pg_sleep(0.01), :secret"), {"secret": "Jane"}
+            )
+    finally:
+        correlation_id.reset(token)
+
+    assert len(slow_queries) == 1
+    extra = slow_queries[0]["extra"]
+    assert extra["request_id"] == "slow-request"
+    assert extra["duration_ms"] >= 5
+    assert slow_queries[0]["level"].name == "WARNING"
+    assert "pg_sleep" in slow_queries[0]["message"]
+    assert "Jane" not in slow_queries[0]["message"]
+    assert "{'secret': 'str'}" in slow_queries[0]["message"]
+
+
+def test_slow_executemany_logs_one_parameter_set(slow_queries):
+    instrumentation.log_slow_query(
+        "INSERT INTO person (name) VALUES (%(name)s)",
+        [{"name": "Jane"}, {"name": "John"}],
+        True,
+        0.5,
+    )
+
+    message = slow_queries[0]["message"]
+    assert "Jane" not in message and "John" not in message
+    assert "{'sets': 2, 'first': {'name': 'str'}}" in message
+
+
+def test_slow_query_log_disabled(instrumented_engine, slow_queries, mocker):
+    mocker.patch.object(instrumentation.config, "POSTGRES_SLOW_QUERY_MS", 0)
+
+    with instrumented_engine.connect() as conn:
+        conn.execute(text("SELECT pg_sleep(0.01)"))
+
+    assert slow_queries == []
@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+import pytest
+
+from backend.database.postgres import config, pool_plan
+from backend.database.postgres import session as db_session
+
+
+def test_no_budget_keeps_configured_pools():
+    plan = pool_plan.plan_pools(4, 0, pool_size=5, max_overflow=10)
+    assert (plan.pool_size, plan.max_overflow, plan.total) == (5, 10, 60)
+
+
+def test_pools_within_share_are_kept():
+    plan = pool_plan.plan_pools(4, 100, pool_size=5, max_overflow=10)
+    assert (plan.pool_size, plan.max_overflow) == (5, 10)
+
+
+@pytest.mark.parametrize(
+    "workers, budget, pool_size, max_overflow",
+    [
+        # 16 cores: 2 * 16 + 1 workers on a default max_connections server
+        (33, 92, 1, 1),
+        (5, 92, 6, 12),
+        (7, 92, 4, 9),
+        (3, 3, 1, 0),
+    ],
+)
+def test_pools_scaled_into_budget(workers, budget, pool_size, max_overflow):
+    plan = pool_plan.plan_pools(
+        workers, budget, pool_size=50, max_overflow=100
+    )
+
+    assert (plan.pool_size, plan.max_overflow) == (pool_size, max_overflow)
+    assert plan.total <= budget
+
+
+def test_budget_smaller_than_workers():
+    with pytest.raises(pool_plan.PoolBudgetError):
+        pool_plan.plan_pools(9, 8, pool_size=5, max_overflow=10)
+
+
+def test_plan_deployment_defaults_to_server_capacity(monkeypatch):
+    monkeypatch.setattr(config, "POSTGRES_CONNECTION_BUDGET", 0)
+    monkeypatch.setattr(config, "POSTGRES_RESERVED_CONNECTIONS", 5)
+
+    plan = pool_plan.plan_deployment(33, capacity=97)
+
+    assert plan.budget == 92
+    assert plan.total <= 92
+
+
+def test_plan_deployment_refuses_overcommit(monkeypatch):
+    monkeypatch.setattr(config, "POSTGRES_CONNECTION_BUDGET", 500)
+
+    with pytest.raises(pool_plan.PoolBudgetError, match="exceeds"):
+        pool_plan.plan_deployment(4, capacity=100)
+
+
+def test_server_capacity():
+    capacity = pool_plan.server_capacity(config.POSTGRES_SYNC_URL)
+    assert 0 < capacity < 1_000_000
+
+
+@pytest.fixture
+def restore_config(monkeypatch):
+    for name in (
+        "POSTGRES_POOL_WORKERS",
+        "POSTGRES_CONNECTION_BUDGET",
+        "POSTGRES_POOL_SIZE",
+        "POSTGRES_MAX_OVERFLOW",
+    ):
+        monkeypatch.setattr(config, name, getattr(config, name))
+
+
+@pytest.mark.asyncio
+async def test_engine_uses_applied_plan(restore_config):
+    pool_plan.apply(pool_plan.plan_pools(10, 40, 5, 10))
+    await db_session.dispose_engine()
+    try:
+        engine = db_session.init_engine()
+        assert engine.pool.size() == 1
+        assert engine.pool._max_overflow == 3
+    finally:
+        await db_session.dispose_engine()
+
+
+def test_gunicorn_master_applies_plan(restore_config, monkeypatch, tmp_path):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    from backend.api import gunicorn_conf
+
+    monkeypatch.setattr(config, "POSTGRES_CONNECTION_BUDGET", 30)
+    gunicorn_conf.on_starting(SimpleNamespace(cfg=SimpleNamespace(workers=3)))
+
+    assert config.POSTGRES_POOL_WORKERS == 3
+    assert config.POSTGRES_POOL_SIZE + config.POSTGRES_MAX_OVERFLOW == 10
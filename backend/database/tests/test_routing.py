@@ -0,0 +1,130 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+
+from backend.database.postgres import config, routing
+from backend.database.postgres import session as db_session
+
+
+def request(cookies=None, headers=None) -> SimpleNamespace:
+    return SimpleNamespace(cookies=cookies or {}, headers=headers or {})
+
+
+@pytest.fixture
+async def with_replicas(monkeypatch):
+    # Both "replicas" point at the primary, enough to exercise routing
+    monkeypatch.setattr(
+        config, "POSTGRES_REPLICA_URLS", [config.POSTGRES_ASYNC_URL] * 2
+    )
+    monkeypatch.setattr(
+        config, "POSTGRES_REPLICA_STRATEGY", routing.ROUND_ROBIN
+    )
+    monkeypatch.setattr(config, "POSTGRES_READ_YOUR_WRITES_SECONDS", 5.0)
+    await db_session.dispose_engine()
+    db_session.init_engine()
+    yield db_session.replicas
+    await db_session.dispose_engine()
+
+
+@pytest.mark.asyncio
+async def test_round_robin():
+    replicas = routing.ReplicaSet(
+        ["postgresql+asyncpg://r/db"] * 3, "round_robin", {}
+    )
+    assert [replicas.pick() for _ in range(6)] == [0, 1, 2, 0, 1, 2]
+    await replicas.dispose()
+
+
+@pytest.mark.asyncio
+async def test_least_connections(monkeypatch):
+    replicas = routing.ReplicaSet(
+        ["postgresql+asyncpg://r/db"] * 3, "least_connections", {}
+    )
+    busy = {0: 4, 1: 1, 2: 1}
+    for index, engine in enumerate(replicas.engines):
+        monkeypatch.setattr(
+            engine.pool, "checkedout", lambda index=index: busy[index]
+        )
+    # Ties are broken by the round-robin position
+    assert [replicas.pick() for _ in range(4)] == [1, 1, 2, 1]
+    busy[1] = 9
+    assert replicas.pick() == 2
+    await replicas.dispose()
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        routing.ReplicaSet([], "random", {})
+
+
+def test_last_write_age():
+    header = {routing.LAST_WRITE_HEADER: "100.5"}
+    cookie = {routing.LAST_WRITE_COOKIE: "90"}
+    assert routing.last_write_age({}, {}, now=110) is None
+    assert routing.last_write_age(cookie, {}, now=110) == 20
+    # The header wins over a stale cookie
+    assert routing.last_write_age(cookie, header, now=110) == 9.5
+    assert routing.last_write_age({routing.LAST_WRITE_COOKIE: "x"}, {}) is None
+
+
+def test_last_write_age_in_the_future():
+    def age(written_at):
+        headers = {routing.LAST_WRITE_HEADER: str(written_at)}
+        return routing.last_write_age({}, headers, now=100)
+
+    # Within the clock skew of another worker: a write just now
+    assert age(100.5) == 0
+    # Beyond it the client made the marker up
+    assert age(102) is None
+    assert age(9999999999) is None
+
+
+@pytest.mark.asyncio
+async def test_primary_without_replicas():
+    await db_session.dispose_engine()
+    try:
+        assert db_session.reads_from_replica(request()) is None
+        assert db_session.get_read_engine(request()) is db_session.engine
+    finally:
+        await db_session.dispose_engine()
+
+
+@pytest.mark.asyncio
+async def test_recent_writer_reads_primary(with_replicas):
+    recent = request(cookies={routing.LAST_WRITE_COOKIE: str(time.time())})
+    stale = request(headers={routing.LAST_WRITE_HEADER: "1"})
+
+    assert db_session.get_read_engine(recent) is db_session.engine
+    assert db_session.get_read_engine(stale) in with_replicas.engines
+    assert db_session.reads_from_replica(request()) is not None
+
+
+@pytest.mark.asyncio
+async def test_read_session_on_replica(with_replicas):
+    async for session in db_session.get_read_session(request()):
+        # Autocommit view of a replica engine, sharing its pool
+        pools = [engine.pool for engine in with_replicas.engines]
+        assert session.bind.pool in pools
+        assert session.read_only
+        assert (await session.execute(text("SELECT 1"))).scalar() == 1
+
+
+def test_marker_ignored_without_replicas(monkeypatch):
+    monkeypatch.setattr(config, "POSTGRES_REPLICA_URLS", [])
+    recent = request(headers={routing.LAST_WRITE_HEADER: str(time.time())})
+
+    assert not db_session.wrote_recently(recent)
+
+
+def test_future_marker_is_not_a_recent_write(monkeypatch):
+    monkeypatch.setattr(config, "POSTGRES_REPLICA_URLS", ["replica"])
+    now = time.time()
+
+    assert db_session.wrote_recently(
+        request(headers={routing.LAST_WRITE_HEADER: str(now)})
+    )
+    assert not db_session.wrote_recently(
+        request(headers={routing.LAST_WRITE_HEADER: str(now + 3600)})
+    )
@@ -0,0 +1,108 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+
+from backend.database.postgres import session as db_session
+from backend.database.postgres.person_models import Person
+
+
+@pytest.fixture
+async def fresh_engine():
+    await db_session.dispose_engine()
+    yield
+    await db_session.dispose_engine()
+
+
+@pytest.mark.asyncio
+async def test_init_engine_is_shared(fresh_engine):
+    engine = db_session.init_engine()
+    assert db_session.init_engine() is engine
+    assert db_session.get_session_factory() is db_session.session_factory
+    assert engine.pool.size() == db_session.config.POSTGRES_POOL_SIZE
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_engine(fresh_engine):
+    factory = db_session.get_session_factory()
+    first, second = factory(), factory()
+    assert isinstance(first, db_session.DbContext)
+    assert first.bind is second.bind is db_session.engine
+
+
+@pytest.mark.asyncio
+async def test_dispose_engine_resets_state(fresh_engine):
+    db_session.init_engine()
+    await db_session.dispose_engine()
+    assert db_session.engine is None
+    assert db_session.session_factory is None
+
+
+@pytest.fixture
+async def statements(fresh_engine, monkeypatch):
+    """
+    Round-trips of the shared engine's connections: BEGIN, COMMIT...
+    as logged by asyncpg, then "SELECT" for every statement run.
+    """
+    sent = []
+    # Its ping is a transaction of its own on every checkout
+    monkeypatch.setattr(db_session.config, "POSTGRES_POOL_PRE_PING", False)
+    engine = db_session.init_engine()
+
+    def log_queries(dbapi_connection, connection_record):
+        dbapi_connection.driver_connection.add_query_logger(
+            lambda record: sent.append(" ".join(record.query.split()).upper())
+        )
+
+    def log_statement(conn, cursor, statement, *args):
+        # Prepared statements bypass asyncpg's query loggers
+        sent.append(statement.split()[0].upper())
+
+    event.listen(engine.sync_engine, "connect", log_queries)
+    event.listen(engine.sync_engine, "before_cursor_execute", log_statement)
+    # Connection setup queries are not part of any request
+    async with engine.connect():
+        pass
+    sent.clear()
+    return sent
+
+
+async def get_person(sessions) -> None:
+    async for session in sessions:
+        await session.get(Person, 1)
+    # asyncpg calls its query loggers with loop.call_soon
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_session_commits(statements):
+    await get_person(db_session.get_session())
+
+    assert sorted(statements) == ["BEGIN;", "COMMIT;", "SELECT"]
+
+
+@pytest.mark.asyncio
+async def test_read_session_skips_transaction(statements):
+    request = SimpleNamespace(cookies={}, headers={})
+
+    await get_person(db_session.get_read_session(request))
+
+    # No BEGIN, COMMIT or ROLLBACK round-trip around the SELECT
+    assert statements == ["SELECT"]
+
+
+@pytest.mark.asyncio
+async def test_read_session_leaves_pool_transactional(statements):
+    request = SimpleNamespace(cookies={}, headers={})
+    await get_person(db_session.get_read_session(request))
+    statements.clear()
+
+    await get_person(db_session.get_session())
+
+    # Isolation level reset to the default when given back to the pool
+    assert sorted(statements) == [
+        "BEGIN ISOLATION LEVEL READ COMMITTED;",
+        "COMMIT;",
+        "SELECT",
+    ]
@@ -0,0 +1,68 @@
+import os
+
+from loguru import logger
+
+"""
+This module configures logging sinks,
+using environment variables if available,
+or defaults to predefined values for local development.
+"""
+
+
+def _flag(name: str, default: str) -> bool:
+    return (os.getenv(name) or default).lower() in ("1", "true", "yes")
+
+
+def parse_sample_rates(value: str) -> dict[str, float]:
+    """
+    Parse "DEBUG=0.1,INFO=0.5" into {"DEBUG": 0.1, "INFO": 0.5}.
+
+    :raises ValueError: On malformed pairs or rates outside [0, 1].
+    """
+    rates = {}
+    for pair in filter(None, (part.strip() for part in value.split(","))):
+        level, _, rate = pair.partition("=")
+        if not 0 <= float(rate) <= 1:
+            raise ValueError(f"Sample rate out of [0, 1]: {pair}")
+        rates[level.strip().upper()] = float(rate)
+    return rates
+
+
+LOG_LEVEL: str = (os.getenv("LOG_LEVEL") or "DEBUG").upper()
+
+# Per sink level, diagnose (variable values in tracebacks) and backtrace.
+LOG_STDERR_LEVEL: str = (os.getenv("LOG_STDERR_LEVEL") or LOG_LEVEL).upper()
+LOG_STDERR_DIAGNOSE: bool = _flag("LOG_STDERR_DIAGNOSE", "true")
+LOG_STDERR_BACKTRACE: bool = _flag("LOG_STDERR_BACKTRACE", "false")
+LOG_FILE_LEVEL: str = (os.getenv("LOG_FILE_LEVEL") or LOG_LEVEL).upper()
+LOG_FILE_DIAGNOSE: bool = _flag("LOG_FILE_DIAGNOSE", "true")
+LOG_FILE_BACKTRACE: bool = _flag("LOG_FILE_BACKTRACE", "false")
+LOG_FILE_PATH: str = os.getenv("LOG_FILE_PATH") or "logs/loguru.log"
+# File sink writes in blocks of this many bytes, 1 means line by line.
+# Buffered records reach the file when the block fills, on rotation
+# and at exit.
+LOG_FILE_BUFFER_BYTES: int = int(
+    os.getenv("LOG_FILE_BUFFER_BYTES") or 64 * 1024
+)
+# Slow SQL statements (POSTGRES_SLOW_QUERY_MS) are also written here.
+LOG_SLOW_QUERY_PATH: str = (
+    os.getenv("LOG_SLOW_QUERY_PATH") or "logs/slow_queries.log"
+)
+
+# Share of requests whose records of a level are kept, e.g.
+# "DEBUG=0.01,INFO=0.1". Chosen by correlation id, so a sampled request
+# keeps all its records in every worker. Levels not listed are kept.
+LOG_SAMPLE_RATES: dict[str, float] = parse_sample_rates(
+    os.getenv("LOG_SAMPLE_RATES") or ""
+)
+
+logger.info(f"{LOG_STDERR_LEVEL=}")
+logger.info(f"{LOG_STDERR_DIAGNOSE=}")
+logger.info(f"{LOG_STDERR_BACKTRACE=}")
+logger.info(f"{LOG_FILE_LEVEL=}")
+logger.info(f"{LOG_FILE_DIAGNOSE=}")
+logger.info(f"{LOG_FILE_BACKTRACE=}")
+logger.info(f"{LOG_FILE_PATH=}")
+logger.info(f"{LOG_FILE_BUFFER_BYTES=}")
+logger.info(f"{LOG_SLOW_QUERY_PATH=}")
+logger.info(f"{LOG_SAMPLE_RATES=}")
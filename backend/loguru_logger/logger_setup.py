@@ -1,21 +1,66 @@
+import functools
 import sys
+import typing
+import zlib
 
 from asgi_correlation_id import correlation_id
 from loguru import logger
 
-from backend.loguru_logger import log_config
+from backend.loguru_logger import config, log_config
 
-# log_level: str = "INFO"
-log_level: str = "DEBUG"
 
+@functools.lru_cache(maxsize=4096)
+def sample_point(request_id: str) -> float:
+    """Stable point in [0, 1) of a correlation id, same in every worker."""
+    return zlib.crc32(request_id.encode()) / 2**32
 
-def correlation_id_filter(record):
-    record["correlation_id"] = correlation_id.get()
-    return record["correlation_id"] or "No correlation_id"
 
+def correlation_id_filter(
+    sample_rates: dict[str, float],
+) -> typing.Callable[[dict], bool]:
+    """
+    Adds correlation_id to records and drops records of the levels in
+    sample_rates for requests outside the sampled share.
+    Records logged outside of a request are always kept.
+    """
 
-def logger_setup():
+    def log_filter(record: dict) -> bool:
+        request_id = correlation_id.get()
+        record["correlation_id"] = request_id
+        rate = sample_rates.get(record["level"].name)
+        if rate is None or request_id is None:
+            return True
+        return sample_point(request_id) < rate
+
+    return log_filter
+
+
+def add_level(name: str, no: int, color: str) -> None:
+    """Registers a custom level once, logger_setup may run again."""
+    try:
+        logger.level(name)
+    except ValueError:
+        logger.level(name, no=no, color=color)
+
+
+def logger_setup(
+    stderr_level: str = config.LOG_STDERR_LEVEL,
+    stderr_diagnose: bool = config.LOG_STDERR_DIAGNOSE,
+    stderr_backtrace: bool = config.LOG_STDERR_BACKTRACE,
+    file_level: str = config.LOG_FILE_LEVEL,
+    file_diagnose: bool = config.LOG_FILE_DIAGNOSE,
+    file_backtrace: bool = config.LOG_FILE_BACKTRACE,
+    file_path: str = config.LOG_FILE_PATH,
+    file_buffer_bytes: int = config.LOG_FILE_BUFFER_BYTES,
+    slow_query_path: str = config.LOG_SLOW_QUERY_PATH,
+    sample_rates: dict[str, float] = config.LOG_SAMPLE_RATES,
+):
     logger.remove()
+    # Custom levels first, sinks may be configured with them
+    add_level(log_config.request_validation_exception, 11, "<black>")
+    add_level(log_config.http_exception, 31, "<yellow>")
+    add_level(log_config.handled_internal_exception, 41, "<red>")
+    add_level(log_config.unexpected_exception, 51, "<red><bold><underline>")
     fmt = (
         "<level>{level: <8}</level>"
         " | <black>{correlation_id}</black>"
@@ -23,33 +68,40 @@ def logger_setup():
         " | <cyan>{name}</cyan>:<cyan>{function}</cyan>"
         ":<cyan>{line}</cyan> - <level>{message}</level>"
     )
+    log_filter = correlation_id_filter(sample_rates)
     logger.add(
         sys.stderr,
         format=fmt,
-        level=log_level,
-        filter=correlation_id_filter,
+        level=stderr_level,
+        filter=log_filter,
         enqueue=True,
-        diagnose=True,
-        backtrace=False,
+        diagnose=stderr_diagnose,
+        backtrace=stderr_backtrace,
     )
     logger.add(
-        "logs/loguru.log",
+        file_path,
         rotation="1 hour",
         retention="1 day",
         format=fmt,
-        level=log_level,
-        filter=correlation_id_filter,
+        level=file_level,
+        filter=log_filter,
         enqueue=True,
-        backtrace=False,
-        diagnose=True,
-    )
-    logger.level(
-        log_config.request_validation_exception, no=11, color="<black>"
+        backtrace=file_backtrace,
+        diagnose=file_diagnose,
+        buffering=file_buffer_bytes,
     )
-    logger.level(log_config.http_exception, no=31, color="<yellow>")
-    logger.level(log_config.handled_internal_exception, no=41, color="<red>")
-    logger.level(
-        log_config.unexpected_exception, no=51, color="<red><bold><underline>"
+    logger.add(
+        slow_query_path,
+        rotation="1 day",
+        retention="7 days",
+        format=fmt,
+        level="WARNING",
+        filter=lambda record: (
+            "slow_query" in record["extra"] and log_filter(record)
+        ),
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
 
 
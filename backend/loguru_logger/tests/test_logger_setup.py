@@ -0,0 +1,89 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from asgi_correlation_id import correlation_id
+from loguru import logger
+
+from backend.loguru_logger import config, log_config
+from backend.loguru_logger.logger_setup import (
+    correlation_id_filter,
+    logger_setup,
+)
+
+
+def record(level: str) -> dict:
+    return {"level": SimpleNamespace(name=level)}
+
+
+def kept(log_filter, request_id: str | None, level: str) -> bool:
+    token = correlation_id.set(request_id)
+    try:
+        return log_filter(record(level))
+    finally:
+        correlation_id.reset(token)
+
+
+def test_parse_sample_rates():
+    assert config.parse_sample_rates("") == {}
+    assert config.parse_sample_rates(" debug=0.1, INFO=1 ,") == {
+        "DEBUG": 0.1,
+        "INFO": 1.0,
+    }
+
+
+@pytest.mark.parametrize("value", ["DEBUG", "DEBUG=x", "INFO=1.5"])
+def test_parse_sample_rates_invalid(value):
+    with pytest.raises(ValueError):
+        config.parse_sample_rates(value)
+
+
+def test_filter_sets_correlation_id():
+    log_filter = correlation_id_filter({})
+    token = correlation_id.set("abc")
+    try:
+        entry = record("DEBUG")
+        assert log_filter(entry)
+        assert entry["correlation_id"] == "abc"
+    finally:
+        correlation_id.reset(token)
+
+
+def test_filter_samples_whole_requests():
+    log_filter = correlation_id_filter({"DEBUG": 0.25, "INFO": 0.5})
+    request_ids = [uuid.uuid4().hex for _ in range(4000)]
+
+    debug = [kept(log_filter, rid, "DEBUG") for rid in request_ids]
+    info = [kept(log_filter, rid, "INFO") for rid in request_ids]
+
+    # Same decision for every record of a request
+    assert debug == [kept(log_filter, rid, "DEBUG") for rid in request_ids]
+    # Kept DEBUG requests are a subset of kept INFO requests
+    assert all(i for d, i in zip(debug, info) if d)
+    assert 0.2 < sum(debug) / len(request_ids) < 0.3
+    assert 0.45 < sum(info) / len(request_ids) < 0.55
+
+
+def test_filter_keeps_unsampled_levels_and_records_outside_requests():
+    log_filter = correlation_id_filter({"DEBUG": 0.0})
+
+    assert not kept(log_filter, "abc", "DEBUG")
+    assert kept(log_filter, None, "DEBUG")
+    assert kept(log_filter, "abc", "WARNING")
+    assert kept(log_filter, "abc", log_config.http_exception)
+
+
+def test_logger_setup_buffered_file(tmp_path):
+    file_path = tmp_path / "loguru.log"
+    try:
+        # Custom levels are registered once, setup can run again
+        logger_setup(file_path=str(file_path), file_buffer_bytes=1 << 20)
+        logger_setup(file_path=str(file_path), file_buffer_bytes=1 << 20)
+        logger.log(log_config.http_exception, "buffered record")
+        logger.complete()
+        assert "buffered record" not in file_path.read_text()
+        # Stopping the sink flushes the block
+        logger.remove()
+        assert "buffered record" in file_path.read_text()
+    finally:
+        logger_setup()
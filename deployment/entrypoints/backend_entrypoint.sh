@@ -14,12 +14,19 @@ fi
 # Set log level based on environment (default to 'info' for production, 'debug' for development)
 LOG_LEVEL="${LOG_LEVEL:-info}"
 
+# Create database schema once, workers start without DDL
+python -m backend.database.postgres.bootstrap
+
 # Start Gunicorn with Uvicorn workers
 # Notes:
 # - Uses uvicorn.workers.UvicornWorker for async FastAPI compatibility
 # - Binds to 0.0.0.0 to accept external connections
 # - Alternative worker classes (e.g., gevent) can be used by setting --worker-class
+# - gunicorn_conf.py sets up the shared Prometheus metrics directory and
+#   sizes the DB pools of all workers to fit POSTGRES_CONNECTION_BUDGET
+#   (default: the server max_connections), refusing to start otherwise
 exec gunicorn app:app \
+    --config gunicorn_conf.py \
     --workers "$GUNICORN_WORKERS" \
     --worker-class uvicorn.workers.UvicornWorker \
     --bind 0.0.0.0:"$APP_PORT"
\ No newline at end of file